@@ -3,8 +3,28 @@
 # Author: Alexander Marcozzi
 # Date: 06/12/2021
 
-import sys, pygame
+import sys, argparse, atexit, pygame
 from game.state_engine import StateEngine
+from game.frame_pacer import FramePacer
+from game.profiler import Profiler
+
+parser = argparse.ArgumentParser(description = "Super Square Boy 2")
+parser.add_argument("--fps", default = "120",
+    help = "the frame rate to run at, or \"display\" to match the display")
+parser.add_argument("--profile", metavar = "TRACE",
+    help = "time each phase of every frame, and write a Chrome trace of the "
+           "session to this file on exit")
+parser.add_argument("--record", metavar = "DIR",
+    help = "save the inputs of every attempt to this directory")
+args = parser.parse_args()
+
+if args.profile:
+    def saveProfile():
+        Profiler.exportTrace(args.profile)
+        print(Profiler.report())
+    atexit.register(saveProfile)
+    Profiler.enable()
+
 pygame.init()
 pygame.mixer.init()
 
@@ -14,18 +34,43 @@ pygame.display.set_mode((infoObject.current_w, infoObject.current_h))
 size = width, height = infoObject.current_w, infoObject.current_h
 
 flags = pygame.SCALED|pygame.DOUBLEBUF|pygame.HWSURFACE|pygame.FULLSCREEN
-screen = pygame.display.set_mode(size, flags)
-
-clock = pygame.time.Clock()
-state_engine = StateEngine(width, height, clock.tick_busy_loop(120))
+if args.fps == "display":
+    # with vsync, flips wait for the display, so its rate can be measured
+    try:
+        screen = pygame.display.set_mode(size, flags, vsync = 1)
+    except pygame.error:
+        screen = pygame.display.set_mode(size, flags)
+    pacer = FramePacer(FramePacer.displayRefreshRate(120))
+else:
+    screen = pygame.display.set_mode(size, flags)
+    pacer = FramePacer(float(args.fps))
+# the game is simulated in fixed steps (in milliseconds), independent of the
+# frame rate, and drawn blended between the last two steps
+simulation_step = 8
+state_engine = StateEngine(width, height, simulation_step)
+state_engine.engine.record_dir = args.record
 while 1:
-    events = pygame.event.get()
+    # menus only change on input, so sleep until there is some
+    if state_engine.isIdle():
+        events = [pygame.event.wait()] + pygame.event.get()
+        pacer.restart()
+    else:
+        with Profiler.phase("events"):
+            events = pygame.event.get()
     for event in events:
-        if event.type == pygame.QUIT: sys.exit()
+        if event.type == pygame.QUIT:
+            state_engine.preloader.shutdown()
+            sys.exit()
 
-    clock.tick_busy_loop(120)
-    state_engine.update(events)
+    frame_time = None
+    if not state_engine.isIdle():
+        frame_time = pacer.tick()
+    with Profiler.phase("update"):
+        state_engine.update(events, frame_time)
 
-    screen.fill((0, 0, 0))
-    state_engine.draw(screen)
-    pygame.display.flip()
\ No newline at end of file
+    if state_engine.needsRedraw():
+        with Profiler.phase("draw"):
+            screen.fill((0, 0, 0))
+            state_engine.draw(screen)
+        with Profiler.phase("flip"):
+            pygame.display.flip()
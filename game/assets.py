@@ -0,0 +1,213 @@
+# Title: assets.py
+# Description: Contains the Assets class for Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+
+import io
+import os
+import threading
+from collections import OrderedDict
+import pygame
+import pygame.freetype
+
+class Assets:
+    """
+    A class that keeps the game's loaded assets, shared by the whole process.
+
+    Images, fonts, sounds and the raw bytes of music files are loaded from
+    disk the first time they are asked for and kept, so restarting a level or
+    going back to a menu does not touch the disk again. Images are kept
+    decoded, scaled to the size they were asked for and converted to the
+    display's pixel format. Each kind of asset is kept in its own cache, and
+    the least recently used entries are dropped once a cache is full.
+
+    Every asset (but not level files, see LevelFile) is read from disk
+    through file, which may be called from any thread (e.g. to read files
+    ahead of time in the background). The other methods create pygame objects
+    and should only be called from the main thread.
+
+    ...
+
+    Attributes
+    ----------
+    files : OrderedDict(str, bytes)
+        the raw contents of files, by path, from least to most recently used
+    lock : threading.Lock
+        the lock guarding the raw file contents
+    images : OrderedDict(tuple, pygame image surface)
+        the loaded images, by path and size, from least to most recently used
+    fonts : OrderedDict(tuple, pygame freetype font object)
+        the loaded fonts, by path and size, from least to most recently used
+    sounds : OrderedDict(str, pygame mixer sound object)
+        the loaded sounds, by path, from least to most recently used
+    max_file_bytes : int
+        the maximum total size of the raw file contents kept, in bytes
+    max_images : int
+        the maximum number of images kept
+    max_fonts : int
+        the maximum number of fonts kept
+    max_sounds : int
+        the maximum number of sounds kept
+
+    Methods
+    -------
+    file(path)
+        Returns the raw contents of a file
+    image(path, size)
+        Returns an image, scaled to a size
+    font(path, size)
+        Returns a font
+    sound(path)
+        Returns a sound
+    music(path)
+        Returns a music file, ready to be loaded by pygame's mixer
+    clear()
+        Drops every cached asset
+    """
+
+    files  = OrderedDict()
+    lock   = threading.Lock()
+    images = OrderedDict()
+    fonts  = OrderedDict()
+    sounds = OrderedDict()
+    max_file_bytes = 32 * 1024 * 1024
+    max_images     = 64
+    max_fonts      = 8
+    max_sounds     = 16
+
+    @staticmethod
+    def file(path):
+        """
+        Returns the raw contents of a file.
+
+        Parameters
+        ----------
+        path : str
+            The file path
+        """
+        files = Assets.files
+        with Assets.lock:
+            data = files.get(path)
+            if data is not None:
+                files.move_to_end(path)
+                return data
+
+        # read outside of the lock, so other threads are not held up by the
+        # disk. two threads may read the same file at once, which is harmless
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        with Assets.lock:
+            files[path] = data
+            files.move_to_end(path)
+
+            # keep the newest file even if it is over the limit by itself
+            total = sum(len(contents) for contents in files.values())
+            while total > Assets.max_file_bytes and len(files) > 1:
+                total -= len(files.popitem(last = False)[1])
+        return data
+
+    @staticmethod
+    def image(path, size = None):
+        """
+        Returns an image, scaled to a size.
+
+        The returned surface is shared, so it should not be changed.
+
+        Parameters
+        ----------
+        path : str
+            The file path of the image
+        size : tuple(int)
+            The width and height to scale the image to, in pixels, or None
+            for the image's own size
+        """
+        images = Assets.images
+        key = (path, size)
+        image = images.get(key)
+        if image is not None:
+            images.move_to_end(key)
+            return image
+
+        if size is None:
+            image = pygame.image.load(io.BytesIO(Assets.file(path)), path)
+        else:
+            image = pygame.transform.smoothscale(Assets.image(path), size)
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        images[key] = image
+        if len(images) > Assets.max_images:
+            images.popitem(last = False)
+        return image
+
+    @staticmethod
+    def font(path, size):
+        """
+        Returns a font.
+
+        Parameters
+        ----------
+        path : str
+            The file path of the font
+        size : int
+            The default size of the font's text
+        """
+        fonts = Assets.fonts
+        key = (path, size)
+        font = fonts.get(key)
+        if font is not None:
+            fonts.move_to_end(key)
+            return font
+
+        font = pygame.freetype.Font(io.BytesIO(Assets.file(path)), size)
+        fonts[key] = font
+        if len(fonts) > Assets.max_fonts:
+            fonts.popitem(last = False)
+        return font
+
+    @staticmethod
+    def sound(path):
+        """
+        Returns a sound.
+
+        Parameters
+        ----------
+        path : str
+            The file path of the sound
+        """
+        sounds = Assets.sounds
+        sound = sounds.get(path)
+        if sound is not None:
+            sounds.move_to_end(path)
+            return sound
+
+        sound = pygame.mixer.Sound(file = io.BytesIO(Assets.file(path)))
+        sounds[path] = sound
+        if len(sounds) > Assets.max_sounds:
+            sounds.popitem(last = False)
+        return sound
+
+    @staticmethod
+    def music(path):
+        """
+        Returns a music file, ready to be loaded by pygame's mixer.
+
+        Returns a new in-memory file over the cached contents, along with the
+        file's extension for the mixer to identify its format.
+
+        Parameters
+        ----------
+        path : str
+            The file path of the music
+        """
+        extension = os.path.splitext(path)[1].lstrip('.')
+        return io.BytesIO(Assets.file(path)), extension
+
+    @staticmethod
+    def clear():
+        """
+        Drops every cached asset.
+        """
+        for cache in (Assets.files, Assets.images, Assets.fonts,
+                Assets.sounds):
+            cache.clear()
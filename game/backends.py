@@ -0,0 +1,246 @@
+# Title: backends.py
+# Description: Contains the clock, input and audio backends for Super Square
+#              Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+
+import pygame
+from game.assets import Assets
+
+class SystemClock:
+    """
+    A clock backed by pygame's millisecond timer.
+
+    ...
+
+    Methods
+    -------
+    getTicks()
+        Returns the current time, in milliseconds
+    """
+
+    def getTicks(self):
+        """
+        Returns the current time, in milliseconds.
+        """
+        return pygame.time.get_ticks()
+
+class SimulatedClock:
+    """
+    A clock that only moves when it is told to, for headless simulation.
+
+    ...
+
+    Attributes
+    ----------
+    ticks : float
+        the current time, in milliseconds
+
+    Methods
+    -------
+    getTicks()
+        Returns the current time, in milliseconds
+    advance(dt)
+        Moves the clock forward
+    """
+
+    def __init__(self, ticks = 0):
+        """
+        Parameters
+        ----------
+        ticks : float
+            The starting time, in milliseconds
+        """
+        self.ticks = ticks
+
+    def getTicks(self):
+        """
+        Returns the current time, in milliseconds.
+        """
+        return self.ticks
+
+    def advance(self, dt):
+        """
+        Moves the clock forward.
+
+        Parameters
+        ----------
+        dt : float
+            The amount of time to move forward, in milliseconds
+        """
+        self.ticks += dt
+
+class KeyboardInput:
+    """
+    An input source that reads the keyboard.
+
+    ...
+
+    Methods
+    -------
+    isJumpPressed()
+        Returns whether the jump key is currently held down
+    """
+
+    def isJumpPressed(self):
+        """
+        Returns whether the jump key is currently held down.
+        """
+        keys = pygame.key.get_pressed()
+        return keys[pygame.K_UP] or keys[pygame.K_SPACE]
+
+class ScriptedInput:
+    """
+    An input source that plays back a scripted sequence of key states, for
+    headless simulation.
+
+    ...
+
+    Attributes
+    ----------
+    presses : iterator(bool)
+        the remaining key states, one per read. None if the key state is set
+        directly through jump instead
+    jump : bool
+        the current state of the jump key
+
+    Methods
+    -------
+    isJumpPressed()
+        Returns whether the jump key is currently held down
+    """
+
+    def __init__(self, presses = None):
+        """
+        Parameters
+        ----------
+        presses : iterable(bool)
+            The key states to play back, one per read. Once they run out the
+            key is released
+        """
+        self.presses = iter(presses) if presses is not None else None
+        self.jump    = False
+
+    def isJumpPressed(self):
+        """
+        Returns whether the jump key is currently held down.
+        """
+        if self.presses is not None:
+            self.jump = bool(next(self.presses, False))
+        return self.jump
+
+class MixerAudio:
+    """
+    An audio backend that plays sounds and music through pygame's mixer.
+
+    Sounds and music come from the shared asset cache, so each file is only
+    read from disk once.
+
+    ...
+
+    Attributes
+    ----------
+    death_sound : pygame mixer sound object
+        the sound to be played when the player dies
+
+    Methods
+    -------
+    playDeath()
+        Plays the death sound
+    loadMusic(filepath)
+        Loads a music track
+    playMusic(start)
+        Plays the loaded music track
+    restartMusic()
+        Rewinds and plays the loaded music track
+    stopMusic()
+        Stops the music
+    pauseMusic()
+        Pauses the music
+    unpauseMusic()
+        Resumes paused music
+    """
+
+    def __init__(self):
+        self.death_sound = Assets.sound("assets/sfx/death.mp3")
+
+    def playDeath(self):
+        """
+        Plays the death sound.
+        """
+        pygame.mixer.Sound.play(self.death_sound)
+
+    def loadMusic(self, filepath):
+        """
+        Loads a music track.
+
+        Parameters
+        ----------
+        filepath : str
+            The file path of the music
+        """
+        pygame.mixer.music.load(*Assets.music(filepath))
+
+    def playMusic(self, start = 0.0):
+        """
+        Plays the loaded music track.
+
+        Parameters
+        ----------
+        start : float
+            The position to start playing from, in seconds
+        """
+        pygame.mixer.music.play(start = start)
+
+    def restartMusic(self):
+        """
+        Rewinds and plays the loaded music track.
+        """
+        pygame.mixer.music.rewind()
+        pygame.mixer.music.play()
+
+    def stopMusic(self):
+        """
+        Stops the music.
+        """
+        pygame.mixer.music.stop()
+
+    def pauseMusic(self):
+        """
+        Pauses the music.
+        """
+        pygame.mixer.music.pause()
+
+    def unpauseMusic(self):
+        """
+        Resumes paused music.
+        """
+        pygame.mixer.music.unpause()
+
+class NullAudio:
+    """
+    An audio backend that plays nothing, for headless simulation.
+
+    Has the same methods as MixerAudio.
+    """
+
+    def playDeath(self):
+        pass
+
+    def loadMusic(self, filepath):
+        pass
+
+    def playMusic(self, start = 0.0):
+        pass
+
+    def restartMusic(self):
+        pass
+
+    def stopMusic(self):
+        pass
+
+    def pauseMusic(self):
+        pass
+
+    def unpauseMusic(self):
+        pass
@@ -40,10 +40,16 @@ class Block:
         Returns the position of the bottom side of the block
     isOnTop(block1, block2)
         Decides whether the first block is on top of the second
+    isOnTopRect(block1, left, top, right, bottom, block_type)
+        Decides whether a block is on top of the given rectangle
     isCollision(block1, block2)
         Decides whether the first block has collided with the second
+    isCollisionRect(block1, left, top, right, bottom)
+        Decides whether a block has collided with the given rectangle
     snapOnTop(block1, block2)
         Moves the first block to be on top of the second
+    snapOnTopRect(block1, top)
+        Moves a block to be on top of the given rectangle
     """
 
     def __init__(self, blockrect, speed, color, block_type):
@@ -139,9 +145,6 @@ class Block:
         """
         Decides whether the first block is on top of the second.
 
-        Spikes behave differently than regular blocks in order to prevent
-        unfair deaths.
-
         Parameters
         ----------
         block1 : Block
@@ -149,6 +152,32 @@ class Block:
         block2 : Block
             The second block
         """
+        return Block.isOnTopRect(block1, block2.left(), block2.top(),
+                block2.right(), block2.bottom(), block2.block_type.value)
+
+    @staticmethod
+    def isOnTopRect(block1, left, top, right, bottom, block_type):
+        """
+        Decides whether a block is on top of the given rectangle.
+
+        Spikes behave differently than regular blocks in order to prevent
+        unfair deaths.
+
+        Parameters
+        ----------
+        block1 : Block
+            The block
+        left : int
+            The position of the left side of the rectangle
+        top : int
+            The position of the top side of the rectangle
+        right : int
+            The position of the right side of the rectangle
+        bottom : int
+            The position of the bottom side of the rectangle
+        block_type : int
+            The BlockType value of the rectangle
+        """
         # if the block is rising, it can't be on top of something
         if block1.speed[1] < 0:
             return False
@@ -159,18 +188,18 @@ class Block:
         # block1 is considered ontop of block2. this tolerance is to prevent
         # falling through blocks at higher speeds. if it is a spike, we want
         # to be exact to prevent unfair deaths
-        if ((block2.block_type != BlockType.SPIKE and 
-                (abs(block1.bottom() - block2.top()) 
-                - (block2.bottom() - block2.top())/2) <= tolerance) or
-            (block2.block_type == BlockType.SPIKE and 
-                block1.bottom() - block2.top() >= tolerance and 
-                block1.bottom() - block2.bottom() <= tolerance)):
+        if ((block_type != BlockType.SPIKE.value and 
+                (abs(block1.bottom() - top) 
+                - (bottom - top)/2) <= tolerance) or
+            (block_type == BlockType.SPIKE.value and 
+                block1.bottom() - top >= tolerance and 
+                block1.bottom() - bottom <= tolerance)):
             # the blocks must be vertically alligned in order to be stacked
-            if (block1.right() >= block2.left() and 
-                block1.right() <= block2.right()):
+            if (block1.right() >= left and 
+                block1.right() <= right):
                 return True
-            if (block1.left() >= block2.left() and 
-                block1.left() <= block2.right()):
+            if (block1.left() >= left and 
+                block1.left() <= right):
                 return True
         return False
 
@@ -186,21 +215,42 @@ class Block:
         block2 : Block
             The second block
         """
+        return Block.isCollisionRect(block1, block2.left(), block2.top(),
+                block2.right(), block2.bottom())
+
+    @staticmethod
+    def isCollisionRect(block1, left, top, right, bottom):
+        """
+        Decides whether a block has collided with the given rectangle
+
+        Parameters
+        ----------
+        block1 : Block
+            The block
+        left : int
+            The position of the left side of the rectangle
+        top : int
+            The position of the top side of the rectangle
+        right : int
+            The position of the right side of the rectangle
+        bottom : int
+            The position of the bottom side of the rectangle
+        """
         tolerance = 5  # accounts for resolutions that do not evenly divide into blocks
 
         # if the bottom of the first block hits the bottom half of the
         # second block, it is considered a collision rather than being
         # on top
-        if (((block1.bottom() - block2.top()) 
-            - (block2.bottom() - block2.top()) / 2) >  tolerance and 
-                ((block1.bottom() - block2.top()) 
-                - (block2.bottom() - block2.top()) <= tolerance)):
+        if (((block1.bottom() - top) 
+            - (bottom - top) / 2) >  tolerance and 
+                ((block1.bottom() - top) 
+                - (bottom - top) <= tolerance)):
             # the blocks must be vertically alligned in order to collide
-            if (block1.right() >= block2.left() and 
-                block1.right() <= block2.right()):
+            if (block1.right() >= left and 
+                block1.right() <= right):
                 return True
-            if (block1.left() >= block2.left() and 
-                block1.left() <= block2.right()):
+            if (block1.left() >= left and 
+                block1.left() <= right):
                 return True
         return False
 
@@ -216,5 +266,19 @@ class Block:
         block2 : Block
             The second block
         """
-        distance = block1.bottom() - block2.top()
+        Block.snapOnTopRect(block1, block2.top())
+
+    @staticmethod
+    def snapOnTopRect(block1, top):
+        """
+        Moves a block to be on top of the given rectangle
+
+        Parameters
+        ----------
+        block1 : Block
+            The block
+        top : int
+            The position of the top side of the rectangle
+        """
+        distance = block1.bottom() - top
         block1.blockrect = block1.blockrect.move(0, -distance)
\ No newline at end of file
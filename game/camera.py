@@ -0,0 +1,88 @@
+# Title: camera.py
+# Description: Contains the Camera class for Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+
+class Camera:
+    """
+    A class representing the camera that follows the player through a level.
+
+    Blocks and the player keep their level coordinates at all times. Only the
+    camera moves, and positions are converted to screen coordinates when they
+    are drawn.
+
+    ...
+
+    Attributes
+    ----------
+    speed : list(float)
+        the speed at which the level appears to move across the screen in the
+        X and Y directions (the camera itself moves the opposite way)
+    x : int
+        the position of the left side of the screen in level coordinates, in
+        pixels
+    previous_x : int
+        the position of the camera before the last update
+
+    Methods
+    -------
+    update(dt)
+        Updates the position of the camera
+    interpolate(alpha)
+        Returns the position of the camera part of the way through the last
+        update
+    toScreen(rect, alpha)
+        Returns a copy of a level-space rectangle moved into screen space
+    """
+
+    def __init__(self, speed):
+        """
+        Parameters
+        ----------
+        speed : list(float)
+            The speed at which the level appears to move across the screen in
+            the X and Y directions
+        """
+        self.speed      = speed
+        self.x          = 0
+        self.previous_x = 0
+
+    def update(self, dt):
+        """
+        Updates the position of the camera.
+
+        Like Block.update, the distance moved is truncated to whole pixels so
+        the camera and everything it follows always move in step.
+
+        Parameters
+        ----------
+        dt : int
+            The clock's tick rate
+        """
+        self.previous_x = self.x
+        self.x -= int(self.speed[0] * dt)
+
+    def interpolate(self, alpha):
+        """
+        Returns the position of the camera part of the way through the last
+        update, rounded to a whole pixel.
+
+        Parameters
+        ----------
+        alpha : float
+            How far through the update, from 0 (before it) to 1 (after it)
+        """
+        return int(round(self.previous_x + (self.x - self.previous_x) * alpha))
+
+    def toScreen(self, rect, alpha = 1.0):
+        """
+        Returns a copy of a level-space rectangle moved into screen space.
+
+        Parameters
+        ----------
+        rect : pygame.Rect
+            The rectangle in level coordinates
+        alpha : float
+            How far through the last update the camera should be taken to be
+        """
+        return rect.move(-self.interpolate(alpha), 0)
@@ -0,0 +1,177 @@
+# Title: collision.py
+# Description: Contains the Collision class for Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+
+import numpy as np
+from game.block import Block
+from game.blocktype import BlockType
+
+class Collision:
+    """
+    A class that tests blocks against many level blocks at once.
+
+    These are array versions of Block.isOnTopRect and Block.isCollisionRect,
+    with exactly the same tolerances. The player values may be scalars or
+    arrays shaped to broadcast against the block arrays, so several players
+    can be tested in one call.
+
+    ...
+
+    Methods
+    -------
+    isOnTop(bottom, left, right, rising, x, y, w, h, block_type)
+        Decides which blocks a block is on top of
+    isCollision(bottom, left, right, x, y, w, h)
+        Decides which blocks a block has collided with
+    isAligned(left, right, x, w)
+        Decides which blocks a block is vertically aligned with
+    resolve(player, level, start, end, jump)
+        Runs the player against a range of level blocks and reports what it
+        hit
+    """
+
+    tolerance = 5
+
+    @staticmethod
+    def isOnTop(bottom, left, right, rising, x, y, w, h, block_type):
+        """
+        Decides which blocks a block is on top of.
+
+        Parameters
+        ----------
+        bottom : int or numpy.ndarray
+            The position of the bottom side of the block
+        left : int or numpy.ndarray
+            The position of the left side of the block
+        right : int or numpy.ndarray
+            The position of the right side of the block
+        rising : bool or numpy.ndarray
+            Whether the block is moving upward
+        x, y, w, h : numpy.ndarray
+            The left side, top side, width and height of each level block
+        block_type : numpy.ndarray
+            The BlockType value of each level block
+        """
+        tolerance = Collision.tolerance
+        depth = bottom - y
+
+        # regular blocks have a window of half a block, spikes are exact
+        is_spike = block_type == BlockType.SPIKE.value
+        stacked = np.where(is_spike,
+                (depth >= tolerance) & (bottom - (y + h) <= tolerance),
+                np.abs(depth) - h / 2 <= tolerance)
+
+        return (stacked & ~np.asarray(rising) &
+                Collision.isAligned(left, right, x, w))
+
+    @staticmethod
+    def isCollision(bottom, left, right, x, y, w, h):
+        """
+        Decides which blocks a block has collided with.
+
+        Parameters
+        ----------
+        bottom : int or numpy.ndarray
+            The position of the bottom side of the block
+        left : int or numpy.ndarray
+            The position of the left side of the block
+        right : int or numpy.ndarray
+            The position of the right side of the block
+        x, y, w, h : numpy.ndarray
+            The left side, top side, width and height of each level block
+        """
+        tolerance = Collision.tolerance
+        depth = bottom - y
+        return ((depth - h / 2 > tolerance) & (depth - h <= tolerance) &
+                Collision.isAligned(left, right, x, w))
+
+    @staticmethod
+    def isAligned(left, right, x, w):
+        """
+        Decides which blocks a block is vertically aligned with.
+
+        Parameters
+        ----------
+        left : int or numpy.ndarray
+            The position of the left side of the block
+        right : int or numpy.ndarray
+            The position of the right side of the block
+        x, w : numpy.ndarray
+            The left side and width of each level block
+        """
+        x_right = x + w
+        return (((right >= x) & (right <= x_right)) |
+                ((left >= x) & (left <= x_right)))
+
+    @staticmethod
+    def resolve(player, level, start, end, jump):
+        """
+        Runs the player against a range of level blocks and reports what it
+        hit.
+
+        Blocks are handled in order, as if each were tested one at a time
+        with Block.isOnTopRect and Block.isCollisionRect: landing on a block
+        snaps the player on top of it (and jumps if requested) before the
+        remaining blocks are tested against the player's new position.
+
+        Returns a tuple of four bools: whether the player landed on a block,
+        landed on a spike, collided with a block or spike, and collided with
+        an end block.
+
+        Parameters
+        ----------
+        player : Player
+            The player, in level coordinates
+        level : Level
+            The level
+        start : int
+            The index of the first block to test
+        end : int
+            The index after the last block to test
+        jump : bool
+            Whether the player should jump after landing on a block
+        """
+        x = level.x[start:end]
+        y = level.y[start:end]
+        w = level.w[start:end]
+        h = level.h[start:end]
+        block_type = level.block_type[start:end]
+
+        grounded = on_spike = collided = ended = False
+        while len(x) > 0:
+            on_top = Collision.isOnTop(player.bottom(), player.left(),
+                    player.right(), player.speed[1] < 0, x, y, w, h,
+                    block_type)
+            collision = ~on_top & Collision.isCollision(player.bottom(),
+                    player.left(), player.right(), x, y, w, h)
+
+            # landing on a block moves the player, so everything after the
+            # first landing has to be tested again
+            landed = np.flatnonzero(on_top &
+                    (block_type == BlockType.BLOCK.value))
+            stop = landed[0] if len(landed) > 0 else len(x)
+
+            is_spike = block_type[:stop] == BlockType.SPIKE.value
+            is_end   = block_type[:stop] == BlockType.END.value
+            on_spike = on_spike or bool(np.any(on_top[:stop] & is_spike))
+            collided = collided or bool(np.any(collision[:stop] & ~is_end))
+            ended    = ended or bool(np.any(collision[:stop] & is_end))
+
+            if stop == len(x):
+                break
+
+            grounded = True
+            player.speed[1] = 0
+            player.resetRotation()
+            Block.snapOnTopRect(player, int(y[stop]))
+            if jump:
+                player.jump()
+
+            x = x[stop + 1:]
+            y = y[stop + 1:]
+            w = w[stop + 1:]
+            h = h[stop + 1:]
+            block_type = block_type[stop + 1:]
+
+        return grounded, on_spike, collided, ended
@@ -3,13 +3,25 @@
 # Author: Alexander Marcozzi
 # Date: 06/12/2021
 
+import os
+import struct
+import time
 import pygame
-import pygame.freetype
-import copy
-from game.block  import Block
 from game.player import Player
 from game.frame  import Frame
-from game.blocktype import BlockType
+from game.camera import Camera
+from game.level  import Level
+from game.level_file import LevelFile
+from game.streaming_level import StreamingLevel
+from game.collision import Collision
+from game.tile_cache import TileCache
+from game.text_cache import TextCache
+from game.assets import Assets
+from game.profiler import Profiler
+from game.recording import Recording
+from game.rewind_buffer import RewindBuffer
+from game.backends  import (SystemClock, SimulatedClock, KeyboardInput,
+                            ScriptedInput, MixerAudio, NullAudio)
 
 class Engine:
     """
@@ -18,10 +30,33 @@ class Engine:
 
     All "magic numbers" and formulas were acquired from manual testing.
 
+    The engine reads the time, the keyboard and plays audio through swappable
+    backends (see backends.py). A headless engine uses a simulated clock,
+    scripted input and no audio, needs no display or mixer, and can be
+    stepped as fast as the CPU allows.
+
+    The state of an attempt in progress can be saved with saveState, as a
+    small fixed-size blob that refers to the level by its hash, and restored
+    with restoreState, without touching the level itself.
+
+    State layout (little-endian):
+        header   : magic, format version and SHA-256 of the level file
+        frame    : the frame's position and the camera's position
+        player   : the player's rectangle, speed and angle
+        attempt  : the attempt number, how long ago the player died, reached
+                   the end of the level and was last on the ground (in
+                   milliseconds, or -1), and the fade percentage
+
     ...
 
     Attributes
     ----------
+    state_magic : bytes
+        the bytes every saved state starts with
+    state_version : int
+        the version of the saved state format
+    state_format : struct.Struct
+        the layout of a saved state
     width : int
         the width of the display, in pixels
     height : int
@@ -29,7 +64,7 @@ class Engine:
     block_size : int
         the side-length of each block, in pixels
     block_speed : list(float)
-        the speed each block will move toward the player
+        the speed the level will move toward the player
     frame_length : int
         the length of the gameplay frame, in number of blocks
     frame_height : int
@@ -51,10 +86,44 @@ class Engine:
         fully faded)
     attempts : int
         the current attempt the player is on
+    headless : bool
+        whether the engine runs without a display or mixer
+    level_path : str
+        the file path of the loaded level
+    level_hash : bytes
+        the SHA-256 hash of the loaded level's file (None until it is needed,
+        for streamed levels)
+    recording : Recording
+        the inputs of the current (or, until the next one starts, the last)
+        attempt
+    record_dir : str
+        the directory every finished attempt's recording is saved to, or None
+        to not save them
+    session : str
+        when the engine was created, which is part of the file name of every
+        recording saved, so later runs of the game do not replace them
+    resumed : bool
+        whether the current attempt was restored from a saved state or
+        rewound, in which case its recording is incomplete and is not saved
+    rewind_buffer : RewindBuffer
+        the state of the last few seconds of the current attempt
+    music_time : int
+        how far the level's music has played, in milliseconds
+    blocks_tested : int
+        the number of blocks tested for collision in the last update
+    stream_bytes : int
+        the size of level file, in bytes, above which levels are streamed
+        from the file as they are played instead of being loaded in full
+    clock : SystemClock or SimulatedClock
+        the clock used for the engine's timers
+    controls : KeyboardInput or ScriptedInput
+        the source of the player's input
+    audio : MixerAudio or NullAudio
+        the backend used to play sounds and music
     FONT : pygame freetype font object
-        the font to be rendered as text
-    death_sound : pygame mixer sound object
-        the sound to be played when the player dies
+        the font to be rendered as text (None if headless)
+    text_cache : TextCache
+        the rendered text drawn by the engine (None if headless)
     background_color : tuple(int)
         the color of the background in RGB format
     font_color : tuple(int)
@@ -67,21 +136,40 @@ class Engine:
         the file path of the player image
     player : Player
         the player's block object
-    blockmap : list(list(Block))
-        the entire level stored in blocks
+    camera : Camera
+        the camera following the player
+    frame : Frame
+        the gameplay frame for the current attempt
+    level : Level
+        the entire level stored as arrays of blocks
+    tile_cache : TileCache
+        the pre-rendered chunks of the level (None if headless)
     
     Methods
     -------
-    loadMetaInfo(lines)
-        Loads the meta information of a level from the given lines into the
-        engine
-    loadLevel(filepath)
+    loadMetaInfo(level_file)
+        Loads the meta information of a compiled level into the engine
+    prepareLevel(filepath)
+        Reads and builds the level at the specified file path, without
+        changing the engine
+    loadLevel(filepath, prepared)
         Loads the level at the specified file path into the engine
+    levelHash()
+        Returns the SHA-256 hash of the loaded level's file
     reset()
         Resets the level for a new attempt
+    saveState()
+        Returns the state of the current attempt as a fixed-size blob
+    restoreState(data)
+        Restores the state of an attempt saved with saveState
+    rewind(ticks)
+        Brings the player back to life a number of ticks before they died
+    finishAttempt(outcome)
+        Ends the recording of the current attempt, saving it if recordings
+        are being kept
     update(dt)
         Updates the game state
-    draw(screen)
+    draw(screen, alpha)
         Draws the game state onto the screen
     drawTextXCenter(screen, text, color, size, y)
         Draws text of a specified size and color onto the screen, centered
@@ -90,7 +178,12 @@ class Engine:
         Returns whether the engine is at the level complete screen or not
     """
 
-    def __init__(self, width, height):
+    state_magic   = b"SSB2SAV\0"
+    state_version = 2
+    state_format  = struct.Struct("<8sI32sIqiiiidddIddddq")
+
+    def __init__(self, width, height, headless = False, clock = None,
+            controls = None, audio = None):
         """
         Parameters
         ----------
@@ -98,6 +191,14 @@ class Engine:
             The width of the display, in pixels
         height : int
             The height of the display, in pixels
+        headless : bool
+            Whether the engine should run without a display or mixer
+        clock : SystemClock or SimulatedClock
+            The clock to use, if not the default for the mode
+        controls : KeyboardInput or ScriptedInput
+            The input source to use, if not the default for the mode
+        audio : MixerAudio or NullAudio
+            The audio backend to use, if not the default for the mode
         """
         self.width          = width
         self.height         = height
@@ -113,14 +214,35 @@ class Engine:
         self.fade_duration  = 6000
         self.fade_pct       = 0.0
         self.attempts       = 1
-        self.FONT           = pygame.freetype.Font(
-                             "assets/fonts/momcake/MomcakeBold-WyonA.ttf", 48)
-        self.death_sound    = pygame.mixer.Sound("assets/sfx/death.mp3")
+        self.headless       = headless
+        self.stream_bytes   = 4 * 1024 * 1024
+        self.blocks_tested  = 0
+        self.recording      = None
+        self.record_dir     = None
+        self.session        = time.strftime("%Y%m%d-%H%M%S")
+        self.resumed        = False
+        self.rewind_buffer  = RewindBuffer(1024)
+        self.music_time     = 0
+        self.level          = None
+        self.tile_cache     = None
+
+        if headless:
+            self.clock    = clock or SimulatedClock()
+            self.controls = controls or ScriptedInput()
+            self.audio    = audio or NullAudio()
+            self.FONT     = None
+            self.text_cache = None
+        else:
+            self.clock    = clock or SystemClock()
+            self.controls = controls or KeyboardInput()
+            self.audio    = audio or MixerAudio()
+            self.FONT     = Assets.font(
+                           "assets/fonts/momcake/MomcakeBold-WyonA.ttf", 48)
+            self.text_cache = TextCache(self.FONT)
     
-    def loadMetaInfo(self, lines):
+    def loadMetaInfo(self, level_file):
         """
-        Loads the meta information of a level from the given lines into the
-        engine.
+        Loads the meta information of a compiled level into the engine.
 
         Example meta information (from level 1):
             0,250,255
@@ -132,17 +254,55 @@ class Engine:
 
         Parameters
         ----------
-        dt : int
-            The clock's tick rate
+        level_file : LevelFile
+            The compiled level
         """
-        self.background_color = tuple(float(s) for s in lines[0].split(','))
-        self.font_color       = tuple(float(s) for s in lines[1].split(','))
-        self.block_color      = tuple(float(s) for s in lines[2].split(','))
-        self.spike_color      = tuple(float(s) for s in lines[3].split(','))
-        self.player_img       = str(lines[4][:(len(lines[4])-1)])
-        pygame.mixer.music.load(str(lines[5][:(len(lines[5])-1)]))
-
-    def loadLevel(self, filepath):
+        self.background_color = tuple(level_file.background_color)
+        self.font_color       = tuple(level_file.font_color)
+        self.block_color      = tuple(level_file.block_color)
+        self.spike_color      = tuple(level_file.spike_color)
+        self.player_img       = level_file.player_img
+        self.audio.loadMusic(level_file.music)
+
+    def prepareLevel(self, filepath):
+        """
+        Reads and builds the level at the specified file path, without
+        changing the engine.
+
+        Returns the compiled level file and the built Level, to be passed to
+        loadLevel. Level files larger than stream_bytes are not compiled, and
+        a StreamingLevel (with the meta information as its level file) is
+        returned instead, which keeps the level file open until it is closed.
+        Nothing shared is changed except through the asset cache's
+        thread-safe file reads, so this can run in a background thread (see
+        Preloader).
+
+        Parameters
+        ----------
+        filepath : str
+            The file path of the level
+        """
+        if os.path.getsize(filepath) > self.stream_bytes:
+            level = StreamingLevel(filepath, self.block_size,
+                    self.frame_length, self.frame_height)
+            return level.meta, level
+
+        level_file = LevelFile.open(filepath)
+
+        # read the level's music and player image ahead of time
+        if not self.headless:
+            Assets.file(level_file.music)
+            Assets.file(level_file.player_img)
+
+        # build the level's block layout, with one full frame worth of
+        # standard blocks before the level itself
+        level = Level.fromCells(level_file.col_start, level_file.row,
+                level_file.block_type, self.block_size, self.frame_length,
+                self.frame_height, tuple(level_file.block_color),
+                tuple(level_file.spike_color))
+        return level_file, level
+
+    def loadLevel(self, filepath, prepared = None):
         """
         Loads the level at the specified file path into the engine.
 
@@ -157,88 +317,229 @@ class Engine:
 
         See one of the level text files in "assets/levels" for examples.
 
+        The text file is compiled to a binary level file the first time it is
+        loaded (and again whenever it changes), and later loads map the
+        compiled file instead of parsing the text.
+
         Parameters
         ----------
         filepath : str
             The file path of the level
+        prepared : tuple(LevelFile, Level)
+            The level as already returned by prepareLevel, if it has been
+            prepared ahead of time
         """
-        # read the file
-        f = open(filepath, 'r')
-        lines = f.readlines()
+        if prepared is None:
+            prepared = self.prepareLevel(filepath)
+
+        # a streamed level keeps its file open until it is replaced
+        if (isinstance(self.level, StreamingLevel) and
+                self.level is not prepared[1]):
+            self.level.close()
+        level_file, self.level = prepared
+        self.level_path = filepath
+        self.level_hash = level_file.source_hash
 
         # load the meta information and initialize the player
-        self.loadMetaInfo(lines)
+        self.loadMetaInfo(level_file)
         self.player = Player(pygame.Rect(self.width / 6, self.height / 2,
-                self.block_size, self.block_size), [0, 1], self.player_img)
-
-        # initialize the level's block layout
-        self.blockmap = [[Block(pygame.Rect(0, self.frame_height,
-                self.block_size, self.block_size), self.block_speed,
-                self.block_color, BlockType.BLOCK)]]
+                self.block_size, self.block_size), [-self.block_speed[0], 1],
+                None if self.headless else self.player_img)
+        # chunks drawn for the last level are kept for when it is loaded
+        # again. streamed levels have no hash until one is needed, and their
+        # chunks are not shared
+        if self.tile_cache is not None:
+            self.tile_cache.release()
+        self.tile_cache = None
+        if not self.headless:
+            key = None
+            if self.level_hash is not None:
+                key = (filepath, self.level_hash)
+            self.tile_cache = TileCache(self.level, self.width, self.height,
+                    key)
+        self.attempts = 1
+
+    def levelHash(self):
+        """
+        Returns the SHA-256 hash of the loaded level's file.
 
-        # add one full frame worth of standard blocks before loading the level
-        
-        for i in range(1, self.frame_length):
-            self.blockmap.append([Block(pygame.Rect(self.block_size * i,
-                    self.frame_height, self.block_size * 1.1, self.block_size),
-                    self.block_speed, self.block_color, BlockType.BLOCK)])
-
-        # load the rest of the level
-        for l in range(6, len(lines)):
-            line = lines[l]
-            column = []
-            for i in range(len(line)):
-                character = line[i]
-
-                # load the regular blocks (the * 1.1 width helps smooth out
-                # visual inconsistancies caused by framerate changes)
-                if (character == 'O'):
-                    column.append(Block(pygame.Rect(
-                            self.block_size * (self.frame_length - 1),
-                            self.frame_height - (self.block_size * i),
-                            self.block_size * 1.1, self.block_size),
-                            self.block_speed,
-                            self.block_color, BlockType.BLOCK))
-
-                # load the spikes (they are 25% shorter than other blocks for
-                # balancing purposes and an overall better game-feel)
-                if (character == 'X'):
-                    column.append(Block(pygame.Rect(
-                            self.block_size * (self.frame_length - 1),
-                            (self.frame_height - (self.block_size * i)) + 
-                                self.block_size * 0.25,
-                            self.block_size, self.block_size * 0.75),
-                            self.block_speed,
-                            self.spike_color, BlockType.SPIKE))
-                
-                # load the end blocks
-                if (character == 'E'):
-                    column.append(Block(pygame.Rect(
-                            self.block_size * (self.frame_length - 1),
-                            self.frame_height - (self.block_size * i),
-                            self.block_size, self.block_size),
-                            self.block_speed,
-                            self.block_color, BlockType.END))
-
-            self.blockmap.append(column)
-            self.attempts = 1
+        Compiled levels already know their hash. Streamed levels hash their
+        file the first time this is called.
+        """
+        if self.level_hash is None:
+            self.level_hash = LevelFile.hashFile(self.level_path)
+        return self.level_hash
 
     def reset(self):
         """
         Resets the level for a new attempt.
         """
+        # the player runs through the level at the same speed as the camera,
+        # so it stays in the same place on the screen
         self.player = Player(pygame.Rect(self.width / 6, 8 * self.height / 10,
-            self.block_size, self.block_size), [0, 1], self.player_img)
-        self.frame = Frame(copy.deepcopy(self.blockmap), self.frame_length)
+            self.block_size, self.block_size), [-self.block_speed[0], 1],
+            None if self.headless else self.player_img)
+        self.camera = Camera(self.block_speed)
+        self.frame = Frame(self.level, self.frame_length, self.camera,
+                self.tile_cache)
 
         self.death_time   = -1
         self.end_time     = -1
         self.ground_time  = -1
         self.current_time = -1
         self.fade_pct     = 0.0
+        self.recording    = None
+        self.resumed      = False
+        self.rewind_buffer.clear()
+
+        self.music_time = 0
+        self.audio.restartMusic()
 
-        pygame.mixer.music.rewind()
-        pygame.mixer.music.play()
+    def saveState(self):
+        """
+        Returns the state of the current attempt as a fixed-size blob (see
+        state_format).
+
+        Timers are saved relative to the engine's clock, so the state can be
+        restored by an engine whose clock started at a different time. Sounds
+        are not part of the state, but how far the music has played is.
+        """
+        now = self.clock.getTicks()
+        def elapsed(time):
+            return -1.0 if time == -1 else float(now - time)
+
+        player = self.player
+        rect   = player.blockrect
+        return self.state_format.pack(self.state_magic, self.state_version,
+                self.levelHash(), self.frame.pos, self.camera.x, rect.x,
+                rect.y, rect.width, rect.height, player.speed[0],
+                player.speed[1], player.total_angle, self.attempts,
+                elapsed(self.death_time), elapsed(self.end_time),
+                elapsed(self.ground_time), self.fade_pct, self.music_time)
+
+    def restoreState(self, data):
+        """
+        Restores the state of an attempt saved with saveState.
+
+        The level the state was saved on must already be loaded. Only the
+        player, camera, frame, timers and music are changed, so this takes the
+        same time however long the level is. Raises a ValueError if the data is
+        not a saved state, or was saved on a different level.
+
+        Parameters
+        ----------
+        data : bytes
+            The state, as returned by saveState
+        """
+        if len(data) != self.state_format.size:
+            raise ValueError("not a saved engine state")
+        (magic, version, level_hash, pos, camera_x, x, y, width, height,
+                speed_x, speed_y, angle, attempts, death, end, ground,
+                fade_pct, music_time) = self.state_format.unpack(data)
+        if magic != self.state_magic or version != self.state_version:
+            raise ValueError("not a saved engine state")
+        if level_hash != self.levelHash():
+            raise ValueError("the state was saved on a different level")
+
+        now = self.clock.getTicks()
+        def since(elapsed):
+            return -1 if elapsed < 0 else now - elapsed
+
+        player = self.player
+        player.blockrect      = pygame.Rect(x, y, width, height)
+        player.speed          = [speed_x, speed_y]
+        player.total_angle    = angle
+        player.previous_rect  = player.blockrect
+        player.previous_angle = angle
+        self.camera.x          = camera_x
+        self.camera.previous_x = camera_x
+        self.frame.pos         = pos
+
+        self.attempts     = attempts
+        self.death_time   = since(death)
+        self.end_time     = since(end)
+        self.ground_time  = since(ground)
+        self.current_time = now
+        self.fade_pct     = fade_pct
+        self.music_time   = music_time
+
+        # the music picks up where it was when the state was saved
+        if self.death_time != -1:
+            self.audio.stopMusic()
+        elif self.end_time != -1:
+            self.audio.loadMusic("assets/music/end.mp3")
+            self.audio.playMusic(end / 1000.0)
+        else:
+            self.audio.playMusic(music_time / 1000.0)
+
+        # the inputs before the state was saved are not known, so this
+        # attempt's recording could not be replayed
+        self.recording = None
+        self.resumed   = True
+        self.rewind_buffer.clear()
+
+    def rewind(self, ticks):
+        """
+        Brings the player back to life a number of ticks before they died,
+        as a new attempt, instead of starting the level over.
+
+        Returns whether the player was rewound, which is only possible during
+        the pause after dying.
+
+        Parameters
+        ----------
+        ticks : int
+            The number of ticks to go back before the tick the player died on
+        """
+        if self.death_time == -1 or self.end_time != -1:
+            return False
+        music_time = self.rewind_buffer.rewind(ticks, self.player,
+                self.camera, self.frame)
+        if music_time == -1:
+            return False
+
+        self.death_time  = -1
+        self.ground_time = -1
+        self.attempts   += 1
+        self.recording   = None
+        self.resumed     = True
+
+        # the music picks up where it was at the tick rewound to
+        self.music_time = music_time
+        self.audio.playMusic(music_time / 1000.0)
+        return True
+
+    def finishAttempt(self, outcome):
+        """
+        Ends the recording of the current attempt, saving it if recordings
+        are being kept. Does nothing if the attempt has already ended.
+
+        Parameters
+        ----------
+        outcome : str
+            How the attempt ended ("dead" or "finished")
+        """
+        if self.recording.isFinished():
+            return
+        self.recording.finish(outcome)
+        if self.record_dir is not None and not self.resumed:
+            # hashing a streamed level reads its whole file, so it is only
+            # done for recordings that are kept
+            self.recording.level_hash = self.levelHash()
+            name = os.path.splitext(os.path.basename(self.level_path))[0]
+            name = "%s-%s-%04d-%s" % (name, self.session, self.attempts,
+                    outcome)
+            os.makedirs(self.record_dir, exist_ok = True)
+
+            # never replace an earlier recording, even from a run of the game
+            # started in the same second
+            path = os.path.join(self.record_dir, name + ".ssbr")
+            copy = 1
+            while os.path.exists(path):
+                copy += 1
+                path = os.path.join(self.record_dir,
+                        "%s-%d.ssbr" % (name, copy))
+            self.recording.save(path)
 
     def update(self, dt):
         """
@@ -249,7 +550,7 @@ class Engine:
         dt : int
             The clock's tick rate
         """
-        self.current_time = pygame.time.get_ticks()  # used for various timers
+        self.current_time = self.clock.getTicks()  # used for various timers
 
         # if we are at the level complete screen, no need ot update further
         if self.atLevelCompleteScreen():
@@ -267,43 +568,52 @@ class Engine:
                 self.reset()
                 self.attempts += 1
         else:
-            keys = pygame.key.get_pressed()
-            self.player.update(dt)
-            self.frame.update(dt)
-            current_blocks = self.frame.getRelevantBlocks()
-            self.ground_time = -1  # assume we are not grounded
+            jump = self.controls.isJumpPressed()
+            if self.recording is None:
+                self.recording = Recording(self.level_path, None, self.width,
+                        self.height, dt)
+            self.recording.record(jump)
+            self.rewind_buffer.push(self.player, self.camera, self.frame,
+                    self.music_time)
+            self.music_time += dt
+            with Profiler.phase("player.update"):
+                self.player.update(dt)
+            with Profiler.phase("frame.update"):
+                self.frame.update(dt)
+
+            # test the player against every current block at once. landing on
+            # a standard block snaps the player on top of it and gives the
+            # option to jump
+            with Profiler.phase("collision"):
+                start, end = self.frame.getRelevantBlocks(self.player)
+                self.blocks_tested = end - start
+                grounded, on_spike, collided, ended = Collision.resolve(
+                        self.player, self.level, start, end, jump)
 
-            # loop through each current block for a potential interaction
-            for block in current_blocks:
-                if Block.isOnTop(self.player, block):
-                    # if on top of a spike, die
-                    if block.block_type == BlockType.SPIKE:
-                        self.death_time = self.current_time
-                        pygame.mixer.Sound.play(self.death_sound)
-                        pygame.mixer.music.stop()
-
-                    # if on top of a standard block, snap on top of it and
-                    # have the option to jump
-                    elif block.block_type == BlockType.BLOCK:
-                        self.ground_time = pygame.time.get_ticks()
-                        self.player.speed[1] = 0
-                        self.player.resetRotation()
-                        Block.snapOnTop(self.player, block)
-                        if keys[pygame.K_UP] or keys[pygame.K_SPACE]:
-                            self.player.jump()
-                elif Block.isCollision(self.player, block):
-                    # if the player collides with an end block, the level
-                    # is over
-                    if block.block_type == BlockType.END:
-                        self.end_time = self.current_time
-                        pygame.mixer.music.load("assets/music/end.mp3")
-                        pygame.mixer.music.play()
-                    
-                    # colliding with any other type of block, the player dies
-                    else:
-                        self.death_time = self.current_time
-                        pygame.mixer.Sound.play(self.death_sound)
-                        pygame.mixer.music.stop()
+            self.ground_time = -1  # assume we are not grounded
+            if grounded:
+                self.ground_time = self.clock.getTicks()
+
+            # if the player collides with an end block, the level is over
+            if ended:
+                self.end_time = self.current_time
+                self.audio.loadMusic("assets/music/end.mp3")
+                self.audio.playMusic()
+
+            # landing on a spike or colliding with any other type of block
+            # kills the player
+            if on_spike or collided:
+                self.death_time = self.current_time
+                self.audio.playDeath()
+                self.audio.stopMusic()
+
+            # the first death or end of the level ends the attempt's
+            # recording. the player keeps moving (and can still die) while
+            # the level fades out, but those ticks are not recorded
+            if on_spike or collided:
+                self.finishAttempt("dead")
+            elif ended:
+                self.finishAttempt("finished")
 
             # if not on the ground, the player should rotate
             if self.ground_time == -1:
@@ -316,7 +626,7 @@ class Engine:
                 else:
                     self.player.resetRotation()
 
-    def draw(self, screen):
+    def draw(self, screen, alpha = 1.0):
         """
         Draws the game state onto the screen.
 
@@ -324,6 +634,9 @@ class Engine:
         ----------
         screen : pygame display surface
             The screen to draw onto
+        alpha : float
+            How far through the last update to draw moving things, from 0
+            (before it) to 1 (after it), for smooth motion between updates
         """
         # if at 100% fade, draw the level complete screen
         if self.fade_pct >= 1:
@@ -339,10 +652,11 @@ class Engine:
             
             # if the player is still alive, draw them
             if self.death_time == -1:
-                self.player.draw(screen, self.fade_pct)
+                self.player.draw(screen, self.fade_pct, self.camera, alpha)
             
             # draw all blocks currently in the frame
-            self.frame.draw(screen, self.fade_pct)
+            with Profiler.phase("frame.draw"):
+                self.frame.draw(screen, self.fade_pct, alpha)
 
             # draw the attempt counter
             self.drawTextXCenter(screen, "Attempt   " + str(self.attempts), 
@@ -367,9 +681,8 @@ class Engine:
         y : int
             The location of the text on the Y axis (in pixels)
         """
-        text_rect = self.FONT.get_rect(text, size = size)
-        text_rect.center = (self.width / 2, y)
-        self.FONT.render_to(screen, text_rect, text, color, size = size)
+        self.text_cache.drawCentered(screen, text, color, size,
+                self.width / 2, y)
 
     def atLevelCompleteScreen(self):
         """
@@ -3,71 +3,95 @@
 # Author: Alexander Marcozzi
 # Date: 06/12/2021
 
-from itertools import chain
+import pygame
+from game.blocktype import BlockType
 
 class Frame:
     """
     A class representing the frame where gameplay takes place.
 
-    Essentially, the entire level is stored and blocks will "become active" and
-    enter the gameplay frame as the player progresses.
+    Essentially, the entire level is stored and the frame follows the camera
+    across it as the player progresses. The level itself is never modified,
+    so the only state kept per attempt is the camera's position.
 
     ...
 
     Attributes
     ----------
-    blockmap : list(list(Block))
-        the entire level stored in blocks
+    level : Level
+        the entire level stored as arrays of blocks
     length : int
         the length of the frame (number of blocks in the frame horizontally)
+    camera : Camera
+        the camera the frame follows
+    tile_cache : TileCache
+        the pre-rendered chunks of the level, or None to draw each block
     pos : int
         the position of the frame, in terms of blocks from the start
-    
+    blocks_drawn : int
+        the number of shapes drawn the last time the frame was drawn (0 if it
+        was blitted from the tile cache)
+    chunks_drawn : int
+        the number of tile cache chunks blitted the last time the frame was
+        drawn (0 if its shapes were drawn)
+
     Methods
     -------
     update(dt):
-        Updates the position of each block currently in the frame
-    draw(screen, fade_pct):
+        Moves the camera and the frame along the level
+    draw(screen, fade_pct, alpha):
         Draws each block currently in the frame onto the screen
-    getRelevantBlocks():
-        Gets all blocks that could potentially interact with the player
+    getRelevantBlocks(block):
+        Gets the range of blocks that could potentially interact with a block
     """
 
-    def __init__(self, blockmap, length):
+    def __init__(self, level, length, camera, tile_cache = None):
         """
         Parameters
         ----------
-        blockmap : list(list(Block))
-            The entire level stored in blocks
+        level : Level
+            The entire level stored as arrays of blocks
         length : int
-            The length of the frame (number of blocks in the frame 
+            The length of the frame (number of blocks in the frame
             horizontally)
+        camera : Camera
+            The camera the frame follows
+        tile_cache : TileCache
+            The pre-rendered chunks of the level, or None to draw each block
         """
-        self.blockmap = blockmap
-        self.length   = length
-        self.pos      = 0
+        self.level      = level
+        self.length     = length
+        self.camera     = camera
+        self.tile_cache = tile_cache
+        self.pos        = 0
+        self.blocks_drawn = 0
+        self.chunks_drawn = 0
 
     def update(self, dt):
         """
-        Updates the position of each block currently in the frame.
+        Moves the camera and the frame along the level.
 
         Parameters
         ----------
         dt : int
             The clock's tick rate
         """
-        for i in range(self.pos, min(self.pos + self.length, len(self.blockmap))):
-            for block in self.blockmap[i]:
-                block.update(dt)
+        self.camera.update(dt)
 
         # once the leftmost block goes out of frame, shift the frame over one
-        if (self.blockmap[self.pos][0].right() <= 0):
+        first, _ = self.level.columnRange(self.pos, self.pos + 1)
+        if (self.level.x[first] + self.level.w[first] <= self.camera.x):
             self.pos += 1
 
-    def draw(self, screen, fade_pct):
+    def draw(self, screen, fade_pct, alpha = 1.0):
         """
         Draws each block currently in the frame onto the screen.
 
+        This is the only place block positions are converted to screen
+        coordinates. Unfaded frames are blitted from the tile cache, if there
+        is one; faded frames draw each of the level's shapes (see
+        Level.mergeCells) in its faded colors.
+
         Parameters
         ----------
         screen : pygame display surface
@@ -75,15 +99,49 @@ class Frame:
         fade_pct : float
             The amount the block should appear faded. 0 being no fade and 1
             being fully faded
+        alpha : float
+            How far through the last update to draw the camera, from 0
+            (before it) to 1 (after it)
         """
-        for i in range(self.pos, min(self.pos + self.length, len(self.blockmap))):
-            for block in self.blockmap[i]:
-                    block.draw(screen, fade_pct)
+        level = self.level
+        camera_x = self.camera.interpolate(alpha)
+        if self.tile_cache is not None and fade_pct == 0:
+            self.blocks_drawn = 0
+            self.chunks_drawn = self.tile_cache.draw(screen, camera_x)
+            return
+        shapes = level.shapesInColumns(self.pos, self.pos + self.length)
+        self.blocks_drawn = len(shapes)
+        self.chunks_drawn = 0
+
+        block_color = [col * (1 - fade_pct) for col in level.block_color]
+        spike_color = [col * (1 - fade_pct) for col in level.spike_color]
+
+        for left, top, width, height, block_type in zip(
+                (level.shape_x[shapes] - camera_x).tolist(),
+                level.shape_y[shapes].tolist(), level.shape_w[shapes].tolist(),
+                level.shape_h[shapes].tolist(),
+                level.shape_type[shapes].tolist()):
+            if (block_type == BlockType.SPIKE.value):
+                # draw a triangle to represent the spike
+                pygame.draw.polygon(screen, spike_color,
+                        [
+                            [left, top + height],
+                            [left + width // 2, top],
+                            [left + width, top + height]
+                        ])
+            elif (block_type == BlockType.BLOCK.value):
+                # draw the block
+                pygame.draw.rect(screen, block_color,
+                        (left, top, width, height))
 
-    def getRelevantBlocks(self):
+    def getRelevantBlocks(self, block):
         """
-        Gets all blocks that could potentially interact with the player.
+        Gets the range of blocks that could potentially interact with a block,
+        as a (start, end) pair of block indices.
+
+        Parameters
+        ----------
+        block : Block
+            The block, in level coordinates (usually the player)
         """
-        # check more than necessary to ensure no interactions are missed
-        return list(chain.from_iterable(self.blockmap[
-            self.pos+3:self.pos+int(self.length / 2)]))
\ No newline at end of file
+        return self.level.overlapRange(block.left(), block.right())
@@ -0,0 +1,198 @@
+# Title: frame_pacer.py
+# Description: Contains the FramePacer class for Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+
+import logging
+import time
+from collections import deque
+import pygame
+
+log = logging.getLogger(__name__)
+
+class FramePacer:
+    """
+    A class that paces the main loop to a target frame rate.
+
+    Instead of spinning for the whole frame (like Clock.tick_busy_loop), the
+    pacer sleeps until shortly before the next frame is due and only spins
+    for the last fraction of a millisecond, which keeps frames evenly spaced
+    without keeping a CPU core busy. Frames are scheduled against a fixed
+    timeline, so an early or late frame does not shift the ones after it.
+
+    ...
+
+    Attributes
+    ----------
+    target_fps : float
+        the frame rate to pace to, in frames per second
+    frame_duration : float
+        the target time between frames, in milliseconds
+    period : float
+        the target time between frames, in seconds
+    spin_margin : float
+        how long before each frame is due to stop sleeping and start
+        spinning, in seconds
+    frame_times : deque(float)
+        the measured time between recent frames, in milliseconds
+    deadline : float
+        when the next frame is due (time.perf_counter seconds)
+    last_tick : float
+        when the last frame started (time.perf_counter seconds)
+
+    Methods
+    -------
+    displayRefreshRate(default, samples)
+        Returns the refresh rate of the display, if it can be found
+    setTarget(target_fps)
+        Changes the frame rate to pace to
+    restart()
+        Starts a new timeline from now, e.g. after the loop has been waiting
+        on input
+    tick()
+        Waits until the next frame is due and returns the time since the last
+        frame
+    fps()
+        Returns the measured frame rate
+    averageFrameTime()
+        Returns the mean of the recent frame times, in milliseconds
+    jitter()
+        Returns the standard deviation of the recent frame times, in
+        milliseconds
+    """
+
+    def __init__(self, target_fps = 120, spin_margin = 0.0005, history = 240):
+        """
+        Parameters
+        ----------
+        target_fps : float
+            The frame rate to pace to, in frames per second
+        spin_margin : float
+            How long before each frame is due to stop sleeping and start
+            spinning, in seconds
+        history : int
+            The number of recent frame times to keep
+        """
+        self.spin_margin = spin_margin
+        self.frame_times = deque(maxlen = history)
+        self.last_tick   = time.perf_counter()
+        self.deadline    = self.last_tick
+        self.setTarget(target_fps)
+
+    @staticmethod
+    def displayRefreshRate(default = 60, samples = 30):
+        """
+        Returns the refresh rate of the display, if it can be found.
+
+        pygame-ce reports the rate directly. Otherwise the rate is measured
+        by timing a number of flips of the display, which only wait for the
+        display to refresh if it was opened with vsync. If neither works, a
+        warning is logged and the default is returned.
+
+        Parameters
+        ----------
+        default : float
+            The rate to return if the display's rate is unknown
+        samples : int
+            The number of flips to time
+        """
+        get_rates = getattr(pygame.display, "get_desktop_refresh_rates", None)
+        if get_rates is not None:
+            rates = [rate for rate in get_rates() if rate > 0]
+            if rates:
+                return rates[0]
+
+        if pygame.display.get_surface() is not None:
+            # the first few flips can return early while the display settles
+            pygame.display.flip()
+            pygame.display.flip()
+            intervals = []
+            last = time.perf_counter()
+            for _ in range(samples):
+                pygame.display.flip()
+                now = time.perf_counter()
+                intervals.append(now - last)
+                last = now
+            intervals.sort()
+            interval = intervals[len(intervals) // 2]
+
+            # flips that do not wait for the display come back far faster
+            # than any display refreshes
+            if interval > 0 and 20 <= 1.0 / interval <= 500:
+                return 1.0 / interval
+
+        log.warning("could not find the display's refresh rate, running at "
+                "%g frames per second", default)
+        return default
+
+    def setTarget(self, target_fps):
+        """
+        Changes the frame rate to pace to.
+
+        Parameters
+        ----------
+        target_fps : float
+            The frame rate to pace to, in frames per second
+        """
+        self.target_fps     = target_fps
+        self.frame_duration = 1000.0 / target_fps
+        self.period         = 1.0 / target_fps
+
+    def restart(self):
+        """
+        Starts a new timeline from now, e.g. after the loop has been waiting
+        on input, so the wait is not counted as a frame.
+        """
+        self.last_tick = time.perf_counter()
+        self.deadline  = self.last_tick
+
+    def tick(self):
+        """
+        Waits until the next frame is due and returns the time since the last
+        frame, in milliseconds.
+        """
+        self.deadline += self.period
+        now = time.perf_counter()
+
+        # if we have fallen more than a frame behind, start a new timeline
+        # rather than rushing to catch up
+        if now - self.deadline > self.period:
+            self.deadline = now
+
+        remaining = self.deadline - now - self.spin_margin
+        if remaining > 0:
+            time.sleep(remaining)
+        while time.perf_counter() < self.deadline:
+            pass
+
+        now = time.perf_counter()
+        frame_time = (now - self.last_tick) * 1000.0
+        self.last_tick = now
+        self.frame_times.append(frame_time)
+        return frame_time
+
+    def fps(self):
+        """
+        Returns the measured frame rate, in frames per second.
+        """
+        average = self.averageFrameTime()
+        return 1000.0 / average if average > 0 else 0.0
+
+    def averageFrameTime(self):
+        """
+        Returns the mean of the recent frame times, in milliseconds.
+        """
+        if not self.frame_times:
+            return 0.0
+        return sum(self.frame_times) / len(self.frame_times)
+
+    def jitter(self):
+        """
+        Returns the standard deviation of the recent frame times, in
+        milliseconds.
+        """
+        if not self.frame_times:
+            return 0.0
+        average = self.averageFrameTime()
+        return (sum((frame_time - average) ** 2 for frame_time in
+                self.frame_times) / len(self.frame_times)) ** 0.5
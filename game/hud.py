@@ -0,0 +1,226 @@
+# Title: hud.py
+# Description: Contains the PerformanceHud class for Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+
+import time
+from collections import deque
+import numpy as np
+import pygame
+import pygame.freetype
+
+class PerformanceHud:
+    """
+    A class representing the debug overlay that shows how well the game is
+    running.
+
+    The overlay shows the frame rate, the average of the slowest 1% and 0.1%
+    of recent frames, the number of shapes or tile cache chunks drawn and
+    blocks tested for collision, and the frame's position in the level,
+    above a rolling graph of frame times.
+
+    So that the overlay does not skew what it measures, it is drawn from two
+    cached surfaces. The text panel is only rendered again a few times a
+    second, and the graph is scrolled along by one pixel per frame with only
+    the newest frame's bar drawn.
+
+    ...
+
+    Attributes
+    ----------
+    font : pygame freetype font object
+        the font the text is rendered with
+    font_size : int
+        the size of the text
+    visible : bool
+        whether the overlay is shown
+    frame_times : deque(float)
+        the times of recent frames, in milliseconds
+    refresh_period : float
+        the time between renders of the text panel, in seconds
+    last_refresh : float
+        when the text panel was last rendered (time.perf_counter seconds)
+    panel : pygame surface
+        the rendered text panel (None until it is first rendered)
+    graph : pygame surface
+        the graph of recent frame times, one pixel column per frame
+    graph_max : float
+        the frame time at the top of the graph, in milliseconds
+    guides : list(float)
+        the frame times marked across the graph, in milliseconds
+
+    Methods
+    -------
+    clearGraph()
+        Clears the graph and draws its guide lines
+    toggle()
+        Shows or hides the overlay
+    record(frame_time)
+        Adds a frame's time to the statistics and the graph
+    lows()
+        Returns the average of the slowest 1% and 0.1% of recent frames
+    fps()
+        Returns the frame rate over the last 60 frames
+    renderPanel(frame, blocks_tested)
+        Renders the text panel
+    draw(screen, frame, blocks_tested)
+        Draws the overlay onto the screen
+    """
+
+    def __init__(self, font_size = 18, history = 2000, graph_size = (300, 80),
+            graph_max = 33.3, refresh_period = 0.25):
+        """
+        Parameters
+        ----------
+        font_size : int
+            The size of the text
+        history : int
+            The number of recent frame times kept
+        graph_size : tuple(int)
+            The width and height of the graph, in pixels
+        graph_max : float
+            The frame time at the top of the graph, in milliseconds
+        refresh_period : float
+            The time between renders of the text panel, in seconds
+        """
+        self.font           = pygame.freetype.Font(None, font_size)
+        self.font_size      = font_size
+        self.visible        = False
+        self.frame_times    = deque(maxlen = history)
+        self.refresh_period = refresh_period
+        self.last_refresh   = 0.0
+        self.panel          = None
+        self.graph_max      = graph_max
+        self.guides         = [1000.0 / 120, 1000.0 / 60]
+        self.graph          = pygame.Surface(graph_size)
+        if pygame.display.get_surface() is not None:
+            self.graph = self.graph.convert()
+        self.clearGraph()
+
+    def clearGraph(self):
+        """
+        Clears the graph and draws its guide lines.
+        """
+        self.graph.fill((0, 0, 0))
+        width, height = self.graph.get_size()
+        for guide in self.guides:
+            y = height - 1 - int(guide / self.graph_max * height)
+            pygame.draw.line(self.graph, (80, 80, 80), (0, y), (width, y))
+
+    def toggle(self):
+        """
+        Shows or hides the overlay.
+        """
+        self.visible = not self.visible
+        self.panel   = None
+        self.clearGraph()
+
+    def record(self, frame_time):
+        """
+        Adds a frame's time to the statistics and, if the overlay is shown,
+        to the graph.
+
+        Parameters
+        ----------
+        frame_time : float
+            The time since the last frame, in milliseconds
+        """
+        self.frame_times.append(frame_time)
+        if not self.visible:
+            return
+
+        # scroll the graph left by one pixel and draw the newest bar
+        graph = self.graph
+        width, height = graph.get_size()
+        graph.scroll(-1, 0)
+        pygame.draw.line(graph, (0, 0, 0), (width - 1, 0),
+                (width - 1, height))
+        for guide in self.guides:
+            y = height - 1 - int(guide / self.graph_max * height)
+            graph.set_at((width - 1, y), (80, 80, 80))
+
+        if frame_time <= self.guides[0] * 1.1:
+            color = (0, 220, 0)
+        elif frame_time <= self.guides[1] * 1.1:
+            color = (230, 200, 0)
+        else:
+            color = (230, 0, 0)
+        bar = min(int(frame_time / self.graph_max * height), height)
+        pygame.draw.line(graph, color, (width - 1, height - 1),
+                (width - 1, height - bar))
+
+    def lows(self):
+        """
+        Returns the average times of the slowest 1% and 0.1% of recent
+        frames, in milliseconds.
+        """
+        if not self.frame_times:
+            return 0.0, 0.0
+        times = np.sort(np.fromiter(self.frame_times, dtype = np.float64,
+                count = len(self.frame_times)))
+        one = times[-max(len(times) // 100, 1):].mean()
+        point_one = times[-max(len(times) // 1000, 1):].mean()
+        return float(one), float(point_one)
+
+    def fps(self):
+        """
+        Returns the frame rate over the last 60 frames, in frames per second.
+        """
+        recent = list(self.frame_times)[-60:]
+        if not recent or sum(recent) <= 0:
+            return 0.0
+        return 1000.0 * len(recent) / sum(recent)
+
+    def renderPanel(self, frame, blocks_tested):
+        """
+        Renders the text panel.
+
+        Parameters
+        ----------
+        frame : Frame
+            The gameplay frame, for its position and the blocks it drew
+        blocks_tested : int
+            The number of blocks tested for collision in the last update
+        """
+        one, point_one = self.lows()
+        fps = self.fps()
+        lines = [
+            "FPS %.1f  (%.2f ms)" % (fps, 1000.0 / fps if fps else 0.0),
+            "1%% low %.2f ms   0.1%% low %.2f ms" % (one, point_one),
+            "shapes drawn %d   chunks drawn %d   blocks tested %d" % (
+                    frame.blocks_drawn, frame.chunks_drawn, blocks_tested),
+            "frame pos %d" % frame.pos,
+        ]
+
+        line_height = self.font.get_sized_height(self.font_size)
+        width = max(self.graph.get_width(), max(self.font.get_rect(line,
+                size = self.font_size).width for line in lines) + 12)
+        # the panel is opaque, as blending it onto the screen would cost more
+        # than the rest of the overlay put together
+        self.panel = pygame.Surface((width, line_height * len(lines) + 12))
+        if pygame.display.get_surface() is not None:
+            self.panel = self.panel.convert()
+        self.panel.fill((20, 20, 20))
+        for i, line in enumerate(lines):
+            self.font.render_to(self.panel, (6, 6 + i * line_height), line,
+                    (255, 255, 255), size = self.font_size)
+
+    def draw(self, screen, frame, blocks_tested):
+        """
+        Draws the overlay onto the screen, in the top left corner.
+
+        Parameters
+        ----------
+        screen : pygame display surface
+            The screen to draw onto
+        frame : Frame
+            The gameplay frame, for its position and the blocks it drew
+        blocks_tested : int
+            The number of blocks tested for collision in the last update
+        """
+        now = time.perf_counter()
+        if self.panel is None or now - self.last_refresh >= self.refresh_period:
+            self.renderPanel(frame, blocks_tested)
+            self.last_refresh = now
+        screen.blit(self.panel, (10, 10))
+        screen.blit(self.graph, (10, 10 + self.panel.get_height()))
@@ -0,0 +1,442 @@
+# Title: level.py
+# Description: Contains the Level class for Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+
+import numpy as np
+from game.blocktype import BlockType
+
+class Level:
+    """
+    A class representing the block layout of a level.
+
+    Rather than storing a separate Block (and pygame.Rect) for every cell of
+    the level, the layout is stored as a structure of arrays, with one entry
+    per block in each array. Blocks are ordered by column, so the blocks of
+    any run of columns occupy a contiguous range of indices.
+
+    Positions are in level coordinates (column i starts i blocks from the
+    start of the level) and never change once the level is built, so a single
+    level can be shared by every attempt. The arrays are read-only.
+
+    For drawing, the blocks are also merged into as few rectangles (shapes)
+    as possible when the level is built (see mergeCells), so a long floor is
+    drawn as one rectangle instead of one per cell. Spikes and end blocks are
+    never merged. Collision still tests the individual blocks, as landing
+    depends on the height of each block.
+
+    ...
+
+    Attributes
+    ----------
+    x : numpy.ndarray(int32)
+        the position of the left side of each block, in pixels
+    y : numpy.ndarray(int32)
+        the position of the top side of each block, in pixels
+    w : numpy.ndarray(int32)
+        the width of each block, in pixels
+    h : numpy.ndarray(int32)
+        the height of each block, in pixels
+    block_type : numpy.ndarray(uint8)
+        the BlockType value of each block
+    col_start : numpy.ndarray(int32)
+        the index of the first block of each column, with one extra entry at
+        the end so that the blocks of column i are col_start[i]:col_start[i+1]
+    block_size : int
+        the side-length of each block (and the width of each column), in
+        pixels
+    overhang : int
+        how far the widest block reaches past the right side of its column,
+        in pixels
+    block_color : tuple(int)
+        the color of the blocks in RGB format
+    spike_color : tuple(int)
+        the color of the spikes in RGB format
+    shape_x : numpy.ndarray(int32)
+        the position of the left side of each shape, in pixels
+    shape_y : numpy.ndarray(int32)
+        the position of the top side of each shape, in pixels
+    shape_w : numpy.ndarray(int32)
+        the width of each shape, in pixels
+    shape_h : numpy.ndarray(int32)
+        the height of each shape, in pixels
+    shape_type : numpy.ndarray(uint8)
+        the BlockType value of each shape
+    shape_index : numpy.ndarray(int32)
+        the shapes covering each column, in drawing order
+    shape_start : numpy.ndarray(int32)
+        the index into shape_index of the first shape of each column, with
+        one extra entry at the end, as col_start
+
+    Methods
+    -------
+    fromCells(cell_start, row, cell_type, block_size, frame_length,
+            frame_height, block_color, spike_color)
+        Builds a level from the cells of a compiled level file
+    blockGeometry(column, row, block_type, block_size, frame_height)
+        Returns the position and size of blocks, as the x, y, w and h arrays
+        of a level
+    mergeCells(x, y, w, h, block_type, col_start)
+        Merges neighboring blocks into larger rectangles for drawing
+    numColumns()
+        Returns the number of columns in the level
+    numBlocks()
+        Returns the number of blocks in the level
+    nbytes()
+        Returns the memory used by the level's arrays, in bytes
+    columnRange(first, last)
+        Returns the range of block indices covering a run of columns
+    shapesInColumns(first, last)
+        Returns the shapes covering a run of columns, in drawing order
+    overlapRange(left, right)
+        Returns the range of block indices in the columns that reach a
+        horizontal span
+    verticalRange()
+        Returns the highest top side and lowest bottom side of any block
+    """
+
+    def __init__(self, x, y, w, h, block_type, col_start, block_size,
+            block_color, spike_color):
+        """
+        Parameters
+        ----------
+        x : numpy.ndarray(int32)
+            The position of the left side of each block, in pixels
+        y : numpy.ndarray(int32)
+            The position of the top side of each block, in pixels
+        w : numpy.ndarray(int32)
+            The width of each block, in pixels
+        h : numpy.ndarray(int32)
+            The height of each block, in pixels
+        block_type : numpy.ndarray(uint8)
+            The BlockType value of each block
+        col_start : numpy.ndarray(int32)
+            The index of the first block of each column, plus one trailing
+            entry holding the total number of blocks
+        block_size : int
+            The side-length of each block, in pixels
+        block_color : tuple(int)
+            The color of the blocks in RGB format
+        spike_color : tuple(int)
+            The color of the spikes in RGB format
+        """
+        self.x           = x
+        self.y           = y
+        self.w           = w
+        self.h           = h
+        self.block_type  = block_type
+        self.col_start   = col_start
+        for array in (x, y, w, h, block_type, col_start):
+            array.flags.writeable = False
+        self.block_size  = block_size
+        self.overhang    = max(int(w.max()) - block_size, 0) if len(w) else 0
+        self.block_color = block_color
+        self.spike_color = spike_color
+
+        (self.shape_x, self.shape_y, self.shape_w, self.shape_h,
+                self.shape_type, self.shape_index,
+                self.shape_start) = Level.mergeCells(x, y, w, h, block_type,
+                col_start)
+        for array in (self.shape_x, self.shape_y, self.shape_w, self.shape_h,
+                self.shape_type, self.shape_index, self.shape_start):
+            array.flags.writeable = False
+
+    @staticmethod
+    def fromCells(cell_start, row, cell_type, block_size, frame_length,
+            frame_height, block_color, spike_color):
+        """
+        Builds a level from the cells of a compiled level file.
+
+        One full frame worth of standard blocks is added before the level.
+
+        Parameters
+        ----------
+        cell_start : numpy.ndarray(uint32)
+            The index of the first cell of each column of the level file, plus
+            one trailing entry holding the total number of cells
+        row : numpy.ndarray(uint16)
+            The row of each cell, from the ground up
+        cell_type : numpy.ndarray(uint8)
+            The BlockType value of each cell
+        block_size : int
+            The side-length of each block, in pixels
+        frame_length : int
+            The length of the gameplay frame, in number of blocks
+        frame_height : float
+            The height of the gameplay frame, in pixels
+        block_color : tuple(int)
+            The color of the blocks in RGB format
+        spike_color : tuple(int)
+            The color of the spikes in RGB format
+        """
+        num_lines = len(cell_start) - 1
+        line_index = np.repeat(np.arange(num_lines),
+                np.diff(cell_start.astype(np.int64)))
+
+        # the leading frame of standard blocks
+        runway = np.arange(frame_length)
+        column = np.concatenate((runway, line_index + frame_length))
+        row    = np.concatenate((np.zeros(frame_length, dtype = np.int64),
+                row.astype(np.int64)))
+        block_type = np.concatenate((np.full(frame_length,
+                BlockType.BLOCK.value, dtype = np.uint8), cell_type))
+
+        x, y, w, h = Level.blockGeometry(column, row, block_type, block_size,
+                frame_height)
+
+        # the first block of the runway is not widened
+        w[0] = block_size
+
+        col_start = np.concatenate((runway, cell_start.astype(np.int64) +
+                frame_length)).astype(np.int32)
+
+        return Level(x, y, w, h, block_type, col_start, block_size,
+                block_color, spike_color)
+
+    @staticmethod
+    def blockGeometry(column, row, block_type, block_size, frame_height):
+        """
+        Returns the position and size of blocks, as the x, y, w and h arrays
+        of a level.
+
+        Parameters
+        ----------
+        column : numpy.ndarray(int)
+            The column of each block in the level (including the runway)
+        row : numpy.ndarray(int)
+            The row of each block, from the ground up
+        block_type : numpy.ndarray(uint8)
+            The BlockType value of each block
+        block_size : int
+            The side-length of each block, in pixels
+        frame_height : float
+            The height of the gameplay frame, in pixels
+        """
+        is_spike = block_type == BlockType.SPIKE.value
+        is_block = block_type == BlockType.BLOCK.value
+
+        x = block_size * column.astype(np.int64)
+
+        # spikes are 25% shorter than other blocks for balancing purposes and
+        # an overall better game-feel
+        top = frame_height - (block_size * row.astype(np.float64))
+        y = np.where(is_spike, top + block_size * 0.25, top)
+        h = np.where(is_spike, block_size * 0.75, block_size)
+
+        # the * 1.1 width of regular blocks helps smooth out visual
+        # inconsistancies caused by framerate changes
+        w = np.where(is_block, block_size * 1.1, block_size)
+
+        # pygame.Rect truncates fractional positions and sizes
+        return (x.astype(np.int32), np.trunc(y).astype(np.int32),
+                np.trunc(w).astype(np.int32), np.trunc(h).astype(np.int32))
+
+    @staticmethod
+    def mergeCells(x, y, w, h, block_type, col_start):
+        """
+        Merges neighboring blocks into larger rectangles for drawing, and
+        returns the shape_x, shape_y, shape_w, shape_h, shape_type,
+        shape_index and shape_start arrays of a level.
+
+        Blocks in the same row of neighboring columns are merged into runs,
+        then runs with the same left and right sides in neighboring rows are
+        merged into rectangles. Spikes and end blocks are kept as they are.
+
+        Drawing the shapes gives exactly the same pixels as drawing every
+        block in order. Each shape takes the place, in drawing order, of its
+        first block. The one place that would change what is drawn on top is
+        the bottom right corner of a spike, which touches the block below and
+        to the right of it, so that block always starts a new run.
+
+        Parameters
+        ----------
+        x, y, w, h : numpy.ndarray(int32)
+            The left side, top side, width and height of each block
+        block_type : numpy.ndarray(uint8)
+            The BlockType value of each block
+        col_start : numpy.ndarray(int32)
+            The index of the first block of each column, plus one trailing
+            entry holding the total number of blocks
+        """
+        num_columns = len(col_start) - 1
+        column = np.repeat(np.arange(num_columns, dtype = np.int64),
+                np.diff(col_start.astype(np.int64)))
+        x = x.astype(np.int64)
+        y = y.astype(np.int64)
+        w = w.astype(np.int64)
+        h = h.astype(np.int64)
+        blocks = np.flatnonzero(block_type == BlockType.BLOCK.value)
+        others = np.flatnonzero(block_type != BlockType.BLOCK.value)
+
+        # find the block holding the bottom right corner of each spike, by
+        # searching the blocks ordered by column and then height
+        breaks = np.zeros(len(x), dtype = bool)
+        spikes = np.flatnonzero(block_type == BlockType.SPIKE.value)
+        if len(blocks) > 0 and len(spikes) > 0:
+            low  = int(y.min())
+            span = int((y + h).max()) - low + 1
+            keys = column[blocks] * span + (y[blocks] - low)
+            order = np.argsort(keys, kind = 'stable')
+            corner_x = x[spikes] + w[spikes]
+            corner_y = y[spikes] + h[spikes]
+            found = np.searchsorted(keys[order], (column[spikes] + 1) * span
+                    + np.clip(corner_y - low, 0, span - 1),
+                    side = 'right') - 1
+            found = blocks[order[np.maximum(found, 0)]]
+            hit = ((column[found] == column[spikes] + 1) &
+                    (y[found] <= corner_y) & (corner_y < y[found] + h[found])
+                    & (x[found] <= corner_x) & (corner_x < x[found] +
+                    w[found]))
+            breaks[found[hit]] = True
+
+        # runs of blocks at the same height in neighboring columns
+        order = blocks[np.lexsort((column[blocks], h[blocks], y[blocks]))]
+        joined = np.zeros(len(order), dtype = bool)
+        joined[1:] = ((y[order[1:]] == y[order[:-1]]) &
+                (h[order[1:]] == h[order[:-1]]) &
+                (column[order[1:]] == column[order[:-1]] + 1) &
+                ~breaks[order[1:]])
+        starts = np.flatnonzero(~joined)
+        ends   = np.append(starts[1:], len(order))[:len(starts)] - 1
+        run_first = order[starts]
+        run_last  = order[ends]
+        run_x = x[run_first]
+        run_y = y[run_first]
+        run_w = x[run_last] + w[run_last] - run_x
+        run_h = h[run_first]
+
+        # rectangles of runs with the same sides, each directly on top of the
+        # next
+        order = np.lexsort((run_y, run_w, run_x))
+        joined = np.zeros(len(order), dtype = bool)
+        joined[1:] = ((run_x[order[1:]] == run_x[order[:-1]]) &
+                (run_w[order[1:]] == run_w[order[:-1]]) &
+                (run_y[order[1:]] == run_y[order[:-1]] +
+                run_h[order[:-1]]))
+        starts = np.flatnonzero(~joined)
+        group  = np.cumsum(~joined) - 1
+        rect_x = run_x[order[starts]]
+        rect_y = run_y[order[starts]]
+        rect_w = run_w[order[starts]]
+        rect_h = np.bincount(group, weights = run_h[order],
+                minlength = len(starts)).astype(np.int64)
+        rect_first = (np.minimum.reduceat(run_first[order], starts)
+                if len(order) else np.zeros(0, dtype = np.int64))
+        rect_columns = (column[run_first[order[starts]]],
+                column[run_last[order[starts]]])
+
+        # every shape, in the drawing order of its first block
+        first = np.concatenate((rect_first, others))
+        order = np.argsort(first)
+        shape_x = np.concatenate((rect_x, x[others]))[order]
+        shape_y = np.concatenate((rect_y, y[others]))[order]
+        shape_w = np.concatenate((rect_w, w[others]))[order]
+        shape_h = np.concatenate((rect_h, h[others]))[order]
+        shape_type = np.concatenate((np.full(len(rect_x),
+                BlockType.BLOCK.value, dtype = np.uint8),
+                block_type[others]))[order]
+        first_column = np.concatenate((rect_columns[0],
+                column[others]))[order]
+        last_column  = np.concatenate((rect_columns[1],
+                column[others]))[order]
+
+        # list each shape under every column it covers
+        counts = last_column - first_column + 1
+        shape = np.repeat(np.arange(len(order)), counts)
+        offset = np.arange(len(shape)) - np.repeat(np.cumsum(counts) - counts,
+                counts)
+        shape_column = np.repeat(first_column, counts) + offset
+        order = np.lexsort((shape, shape_column))
+        shape_start = np.concatenate(([0], np.cumsum(np.bincount(
+                shape_column, minlength = num_columns))))
+
+        return (shape_x.astype(np.int32), shape_y.astype(np.int32),
+                shape_w.astype(np.int32), shape_h.astype(np.int32),
+                shape_type, shape[order].astype(np.int32),
+                shape_start.astype(np.int32))
+
+    def numColumns(self):
+        """
+        Returns the number of columns in the level.
+        """
+        return len(self.col_start) - 1
+
+    def numBlocks(self):
+        """
+        Returns the number of blocks in the level.
+        """
+        return len(self.x)
+
+    def nbytes(self):
+        """
+        Returns the memory used by the level's arrays, in bytes.
+        """
+        return sum(array.nbytes for array in (self.x, self.y, self.w, self.h,
+                self.block_type, self.col_start, self.shape_x, self.shape_y,
+                self.shape_w, self.shape_h, self.shape_type, self.shape_index,
+                self.shape_start))
+
+    def columnRange(self, first, last):
+        """
+        Returns the range of block indices covering a run of columns.
+
+        Parameters
+        ----------
+        first : int
+            The first column of the run
+        last : int
+            The column after the last column of the run
+        """
+        num_columns = len(self.col_start) - 1
+        first = min(max(first, 0), num_columns)
+        last  = min(max(last, first), num_columns)
+        return int(self.col_start[first]), int(self.col_start[last])
+
+    def shapesInColumns(self, first, last):
+        """
+        Returns the indices of the shapes covering a run of columns, in
+        drawing order.
+
+        Parameters
+        ----------
+        first : int
+            The first column of the run
+        last : int
+            The column after the last column of the run
+        """
+        num_columns = len(self.shape_start) - 1
+        first = min(max(first, 0), num_columns)
+        last  = min(max(last, first), num_columns)
+        return np.unique(self.shape_index[self.shape_start[first]:
+                self.shape_start[last]])
+
+    def overlapRange(self, left, right):
+        """
+        Returns the range of block indices in the columns that reach a
+        horizontal span.
+
+        Only the columns whose blocks could touch the span (including their
+        right sides) are covered, which for a block-sized span is one or two
+        columns, or three when the span starts in a wider block's overhang.
+
+        Parameters
+        ----------
+        left : int
+            The position of the left side of the span, in level coordinates
+        right : int
+            The position of the right side of the span, in level coordinates
+        """
+        # a column reaches the span if its widest block's right side is at
+        # or past the left side of the span
+        first = -((self.block_size + self.overhang - left) // self.block_size)
+        last  = right // self.block_size
+        return self.columnRange(first, last + 1)
+
+    def verticalRange(self):
+        """
+        Returns the highest top side and lowest bottom side of any block, in
+        pixels.
+        """
+        if self.numBlocks() == 0:
+            return 0, 0
+        return int(self.y.min()), int((self.y + self.h).max())
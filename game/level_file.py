@@ -0,0 +1,436 @@
+# Title: level_file.py
+# Description: Contains the LevelFile class for Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import numpy as np
+from game.blocktype import BlockType
+
+class LevelFile:
+    """
+    A class representing a level file compiled to a binary format.
+
+    Level text files are parsed once and saved next to the source (in a
+    "compiled" folder) as a header followed by packed column data. Compiled
+    files are memory-mapped when loaded, so loading a level reads the column
+    data straight from the page cache without building anything per cell.
+    The header records a hash of the text file it was compiled from, along
+    with its modification time and size. Loading only reads and hashes the
+    text file if its time or size no longer match, and the file is compiled
+    again whenever the hash differs.
+
+    File layout (little-endian):
+        header   : magic, format version, SHA-256 of the source file, the
+                   source file's modification time (in nanoseconds) and size,
+                   the background, font, block and spike colors (as
+                   doubles), the number of columns and cells, and the lengths
+                   of the player image and music paths
+        paths    : the player image path and music path, in UTF-8, padded to
+                   a multiple of 4 bytes
+        columns  : uint32[columns + 1], the index of the first cell of each
+                   column, plus the total number of cells
+        rows     : uint16[cells], the row of each cell, from the ground up
+        types    : uint8[cells], the BlockType value of each cell
+
+    Cells are the Os, Xs and Es of the text file, with the columns in file
+    order. The leading frame of standard blocks is not stored, since its
+    length depends on the size of the screen.
+
+    ...
+
+    Attributes
+    ----------
+    magic : bytes
+        the bytes every compiled level file starts with
+    version : int
+        the version of the compiled format
+    header : struct.Struct
+        the layout of the fixed-size header
+    source_hash : bytes
+        the SHA-256 hash of the text file the level was compiled from
+    source_stat : tuple(int, int)
+        the modification time (in nanoseconds) and size of the text file when
+        it was compiled, or (0, 0) if not known
+    background_color : tuple(float)
+        the color of the background in RGB format
+    font_color : tuple(float)
+        the color of the text in RGB format
+    block_color : tuple(float)
+        the color of the blocks in RGB format
+    spike_color : tuple(float)
+        the color of the spikes in RGB format
+    player_img : str
+        the file path of the player's image
+    music : str
+        the file path of the level's music
+    col_start : numpy.ndarray(uint32)
+        the index of the first cell of each column, with one extra entry at
+        the end holding the total number of cells
+    row : numpy.ndarray(uint16)
+        the row of each cell, from the ground up
+    block_type : numpy.ndarray(uint8)
+        the BlockType value of each cell
+
+    Methods
+    -------
+    open(source_path)
+        Returns the compiled form of a level text file, compiling it if it is
+        missing or out of date
+    compiledPath(source_path)
+        Returns the path a level text file is compiled to
+    sourceHash(data)
+        Returns the hash of the contents of a level text file
+    sourceStat(source_path)
+        Returns the modification time and size of a level text file
+    hashFile(source_path)
+        Returns the hash of a level text file, read in blocks
+    compile(data)
+        Parses the contents of a level text file
+    parseMeta(lines)
+        Returns a level file holding only the meta information of a level
+    parseCells(block_lines)
+        Parses the block lines of a level text file
+    load(path)
+        Memory-maps a compiled level file
+    readSource(path)
+        Returns the source hash, time and size recorded in a compiled level
+        file
+    save(path)
+        Writes the level to a compiled level file
+    numColumns()
+        Returns the number of columns in the level
+    """
+
+    magic   = b"SSB2LVL\0"
+    version = 2
+    header  = struct.Struct("<8sI32sqQ12dIIHH")
+
+    def __init__(self, source_hash, background_color, font_color,
+            block_color, spike_color, player_img, music, col_start, row,
+            block_type, source_stat = (0, 0)):
+        """
+        Parameters
+        ----------
+        source_hash : bytes
+            The SHA-256 hash of the text file the level was compiled from
+        background_color : tuple(float)
+            The color of the background in RGB format
+        font_color : tuple(float)
+            The color of the text in RGB format
+        block_color : tuple(float)
+            The color of the blocks in RGB format
+        spike_color : tuple(float)
+            The color of the spikes in RGB format
+        player_img : str
+            The file path of the player's image
+        music : str
+            The file path of the level's music
+        col_start : numpy.ndarray(uint32)
+            The index of the first cell of each column, plus one trailing
+            entry holding the total number of cells
+        row : numpy.ndarray(uint16)
+            The row of each cell, from the ground up
+        block_type : numpy.ndarray(uint8)
+            The BlockType value of each cell
+        source_stat : tuple(int, int)
+            The modification time (in nanoseconds) and size of the text file
+            when it was compiled, or (0, 0) if not known
+        """
+        self.source_hash      = source_hash
+        self.source_stat      = source_stat
+        self.background_color = background_color
+        self.font_color       = font_color
+        self.block_color      = block_color
+        self.spike_color      = spike_color
+        self.player_img       = player_img
+        self.music            = music
+        self.col_start        = col_start
+        self.row              = row
+        self.block_type       = block_type
+
+    @staticmethod
+    def open(source_path):
+        """
+        Returns the compiled form of a level text file, compiling it if it is
+        missing or out of date.
+
+        The text file is only read if its modification time or size differ
+        from those recorded in the compiled file. If they differ but its hash
+        does not, the compiled file is kept and the new time and size are
+        recorded, so later loads do not hash it again.
+
+        If the compiled file cannot be written (e.g. the folder is read-only),
+        the level is returned without being saved.
+
+        Parameters
+        ----------
+        source_path : str
+            The file path of the level text file
+        """
+        stat = LevelFile.sourceStat(source_path)
+        path = LevelFile.compiledPath(source_path)
+        recorded = LevelFile.readSource(path)
+        if recorded is not None and recorded[1] == stat:
+            return LevelFile.load(path)
+
+        with open(source_path, 'rb') as f:
+            data = f.read()
+        if recorded is not None and recorded[0] == LevelFile.sourceHash(data):
+            level_file = LevelFile.load(path)
+        else:
+            level_file = LevelFile.compile(data)
+        level_file.source_stat = stat
+        try:
+            level_file.save(path)
+        except OSError:
+            pass
+        return level_file
+
+    @staticmethod
+    def compiledPath(source_path):
+        """
+        Returns the path a level text file is compiled to.
+
+        Parameters
+        ----------
+        source_path : str
+            The file path of the level text file
+        """
+        directory, name = os.path.split(source_path)
+        return os.path.join(directory, "compiled",
+                os.path.splitext(name)[0] + ".lvl")
+
+    @staticmethod
+    def sourceHash(data):
+        """
+        Returns the hash of the contents of a level text file.
+
+        Parameters
+        ----------
+        data : bytes
+            The contents of the level text file
+        """
+        return hashlib.sha256(data).digest()
+
+    @staticmethod
+    def sourceStat(source_path):
+        """
+        Returns the modification time (in nanoseconds) and size of a level
+        text file.
+
+        Parameters
+        ----------
+        source_path : str
+            The file path of the level text file
+        """
+        stat = os.stat(source_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def hashFile(source_path):
+        """
+        Returns the hash of a level text file, read in blocks so that large
+        files are never held in memory. The hash is the same as sourceHash of
+        the file's contents.
+
+        Parameters
+        ----------
+        source_path : str
+            The file path of the level text file
+        """
+        digest = hashlib.sha256()
+        with open(source_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.digest()
+
+    @staticmethod
+    def compile(data):
+        """
+        Parses the contents of a level text file.
+
+        The first six lines should contain the meta information for the
+        level, and the rest a combination of Os, Xs and Es, as described in
+        Engine.loadLevel.
+
+        Parameters
+        ----------
+        data : bytes
+            The contents of the level text file
+        """
+        lines = data.decode('utf-8').splitlines()
+        level_file = LevelFile.parseMeta(lines[:6])
+        level_file.source_hash = LevelFile.sourceHash(data)
+        level_file.col_start, level_file.row, level_file.block_type = \
+                LevelFile.parseCells(lines[6:])
+        return level_file
+
+    @staticmethod
+    def parseMeta(lines):
+        """
+        Returns a level file holding only the meta information of a level,
+        with no cells.
+
+        Parameters
+        ----------
+        lines : list(str)
+            The first six lines of the level text file
+        """
+        lines = [line.rstrip('\r\n') for line in lines]
+        colors = [tuple(float(s) for s in line.split(',')) for line in
+                lines[:4]]
+        return LevelFile(None, colors[0], colors[1], colors[2], colors[3],
+                lines[4], lines[5], np.zeros(1, dtype = np.uint32),
+                np.zeros(0, dtype = np.uint16), np.zeros(0, dtype = np.uint8))
+
+    @staticmethod
+    def parseCells(block_lines):
+        """
+        Parses the block lines of a level text file, and returns the column
+        starts, rows and types of its cells.
+
+        Parameters
+        ----------
+        block_lines : list(str)
+            The lines of Os, Xs and Es, each one a column of the level
+        """
+        # lay the block lines out as a character grid so every cell can be
+        # classified at once. each row of the grid is a column of the level
+        block_lines = [line.rstrip('\r\n') for line in block_lines]
+        grid_width = max([len(line) for line in block_lines] + [1])
+        grid = np.frombuffer(''.join(line.ljust(grid_width) for line in
+                block_lines).encode('latin-1', 'replace'), dtype = np.uint8)
+        grid = grid.reshape(len(block_lines), grid_width)
+
+        codes = np.zeros(256, dtype = np.uint8)
+        codes[ord('O')] = BlockType.BLOCK.value
+        codes[ord('X')] = BlockType.SPIKE.value
+        codes[ord('E')] = BlockType.END.value
+        cells = codes[grid]
+
+        # np.nonzero walks the grid row by row, so cells come out ordered by
+        # column and then from the ground up within each column
+        column, row = np.nonzero(cells)
+        if grid_width > np.iinfo(np.uint16).max + 1:
+            raise ValueError("level columns are too tall to compile")
+        col_start = np.searchsorted(column,
+                np.arange(len(block_lines) + 1)).astype(np.uint32)
+
+        return col_start, row.astype(np.uint16), cells[column, row]
+
+    @staticmethod
+    def load(path):
+        """
+        Memory-maps a compiled level file.
+
+        The column data arrays are read-only views of the mapped file.
+
+        Parameters
+        ----------
+        path : str
+            The file path of the compiled level
+        """
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+
+        fields = LevelFile.header.unpack_from(buffer, 0)
+        magic, version, source_hash, mtime, size = fields[:5]
+        if magic != LevelFile.magic or version != LevelFile.version:
+            raise ValueError("not a compiled level file: " + path)
+        colors = fields[5:17]
+        num_columns, num_cells, img_length, music_length = fields[17:]
+
+        offset = LevelFile.header.size
+        player_img = bytes(buffer[offset:offset + img_length]).decode('utf-8')
+        offset += img_length
+        music = bytes(buffer[offset:offset + music_length]).decode('utf-8')
+        offset += music_length
+        offset += -offset % 4
+
+        col_start = np.frombuffer(buffer, dtype = '<u4',
+                count = num_columns + 1, offset = offset)
+        offset += col_start.nbytes
+        row = np.frombuffer(buffer, dtype = '<u2', count = num_cells,
+                offset = offset)
+        offset += row.nbytes
+        block_type = np.frombuffer(buffer, dtype = np.uint8,
+                count = num_cells, offset = offset)
+
+        return LevelFile(source_hash, colors[0:3], colors[3:6], colors[6:9],
+                colors[9:12], player_img, music, col_start, row, block_type,
+                (mtime, size))
+
+    @staticmethod
+    def readSource(path):
+        """
+        Returns the source hash and the source's (modification time, size)
+        recorded in a compiled level file, or None if the file is missing or
+        not a compiled level of this version.
+
+        Parameters
+        ----------
+        path : str
+            The file path of the compiled level
+        """
+        try:
+            with open(path, 'rb') as f:
+                data = f.read(LevelFile.header.size)
+        except OSError:
+            return None
+        if len(data) < LevelFile.header.size:
+            return None
+        magic, version, source_hash, mtime, size = \
+                LevelFile.header.unpack_from(data)[:5]
+        if magic != LevelFile.magic or version != LevelFile.version:
+            return None
+        return source_hash, (mtime, size)
+
+    def save(self, path):
+        """
+        Writes the level to a compiled level file.
+
+        The file is written under a unique temporary name and then moved into
+        place, so a level being loaded never sees a partly written file, and
+        two processes saving the same level do not write to the same file.
+
+        Parameters
+        ----------
+        path : str
+            The file path of the compiled level
+        """
+        player_img = self.player_img.encode('utf-8')
+        music      = self.music.encode('utf-8')
+        paths = player_img + music
+        paths += b"\0" * (-(self.header.size + len(paths)) % 4)
+
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok = True)
+        fd, temp_path = tempfile.mkstemp(dir = directory,
+                prefix = os.path.basename(path) + ".", suffix = ".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(self.header.pack(self.magic, self.version,
+                        self.source_hash, *(tuple(self.source_stat) +
+                        tuple(self.background_color) +
+                        tuple(self.font_color) + tuple(self.block_color) +
+                        tuple(self.spike_color)), self.numColumns(),
+                        len(self.row), len(player_img), len(music)))
+                f.write(paths)
+                f.write(self.col_start.astype('<u4').tobytes())
+                f.write(self.row.astype('<u2').tobytes())
+                f.write(self.block_type.astype(np.uint8).tobytes())
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def numColumns(self):
+        """
+        Returns the number of columns in the level.
+        """
+        return len(self.col_start) - 1
@@ -6,6 +6,8 @@
 import pygame
 from game.block import Block
 from game.blocktype import BlockType
+from game.sprite_cache import RotationCache
+from game.assets import Assets
 
 class Player(Block):
     """
@@ -20,15 +22,22 @@ class Player(Block):
     max_speed : int
         the maximum speed achievable (essentially terminal velocity)
     base_image : pygame image surface
-        the image representing the player
+        the image representing the player (None if the player is never drawn)
+    rotations : RotationCache
+        the rotated copies of the player image, shared by every player with
+        the same image (None if the player is never drawn)
     total_angle : int
         the angle that the player's block should be rotate
+    previous_rect : pygame.Rect
+        the player's rectangle before the last update
+    previous_angle : int
+        the player's angle before the last update
 
     Methods
     -------
     update(dt)
         Updates the position of the player
-    draw(screen, fade_pct)
+    draw(screen, fade_pct, camera, alpha)
         Draws the player onto the screen
     rotate(angle)
         Rotates the player clockwise a specified number of degrees
@@ -38,24 +47,35 @@ class Player(Block):
         Increases the player's vertical speed, simulating a jump
     """
 
-    def __init__(self, blockrect, speed, image_path):
+    def __init__(self, blockrect, speed, image_path, rotation_step = 1):
         """
         Parameters
         ----------
         blockrect : pygame.Rect
             A pygame rectangle object that holds the positional and spatial
             information of the block
-        speed : float
+        speed : list(float)
             The speed at which the block will move in the X and Y directions
         image_path : str
-            The file path of the player image
+            The file path of the player image, or None for a player that is
+            never drawn (e.g. in a headless simulation)
+        rotation_step : float
+            The angle the player's rotation is rounded to when drawn, in
+            degrees
         """
         Block.__init__(self, blockrect, speed, (0,0,0), BlockType.BLOCK)
         self.max_speed = blockrect.width / 20
-        self.base_image = pygame.image.load(image_path)
-        self.base_image = pygame.transform.smoothscale(
-            self.base_image, (blockrect.width, blockrect.height))
+        self.base_image = None
+        self.rotations  = None
+        if image_path is not None:
+            self.base_image = Assets.image(image_path,
+                (blockrect.width, blockrect.height))
+            self.rotations = RotationCache.forImage(
+                (image_path, blockrect.width, blockrect.height),
+                self.base_image, rotation_step)
         self.total_angle = 0
+        self.previous_rect  = self.blockrect
+        self.previous_angle = self.total_angle
 
     def update(self, dt):
         """
@@ -69,15 +89,20 @@ class Player(Block):
         dt : int
             The clock's tick rate
         """
+        self.previous_rect  = self.blockrect
+        self.previous_angle = self.total_angle
         Block.update(self, dt)
         if (self.speed[1] < self.max_speed):
             self.speed[1] += (dt / 3200.0) * self.blockrect.width  # gravity
 
-    def draw(self, screen, fade_pct):
+    def draw(self, screen, fade_pct, camera, alpha = 1.0):
         """
         Draws the player onto the screen.
 
         Adjusts the image's alpha based on the passed in fade percentage.
+        Rotated images come from the shared rotation cache. The position and
+        angle are blended between the last two updates, except across a
+        sudden change of angle (e.g. landing).
 
         Parameters
         ----------
@@ -86,9 +111,26 @@ class Player(Block):
         fade_pct : float
             The amount the block should appear faded. 0 being no fade and 1
             being fully faded
+        camera : Camera
+            The camera used to convert the player's position to the screen
+        alpha : float
+            How far through the last update to draw the player, from 0
+            (before it) to 1 (after it)
         """
-        image = pygame.transform.rotate(self.base_image, self.total_angle)
-        new_rect = image.get_rect(center = self.blockrect.center)
+        rect  = self.blockrect
+        angle = self.total_angle
+        if alpha < 1:
+            previous = self.previous_rect
+            rect = pygame.Rect(
+                round(previous.x + (rect.x - previous.x) * alpha),
+                round(previous.y + (rect.y - previous.y) * alpha),
+                rect.width, rect.height)
+            if abs(angle - self.previous_angle) <= 45:
+                angle = (self.previous_angle +
+                    (angle - self.previous_angle) * alpha)
+
+        image = self.rotations.get(angle)
+        new_rect = image.get_rect(center = camera.toScreen(rect, alpha).center)
         image.set_alpha(255 * (1 - fade_pct))
         screen.blit(image, new_rect)
 
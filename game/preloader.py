@@ -0,0 +1,141 @@
+# Title: preloader.py
+# Description: Contains the Preloader class for Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+
+from concurrent.futures import ThreadPoolExecutor
+from game.streaming_level import StreamingLevel
+
+class Preloader:
+    """
+    A class that prepares levels in background threads before they are
+    chosen.
+
+    Preparing a level (reading and building its layout, and reading its
+    music and player image) is handed to a small thread pool, so that by the
+    time a level is chosen it only needs to be handed over to the engine.
+
+    A prepared Level is kept after it is taken, as it never changes once
+    built and can be loaded again for free. A StreamingLevel is not: it
+    changes as it is played and keeps its file open, so taking one hands it
+    over to the caller, who must close it. Streamed levels that are prepared
+    again or shut down before being taken are closed here.
+
+    ...
+
+    Attributes
+    ----------
+    engine : Engine
+        the engine the levels are prepared for
+    executor : concurrent.futures.ThreadPoolExecutor
+        the threads the levels are prepared on
+    futures : dict(str, concurrent.futures.Future)
+        the prepared (or still preparing) levels, by file path
+
+    Methods
+    -------
+    preload(filepaths)
+        Starts preparing levels in the background
+    isReady(filepath)
+        Returns whether a level has finished preparing
+    take(filepath)
+        Returns a prepared level, waiting for it or preparing it if needed
+    shutdown()
+        Stops the background threads
+    discard(future)
+        Closes a streamed level that was prepared but not taken
+    """
+
+    def __init__(self, engine, workers = 2):
+        """
+        Parameters
+        ----------
+        engine : Engine
+            The engine the levels are prepared for
+        workers : int
+            The number of background threads
+        """
+        self.engine   = engine
+        self.executor = ThreadPoolExecutor(max_workers = workers,
+                thread_name_prefix = "preload")
+        self.futures  = {}
+
+    def preload(self, filepaths):
+        """
+        Starts preparing levels in the background.
+
+        Levels that were already prepared are prepared again, in case their
+        files have changed, unless they are still being prepared.
+
+        Parameters
+        ----------
+        filepaths : list(str)
+            The file paths of the levels
+        """
+        for filepath in filepaths:
+            future = self.futures.get(filepath)
+            if future is None or future.done():
+                if future is not None:
+                    Preloader.discard(future)
+                self.futures[filepath] = self.executor.submit(
+                        self.engine.prepareLevel, filepath)
+
+    def isReady(self, filepath):
+        """
+        Returns whether a level has finished preparing.
+
+        Parameters
+        ----------
+        filepath : str
+            The file path of the level
+        """
+        future = self.futures.get(filepath)
+        return future is not None and future.done()
+
+    def take(self, filepath):
+        """
+        Returns a prepared level, waiting for it or preparing it if needed.
+
+        The result can be passed to Engine.loadLevel. A streamed level is
+        forgotten once taken, so it is not handed out twice. If preparing the
+        level in the background failed, it is prepared again here so that the
+        error is raised where the level was chosen.
+
+        Parameters
+        ----------
+        filepath : str
+            The file path of the level
+        """
+        future = self.futures.get(filepath)
+        if (future is not None and not future.cancelled() and
+                future.exception() is None):
+            if isinstance(future.result()[1], StreamingLevel):
+                del self.futures[filepath]
+            return future.result()
+        self.futures.pop(filepath, None)
+        return self.engine.prepareLevel(filepath)
+
+    def shutdown(self):
+        """
+        Stops the background threads, once any running work is finished.
+        """
+        self.executor.shutdown(wait = True, cancel_futures = True)
+        for future in self.futures.values():
+            Preloader.discard(future)
+        self.futures.clear()
+
+    @staticmethod
+    def discard(future):
+        """
+        Closes the level a finished future prepared, if it was streamed.
+
+        Parameters
+        ----------
+        future : concurrent.futures.Future
+            The future the level was prepared on
+        """
+        if (future.done() and not future.cancelled() and
+                future.exception() is None):
+            level = future.result()[1]
+            if isinstance(level, StreamingLevel):
+                level.close()
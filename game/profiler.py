@@ -0,0 +1,214 @@
+# Title: profiler.py
+# Description: Contains the Profiler class for Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+class Profiler:
+    """
+    A class that times the phases of each frame, shared by the whole process.
+
+    Phases are timed by wrapping them in a with block:
+
+        with Profiler.phase("collision"):
+            ...
+
+    While the profiler is disabled (the default), phase returns a shared
+    context that does nothing, so timing can be left in place at the cost of
+    a function call per phase. While it is enabled, the time spent in each
+    phase is added to per-phase statistics, and every timed phase is kept as
+    an event that can be exported for chrome://tracing or Perfetto.
+
+    ...
+
+    Attributes
+    ----------
+    enabled : bool
+        whether phases are being timed
+    max_events : int
+        the maximum number of events kept for the trace, after which only the
+        statistics are updated
+    events : list(tuple)
+        the timed phases, each as its name, thread id, start and duration
+        (in nanoseconds)
+    stats : dict(str, list)
+        the count, total duration and longest duration (in nanoseconds) of
+        each phase
+    origin : int
+        the time the profiler was enabled (time.perf_counter_ns)
+    disabled : contextlib.nullcontext
+        the context returned for every phase while the profiler is disabled
+
+    Methods
+    -------
+    enable()
+        Clears any timings and starts timing phases
+    disable()
+        Stops timing phases
+    phase(name)
+        Returns a context that times a phase
+    record(name, start, end)
+        Records a timed phase
+    summary()
+        Returns the statistics of each phase
+    report()
+        Returns the statistics of each phase as a table
+    exportTrace(path)
+        Writes the timed phases to a Chrome trace event file
+    """
+
+    enabled    = False
+    max_events = 1000000
+    events     = []
+    stats      = {}
+    origin     = 0
+    disabled   = nullcontext()
+
+    @staticmethod
+    def enable():
+        """
+        Clears any timings and starts timing phases.
+        """
+        Profiler.events  = []
+        Profiler.stats   = {}
+        Profiler.origin  = time.perf_counter_ns()
+        Profiler.enabled = True
+
+    @staticmethod
+    def disable():
+        """
+        Stops timing phases. The timings so far are kept.
+        """
+        Profiler.enabled = False
+
+    @staticmethod
+    def phase(name):
+        """
+        Returns a context that times a phase.
+
+        Parameters
+        ----------
+        name : str
+            The name of the phase
+        """
+        if not Profiler.enabled:
+            return Profiler.disabled
+        return PhaseTimer(name)
+
+    @staticmethod
+    def record(name, start, end):
+        """
+        Records a timed phase.
+
+        Parameters
+        ----------
+        name : str
+            The name of the phase
+        start : int
+            When the phase started (time.perf_counter_ns)
+        end : int
+            When the phase ended (time.perf_counter_ns)
+        """
+        duration = end - start
+        stats = Profiler.stats.get(name)
+        if stats is None:
+            Profiler.stats[name] = [1, duration, duration]
+        else:
+            stats[0] += 1
+            stats[1] += duration
+            if duration > stats[2]:
+                stats[2] = duration
+        if len(Profiler.events) < Profiler.max_events:
+            Profiler.events.append((name, threading.get_ident(), start,
+                    duration))
+
+    @staticmethod
+    def summary():
+        """
+        Returns the statistics of each phase, by name, as its count and its
+        total, mean and longest durations (in milliseconds).
+        """
+        return {name: {
+                    "count":    count,
+                    "total_ms": total / 1e6,
+                    "mean_ms":  total / count / 1e6,
+                    "max_ms":   longest / 1e6,
+                } for name, (count, total, longest) in Profiler.stats.items()}
+
+    @staticmethod
+    def report():
+        """
+        Returns the statistics of each phase as a table, with the phases that
+        took the most time in total first.
+        """
+        lines = ["%-16s %10s %12s %10s %10s" % ("phase", "count", "total ms",
+                "mean ms", "max ms")]
+        summary = Profiler.summary()
+        for name in sorted(summary, key = lambda name:
+                -summary[name]["total_ms"]):
+            stats = summary[name]
+            lines.append("%-16s %10d %12.1f %10.3f %10.3f" % (name,
+                    stats["count"], stats["total_ms"], stats["mean_ms"],
+                    stats["max_ms"]))
+        return "\n".join(lines)
+
+    @staticmethod
+    def exportTrace(path):
+        """
+        Writes the timed phases to a Chrome trace event file.
+
+        Parameters
+        ----------
+        path : str
+            The file path to write to
+        """
+        pid = os.getpid()
+        events = [{
+                "name": name,
+                "cat":  "frame",
+                "ph":   "X",
+                "pid":  pid,
+                "tid":  tid,
+                "ts":   (start - Profiler.origin) / 1000.0,
+                "dur":  duration / 1000.0,
+            } for name, tid, start, duration in Profiler.events]
+        with open(path, 'w') as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+class PhaseTimer:
+    """
+    A context that times one run of a phase for the Profiler.
+
+    ...
+
+    Attributes
+    ----------
+    name : str
+        the name of the phase
+    start : int
+        when the phase started (time.perf_counter_ns)
+    """
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        """
+        Parameters
+        ----------
+        name : str
+            The name of the phase
+        """
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        Profiler.record(self.name, self.start, time.perf_counter_ns())
+        return False
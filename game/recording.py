@@ -0,0 +1,197 @@
+# Title: recording.py
+# Description: Contains the Recording class for Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+
+import struct
+import numpy as np
+
+class Recording:
+    """
+    A class representing the inputs of one attempt at a level.
+
+    The state of the jump key is the only input to the game, and the engine
+    reads it once per tick, so an attempt is recorded as one bit per tick.
+    Along with the hash of the level and the engine parameters that affect
+    gameplay, this is enough to play the attempt out again exactly on a
+    headless engine (see tools/replay.py).
+
+    File layout (little-endian):
+        header   : magic, format version, SHA-256 of the level file, display
+                   width and height, simulation step, outcome, number of
+                   ticks and the length of the level path
+        path     : the level's file path, in UTF-8
+        presses  : the state of the jump key for each tick, packed 8 ticks to
+                   a byte, first tick in the highest bit
+
+    ...
+
+    Attributes
+    ----------
+    magic : bytes
+        the bytes every recording file starts with
+    version : int
+        the version of the recording format
+    header : struct.Struct
+        the layout of the fixed-size header
+    outcomes : list(str)
+        the ways an attempt can end, in the order they are stored
+    level_path : str
+        the file path of the level
+    level_hash : bytes
+        the SHA-256 hash of the level file
+    width : int
+        the width of the display, in pixels
+    height : int
+        the height of the display, in pixels
+    dt : float
+        the simulation step, in milliseconds
+    presses : bytearray
+        the state of the jump key for each tick, as 0 or 1
+    outcome : str
+        how the attempt ended ("dead" or "finished"), or None if it has not
+
+    Methods
+    -------
+    record(jump)
+        Adds a tick to the recording
+    finish(outcome)
+        Marks the end of the attempt
+    isFinished()
+        Returns whether the attempt has ended
+    ticks()
+        Returns the number of ticks recorded
+    toBytes()
+        Returns the recording in its file format
+    fromBytes(data)
+        Reads a recording from its file format
+    save(path)
+        Writes the recording to a file
+    load(path)
+        Reads a recording from a file
+    """
+
+    magic    = b"SSB2REC\0"
+    version  = 1
+    header   = struct.Struct("<8sI32sIIdBIH")
+    outcomes = [None, "dead", "finished"]
+
+    def __init__(self, level_path, level_hash, width, height, dt):
+        """
+        Parameters
+        ----------
+        level_path : str
+            The file path of the level
+        level_hash : bytes
+            The SHA-256 hash of the level file
+        width : int
+            The width of the display, in pixels
+        height : int
+            The height of the display, in pixels
+        dt : float
+            The simulation step, in milliseconds
+        """
+        self.level_path = level_path
+        self.level_hash = level_hash
+        self.width      = width
+        self.height     = height
+        self.dt         = dt
+        self.presses    = bytearray()
+        self.outcome    = None
+
+    def record(self, jump):
+        """
+        Adds a tick to the recording, unless the attempt has ended.
+
+        Parameters
+        ----------
+        jump : bool
+            Whether the jump key was held down during the tick
+        """
+        if self.outcome is None:
+            self.presses.append(1 if jump else 0)
+
+    def finish(self, outcome):
+        """
+        Marks the end of the attempt.
+
+        Parameters
+        ----------
+        outcome : str
+            How the attempt ended ("dead" or "finished")
+        """
+        self.outcome = outcome
+
+    def isFinished(self):
+        """
+        Returns whether the attempt has ended.
+        """
+        return self.outcome is not None
+
+    def ticks(self):
+        """
+        Returns the number of ticks recorded.
+        """
+        return len(self.presses)
+
+    def toBytes(self):
+        """
+        Returns the recording in its file format.
+        """
+        path = self.level_path.encode('utf-8')
+        bits = np.packbits(np.frombuffer(bytes(self.presses),
+                dtype = np.uint8))
+        return (self.header.pack(self.magic, self.version, self.level_hash,
+                self.width, self.height, self.dt,
+                self.outcomes.index(self.outcome), self.ticks(), len(path)) +
+                path + bits.tobytes())
+
+    @staticmethod
+    def fromBytes(data):
+        """
+        Reads a recording from its file format.
+
+        Parameters
+        ----------
+        data : bytes
+            The recording, as returned by toBytes
+        """
+        (magic, version, level_hash, width, height, dt, outcome, ticks,
+                path_length) = Recording.header.unpack_from(data)
+        if magic != Recording.magic or version != Recording.version:
+            raise ValueError("not a recording file")
+
+        offset = Recording.header.size
+        level_path = data[offset:offset + path_length].decode('utf-8')
+        offset += path_length
+        bits = np.frombuffer(data, dtype = np.uint8, offset = offset)
+
+        recording = Recording(level_path, level_hash, width, height, dt)
+        recording.presses = bytearray(np.unpackbits(bits)[:ticks].tobytes())
+        recording.outcome = Recording.outcomes[outcome]
+        return recording
+
+    def save(self, path):
+        """
+        Writes the recording to a file.
+
+        Parameters
+        ----------
+        path : str
+            The file path to write to
+        """
+        with open(path, 'wb') as f:
+            f.write(self.toBytes())
+
+    @staticmethod
+    def load(path):
+        """
+        Reads a recording from a file.
+
+        Parameters
+        ----------
+        path : str
+            The file path of the recording
+        """
+        with open(path, 'rb') as f:
+            return Recording.fromBytes(f.read())
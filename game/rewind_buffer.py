@@ -0,0 +1,147 @@
+# Title: rewind_buffer.py
+# Description: Contains the RewindBuffer class for Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+
+import numpy as np
+
+class RewindBuffer:
+    """
+    A class that keeps the state of the last few seconds of an attempt, one
+    entry per tick, so the player can rewind after dying instead of starting
+    over.
+
+    The entries are kept in preallocated arrays used as a ring: once the
+    buffer is full, each new entry overwrites the oldest one. Nothing is
+    allocated as entries are added, and the memory used does not grow
+    however long the game is played.
+
+    ...
+
+    Attributes
+    ----------
+    capacity : int
+        the number of ticks kept
+    x : numpy.ndarray
+        the left side of the player at each tick
+    y : numpy.ndarray
+        the top side of the player at each tick
+    vy : numpy.ndarray
+        the vertical speed of the player at each tick
+    angle : numpy.ndarray
+        the angle of the player at each tick
+    camera_x : numpy.ndarray
+        the position of the camera at each tick
+    frame_pos : numpy.ndarray
+        the position of the frame at each tick
+    music_time : numpy.ndarray
+        how far the level's music had played at each tick, in milliseconds
+    head : int
+        the index the next entry will be written to
+    size : int
+        the number of entries kept
+
+    Methods
+    -------
+    clear()
+        Removes every entry
+    push(player, camera, frame, music_time)
+        Adds the current tick's state as the newest entry
+    rewind(ticks, player, camera, frame)
+        Moves the player, camera and frame back a number of ticks
+    """
+
+    def __init__(self, capacity):
+        """
+        Parameters
+        ----------
+        capacity : int
+            The number of ticks kept
+        """
+        self.capacity   = capacity
+        self.x          = np.zeros(capacity, dtype = np.int32)
+        self.y          = np.zeros(capacity, dtype = np.int32)
+        self.vy         = np.zeros(capacity, dtype = np.float64)
+        self.angle      = np.zeros(capacity, dtype = np.float64)
+        self.camera_x   = np.zeros(capacity, dtype = np.int32)
+        self.frame_pos  = np.zeros(capacity, dtype = np.int32)
+        self.music_time = np.zeros(capacity, dtype = np.int64)
+        self.clear()
+
+    def clear(self):
+        """
+        Removes every entry.
+        """
+        self.head = 0
+        self.size = 0
+
+    def push(self, player, camera, frame, music_time):
+        """
+        Adds the current tick's state as the newest entry, overwriting the
+        oldest entry if the buffer is full.
+
+        Parameters
+        ----------
+        player : Player
+            The player
+        camera : Camera
+            The camera following the player
+        frame : Frame
+            The gameplay frame
+        music_time : int
+            How far the level's music has played, in milliseconds
+        """
+        head = self.head
+        rect = player.blockrect
+        self.x[head]          = rect.x
+        self.y[head]          = rect.y
+        self.vy[head]         = player.speed[1]
+        self.angle[head]      = player.total_angle
+        self.camera_x[head]   = camera.x
+        self.frame_pos[head]  = frame.pos
+        self.music_time[head] = music_time
+
+        self.head = (head + 1) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+
+    def rewind(self, ticks, player, camera, frame):
+        """
+        Moves the player, camera and frame back to the entry a number of
+        ticks before the newest one (or to the oldest entry, if there are not
+        that many). That entry and every one after it are removed, as the
+        next push adds the current tick again.
+
+        Returns how far the level's music had played at that entry, in
+        milliseconds, or -1 if the buffer is empty.
+
+        Parameters
+        ----------
+        ticks : int
+            The number of ticks to move back
+        player : Player
+            The player
+        camera : Camera
+            The camera following the player
+        frame : Frame
+            The gameplay frame
+        """
+        if self.size == 0:
+            return -1
+        ticks = min(max(ticks, 0), self.size - 1)
+        index = (self.head - 1 - ticks) % self.capacity
+
+        rect = player.blockrect
+        player.blockrect = rect.move(int(self.x[index]) - rect.x,
+                int(self.y[index]) - rect.y)
+        player.speed[1]       = float(self.vy[index])
+        player.total_angle    = float(self.angle[index])
+        player.previous_rect  = player.blockrect
+        player.previous_angle = player.total_angle
+        camera.x          = int(self.camera_x[index])
+        camera.previous_x = camera.x
+        frame.pos         = int(self.frame_pos[index])
+
+        self.head = index
+        self.size -= ticks + 1
+        return int(self.music_time[index])
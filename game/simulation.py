@@ -0,0 +1,129 @@
+# Title: simulation.py
+# Description: Contains the Simulation class for Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+
+from game.engine   import Engine
+from game.backends import SimulatedClock, ScriptedInput
+
+class Simulation:
+    """
+    A class that runs attempts at a level on a headless engine.
+
+    Nothing is drawn and no time is waited for, so attempts run as fast as
+    the CPU allows and always play out the same way for the same input.
+
+    ...
+
+    Attributes
+    ----------
+    clock : SimulatedClock
+        the engine's clock, moved forward by dt every step
+    controls : ScriptedInput
+        the engine's input source
+    engine : Engine
+        the headless gameplay engine
+    dt : int
+        the clock's tick rate used for every step
+    ticks : int
+        the number of steps taken in the current attempt
+
+    Methods
+    -------
+    reset()
+        Starts a new attempt
+    step(jump)
+        Advances the current attempt by one tick
+    run(presses, max_ticks)
+        Plays a whole attempt and returns how it ended
+    isDead()
+        Returns whether the player has died in the current attempt
+    isFinished()
+        Returns whether the player has reached the end of the level
+    column()
+        Returns the column of the level the player is in
+    """
+
+    def __init__(self, filepath, width = 1920, height = 1080, dt = 8):
+        """
+        Parameters
+        ----------
+        filepath : str
+            The file path of the level
+        width : int
+            The width of the simulated display, in pixels
+        height : int
+            The height of the simulated display, in pixels
+        dt : int
+            The clock's tick rate used for every step
+        """
+        self.clock    = SimulatedClock()
+        self.controls = ScriptedInput()
+        self.engine   = Engine(width, height, True, self.clock, self.controls)
+        self.dt       = dt
+        self.engine.loadLevel(filepath)
+        self.reset()
+
+    def reset(self):
+        """
+        Starts a new attempt.
+        """
+        self.engine.reset()
+        self.ticks = 0
+
+    def step(self, jump = False):
+        """
+        Advances the current attempt by one tick.
+
+        Parameters
+        ----------
+        jump : bool
+            Whether the jump key is held down during this tick
+        """
+        self.controls.jump = jump
+        self.clock.advance(self.dt)
+        self.engine.update(self.dt)
+        self.ticks += 1
+
+    def run(self, presses, max_ticks = 1000000):
+        """
+        Plays a whole attempt and returns how it ended.
+
+        Returns a tuple of a string ("dead", "finished" or "timeout") and the
+        number of ticks the attempt lasted. The key is released once the
+        presses run out.
+
+        Parameters
+        ----------
+        presses : iterable(bool)
+            Whether the jump key is held down, for each tick
+        max_ticks : int
+            The number of ticks after which the attempt is abandoned
+        """
+        self.reset()
+        presses = iter(presses)
+        while self.ticks < max_ticks:
+            self.step(next(presses, False))
+            if self.isDead():
+                return "dead", self.ticks
+            if self.isFinished():
+                return "finished", self.ticks
+        return "timeout", self.ticks
+
+    def isDead(self):
+        """
+        Returns whether the player has died in the current attempt.
+        """
+        return self.engine.death_time != -1
+
+    def isFinished(self):
+        """
+        Returns whether the player has reached the end of the level.
+        """
+        return self.engine.end_time != -1
+
+    def column(self):
+        """
+        Returns the column of the level the player is in.
+        """
+        return self.engine.player.left() // self.engine.block_size
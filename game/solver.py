@@ -0,0 +1,309 @@
+# Title: solver.py
+# Description: Contains the Solver class for Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+
+import numpy as np
+from game.vector_simulation import VectorSimulation
+
+class Solver:
+    """
+    A class that searches every way of playing a level for one that reaches
+    the end.
+
+    The player moves right at a constant speed, so at any tick the only
+    things that differ between two ways of playing are the player's height
+    and vertical speed. The search keeps every distinct (height, speed) state
+    reached so far, its frontier, and advances all of them one tick at a time
+    in lockstep as copies of a VectorSimulation, merging states that are the
+    same and dropping states where the player has died. Jumping only does
+    anything on a tick where the player lands on a block, so a state only
+    branches on those ticks. Only the game's physics are run: nothing is
+    recorded, drawn or played.
+
+    The search ends once a state reaches the end of the level, giving the
+    inputs that got there, or once every state has died, giving the columns
+    where the last of them died.
+
+    A frontier can also be split into parts that are searched separately
+    (see split), so one level can be searched by several processes. The
+    parts do not merge states with each other, but each reaches the end if
+    and only if one of its states can.
+
+    A frontier is a dictionary with:
+        "tick"     : the number of ticks since the start of the level
+        "x"        : the player's left side, which is the same for every
+                     state
+        "camera_x" : the camera's position, which is the same for every state
+        "frame_pos": the frame's position, which is the same for every state
+        "y"        : the player's top side in each state
+        "vy"       : the player's vertical speed in each state
+        "presses"  : the state of the jump key for each tick that led to each
+                     state
+
+    ...
+
+    Attributes
+    ----------
+    simulation : VectorSimulation
+        the copies of the level the frontier is advanced on
+    runway : int
+        the number of empty columns before the first column of the level
+        file
+
+    Methods
+    -------
+    start()
+        Returns the frontier at the start of the level
+    solve(max_ticks, frontier)
+        Searches the level and returns what was found
+    split(parts, max_ticks)
+        Searches the level until its frontier can be split into parts
+    search(frontier, max_ticks, parts)
+        Advances a frontier until the search ends or it can be split
+    column(x)
+        Returns the column of the level file a player is in
+    backtrack(layers, index)
+        Returns the inputs that led to a state
+    """
+
+    def __init__(self, filepath, width = 1920, height = 1080, dt = 8):
+        """
+        Parameters
+        ----------
+        filepath : str
+            The file path of the level
+        width : int
+            The width of the simulated display, in pixels
+        height : int
+            The height of the simulated display, in pixels
+        dt : int
+            The simulation step, in milliseconds
+        """
+        self.simulation = VectorSimulation(filepath, 1, width, height, dt)
+        self.runway     = self.simulation.engine.frame_length
+
+    def start(self):
+        """
+        Returns the frontier at the start of the level.
+        """
+        x, y, vy = self.simulation.start
+        return {
+            "tick":      0,
+            "x":         x,
+            "camera_x":  0,
+            "frame_pos": 0,
+            "y":         np.array([y], dtype = np.int64),
+            "vy":        np.array([vy], dtype = np.float64),
+            "presses":   [[]],
+        }
+
+    def solve(self, max_ticks = 100000, frontier = None):
+        """
+        Searches the level and returns what was found.
+
+        Returns a dictionary with:
+            "result"  : "reachable", "unreachable" or "timeout"
+            "ticks"   : the number of ticks since the start of the level
+                        when the search ended
+            "witness" : the state of the jump key for each tick of a way to
+                        reach the end (only if reachable)
+            "columns" : the columns where the last surviving ways of playing
+                        died (only if unreachable)
+            "furthest": the furthest column any way of playing reached
+            "states"  : the number of states searched
+
+        Columns are counted from the first column of the level file, not
+        including the empty runway before it.
+
+        Parameters
+        ----------
+        max_ticks : int
+            The number of ticks since the start of the level after which the
+            search is abandoned
+        frontier : dict
+            The frontier to search from (the start of the level if None)
+        """
+        if frontier is None:
+            frontier = self.start()
+        return self.search(frontier, max_ticks)
+
+    def split(self, parts, max_ticks = 100000):
+        """
+        Searches the level from its start until the frontier holds at least
+        a number of states, and returns what was found (as solve does) with
+        the frontier split into that many parts as "frontiers". If the
+        search ends first, "frontiers" is empty and the result is final.
+
+        Parameters
+        ----------
+        parts : int
+            The number of parts to split the frontier into
+        max_ticks : int
+            The number of ticks since the start of the level after which the
+            search is abandoned
+        """
+        result = self.search(self.start(), max_ticks, parts)
+        if result["result"] != "split":
+            result["frontiers"] = []
+            return result
+
+        frontier = result["frontier"]
+        result["frontiers"] = []
+        for indices in np.array_split(np.arange(len(frontier["y"])), parts):
+            part = dict(frontier)
+            part["y"]       = frontier["y"][indices]
+            part["vy"]      = frontier["vy"][indices]
+            part["presses"] = [frontier["presses"][i] for i in indices]
+            result["frontiers"].append(part)
+        del result["frontier"]
+        return result
+
+    def search(self, frontier, max_ticks, parts = None):
+        """
+        Advances a frontier one tick at a time until a state reaches the end
+        of the level, every state has died or max_ticks is reached, and
+        returns what was found (as solve does).
+
+        If parts is given, the search also stops once the frontier holds at
+        least that many states, with "split" as the result and the frontier
+        as "frontier".
+
+        Parameters
+        ----------
+        frontier : dict
+            The frontier to search from
+        max_ticks : int
+            The number of ticks since the start of the level after which the
+            search is abandoned
+        parts : int
+            The number of states at which to stop, or None to not stop
+        """
+        simulation = self.simulation
+        tick     = frontier["tick"]
+        shared   = (frontier["x"], frontier["camera_x"], frontier["frame_pos"])
+        y, vy    = frontier["y"], frontier["vy"]
+        presses  = frontier["presses"]
+
+        # layers[t] holds the index of the state at the tick before that led
+        # to each state at tick t + 1 of the search, and whether the jump key
+        # was held
+        layers = []
+        searched = 0
+        def witness(index):
+            path = Solver.backtrack(layers, index)
+            return presses[path[0]] + path[1]
+
+        while tick < max_ticks:
+            if parts is not None and len(y) >= parts:
+                return {
+                    "result":   "split",
+                    "ticks":    tick,
+                    "frontier": {
+                        "tick":      tick,
+                        "x":         shared[0],
+                        "camera_x":  shared[1],
+                        "frame_pos": shared[2],
+                        "y":         y,
+                        "vy":        vy,
+                        "presses":   [witness(i) for i in range(len(y))],
+                    },
+                    "furthest": self.column(shared[0]),
+                    "states":   searched,
+                }
+
+            # every state is tried without and with the jump key held, as
+            # rows 2i and 2i + 1
+            rows = 2 * len(y)
+            if simulation.count != rows:
+                simulation.resize(rows)
+            simulation.reset()
+            simulation.x[:], simulation.camera_x[:], \
+                    simulation.frame_pos[:] = shared
+            simulation.y[:]  = np.repeat(y, 2)
+            simulation.vy[:] = np.repeat(vy, 2)
+            jumps = np.arange(rows) % 2 == 1
+            dead, finished = simulation.step(jumps)
+            tick += 1
+
+            # holding jump only matters on ticks where the player lands on a
+            # block
+            tried = ~jumps | np.repeat(simulation.grounded[0::2], 2)
+            searched += int(tried.sum())
+            shared = (int(simulation.x[0]), int(simulation.camera_x[0]),
+                    int(simulation.frame_pos[0]))
+
+            finished = np.flatnonzero(tried & finished)
+            if len(finished):
+                row = finished[0]
+                layers.append((np.array([row // 2]), np.array([row % 2 == 1])))
+                return {
+                    "result":   "reachable",
+                    "ticks":    tick,
+                    "witness":  witness(0),
+                    "furthest": self.column(shared[0]),
+                    "states":   searched,
+                }
+
+            alive = np.flatnonzero(tried & ~dead)
+            if len(alive) == 0:
+                column = self.column(shared[0])
+                return {
+                    "result":   "unreachable",
+                    "ticks":    tick,
+                    "columns":  [column],
+                    "furthest": column,
+                    "states":   searched,
+                }
+
+            # merge states with the same height and speed, keeping the first
+            # way of reaching each
+            new_y  = simulation.y[alive]
+            new_vy = simulation.vy[alive]
+            order  = np.lexsort((new_vy, new_y))
+            first  = np.ones(len(order), dtype = bool)
+            first[1:] = ((np.diff(new_y[order]) != 0) |
+                    (np.diff(new_vy[order]) != 0))
+            alive = alive[np.sort(order[first])]
+            layers.append((alive // 2, alive % 2 == 1))
+            y  = simulation.y[alive].copy()
+            vy = simulation.vy[alive].copy()
+
+        return {
+            "result":   "timeout",
+            "ticks":    tick,
+            "furthest": self.column(shared[0]),
+            "states":   searched,
+        }
+
+    def column(self, x):
+        """
+        Returns the column of the level file the player's left side is in.
+
+        Parameters
+        ----------
+        x : int
+            The player's left side, in level coordinates
+        """
+        return x // self.simulation.engine.block_size - self.runway
+
+    @staticmethod
+    def backtrack(layers, index):
+        """
+        Returns the index of the state in the frontier a state in the last
+        layer came from, and the state of the jump key for each tick of the
+        way of playing that led from it.
+
+        Parameters
+        ----------
+        layers : list(tuple(numpy.ndarray, numpy.ndarray))
+            The parent index and jump key state of every state at each tick
+        index : int
+            The index of the state in the last layer
+        """
+        presses = []
+        for parents, jumps in reversed(layers):
+            presses.append(bool(jumps[index]))
+            index = int(parents[index])
+        presses.reverse()
+        return index, presses
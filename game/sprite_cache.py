@@ -0,0 +1,115 @@
+# Title: sprite_cache.py
+# Description: Contains the RotationCache class for Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+
+from collections import OrderedDict
+import pygame
+
+class RotationCache:
+    """
+    A class that keeps rotated copies of an image.
+
+    Angles are rounded to a fixed step, and each rotation is made (and
+    converted to the display's pixel format) the first time it is needed.
+    Caches are shared by key, so every player drawn with the same image
+    reuses the same rotations across attempts and levels.
+
+    ...
+
+    Attributes
+    ----------
+    caches : OrderedDict(key, RotationCache)
+        the shared caches, from least to most recently used
+    max_caches : int
+        the maximum number of shared caches kept
+    image : pygame image surface
+        the unrotated image
+    step : float
+        the angle rotations are rounded to, in degrees
+    capacity : int
+        the maximum number of rotations kept
+    rotations : OrderedDict(int, pygame image surface)
+        the cached rotations, by step number, from least to most recently
+        used
+
+    Methods
+    -------
+    forImage(key, image, step, capacity)
+        Returns the shared cache for an image, creating it if needed
+    get(angle)
+        Returns the image rotated by an angle
+    """
+
+    caches     = OrderedDict()
+    max_caches = 8
+
+    def __init__(self, image, step = 1, capacity = 360):
+        """
+        Parameters
+        ----------
+        image : pygame image surface
+            The unrotated image
+        step : float
+            The angle rotations are rounded to, in degrees
+        capacity : int
+            The maximum number of rotations kept
+        """
+        self.image     = image
+        self.step      = step
+        self.capacity  = capacity
+        self.rotations = OrderedDict()
+
+    @staticmethod
+    def forImage(key, image, step = 1, capacity = 360):
+        """
+        Returns the shared cache for an image, creating it if needed.
+
+        Parameters
+        ----------
+        key : hashable
+            What identifies the image, e.g. its file path and size
+        image : pygame image surface
+            The unrotated image, used if the cache has to be created
+        step : float
+            The angle rotations are rounded to, in degrees
+        capacity : int
+            The maximum number of rotations kept
+        """
+        caches = RotationCache.caches
+        key = (key, step)
+        cache = caches.get(key)
+        if cache is None:
+            cache = RotationCache(image, step, capacity)
+            caches[key] = cache
+            if len(caches) > RotationCache.max_caches:
+                caches.popitem(last = False)
+        else:
+            caches.move_to_end(key)
+        return cache
+
+    def get(self, angle):
+        """
+        Returns the image rotated by an angle.
+
+        The returned surface is shared, so anything changed on it (such as its
+        alpha) should be set again before every use.
+
+        Parameters
+        ----------
+        angle : float
+            The angle to rotate the image counterclockwise, in degrees
+        """
+        index = int(round(angle / self.step)) % int(round(360 / self.step))
+        image = self.rotations.get(index)
+        if image is not None:
+            self.rotations.move_to_end(index)
+            return image
+
+        image = pygame.transform.rotate(self.image, index * self.step)
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        self.rotations[index] = image
+        if len(self.rotations) > self.capacity:
+            self.rotations.popitem(last = False)
+        return image
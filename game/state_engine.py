@@ -4,9 +4,12 @@
 # Date: 06/12/2021
 
 import pygame
-import pygame.freetype
 from enum import Enum
 from game.engine import Engine
+from game.preloader import Preloader
+from game.hud import PerformanceHud
+from game.text_cache import TextCache
+from game.assets import Assets
 
 class State(Enum):
     """
@@ -39,6 +42,18 @@ class StateEngine:
 
     All "magic numbers" and formulas were acquired from manual testing.
 
+    Like the Engine, a state engine can run headless, in which case menus can
+    be driven with synthetic events but nothing can be drawn.
+
+    The levels on the level select menu are prepared in the background as
+    soon as the menu opens, so choosing one does not hold up the game.
+
+    Pressing F3 shows or hides a performance overlay over the gameplay.
+
+    Menus never change while they are shown, so each one is drawn once onto
+    a cached surface and only needs to be presented again when the state
+    changes (see isIdle and needsRedraw).
+
     ...
 
     Attributes
@@ -49,33 +64,66 @@ class StateEngine:
         the height of the display, in pixels
     engine : Engine
         the gameplay engine
+    audio : MixerAudio or NullAudio
+        the backend used to play music (shared with the engine)
+    preloader : Preloader
+        prepares the selectable levels in the background
+    levels : dict(int, str)
+        the file path of the level chosen by each key on the level select
+        menu
     state : State
         the current state
     dt : int
-        the clock's tick rate (fixed to avoid visual problems)
+        the fixed simulation step, in milliseconds. The engine is always
+        updated in steps of this size, however long frames take
+    accumulator : float
+        the time that has passed but not been simulated yet, in milliseconds
+    max_steps : int
+        the most simulation steps run in one frame, so a long stall does not
+        snowball into ever longer frames
+    alpha : float
+        how far the current frame is between the last two simulation steps
+    rewind_seconds : float
+        how far back pressing R after dying takes the player, in seconds
     FONT : pygame freetype font object
-        the font to be rendered as text
+        the font to be rendered as text (None if headless)
+    text_cache : TextCache
+        the rendered menu text (None if headless)
+    hud : PerformanceHud
+        the performance overlay (None if headless)
     background_color : tuple(int)
         the color of the background in RGB format
     font_color : tuple(int)
         the color of the font in RGB format
+    menu_surfaces : dict(State, pygame surface)
+        the pre-drawn surface of each menu
+    dirty : bool
+        whether the screen is out of date with the current state
     
     Methods
     -------
-    update(events)
+    update(events, frame_time)
         Updates the game
+    isIdle()
+        Returns whether the game is waiting on input with nothing to animate
+    needsRedraw()
+        Returns whether the screen needs to be drawn and presented again
     updateMain(events)
         Updates the main menu
     updateLevelSelect(events)
         Updates the level select menu
+    startLevel(filepath)
+        Starts playing a level
     updateCredits(events)
         Updates the credits screen
-    updatePlaying(events)
+    updatePlaying(events, frame_time)
         Updates the gampelay engine
     updatePaused(events)
         Updates the pause screen
     draw(screen)
         Draws the current state onto the screen
+    drawMenu(screen)
+        Draws the current menu onto the screen from its cached surface
     drawMain(screen)
         Draws the main menu onto the screen
     drawLevelSelect(screen)
@@ -93,7 +141,8 @@ class StateEngine:
         Draws the back button onto the screen in the lower left corner
     """
 
-    def __init__(self, width, height, dt):
+    def __init__(self, width, height, dt, headless = False, clock = None,
+            controls = None, audio = None):
         """
         Parameters
         ----------
@@ -102,21 +151,50 @@ class StateEngine:
         height : int
             The height of the display, in pixels
         dt : int
-            The clock's tick rate
+            The fixed simulation step, in milliseconds
+        headless : bool
+            Whether the game should run without a display or mixer
+        clock : SystemClock or SimulatedClock
+            The clock to use, if not the default for the mode
+        controls : KeyboardInput or ScriptedInput
+            The input source to use, if not the default for the mode
+        audio : MixerAudio or NullAudio
+            The audio backend to use, if not the default for the mode
         """
         self.width  = width
         self.height = height
-        self.engine = Engine(width, height)
+        self.engine = Engine(width, height, headless, clock, controls, audio)
+        self.audio  = self.engine.audio
+        self.preloader = Preloader(self.engine)
+        self.levels = {
+            pygame.K_1: "assets/levels/level1.txt",
+            pygame.K_2: "assets/levels/level2.txt",
+            pygame.K_3: "assets/levels/level3.txt",
+            pygame.K_4: "assets/levels/level4.txt",
+            pygame.K_6: "assets/levels/secret.txt",
+        }
         self.state  = State.MAIN
         self.dt     = dt
-        self.FONT   = pygame.freetype.Font(
-            "assets/fonts/momcake/MomcakeBold-WyonA.ttf", 24)
+        self.accumulator = 0.0
+        self.max_steps   = 5
+        self.alpha       = 1.0
+        self.rewind_seconds = 3.0
+        self.FONT   = None
+        self.text_cache = None
+        self.hud    = None
+        if not headless:
+            self.hud = PerformanceHud()
+            self.FONT = Assets.font(
+                "assets/fonts/momcake/MomcakeBold-WyonA.ttf", 24)
+            self.text_cache = TextCache(self.FONT)
         self.background_color = (0, 250, 255)
         self.font_color       = (255, 100, 4)
-        pygame.mixer.music.load("assets/music/menu.mp3")
-        pygame.mixer.music.play()
+        self.menu_surfaces    = {}
+        self.dirty            = True
+        self.audio.loadMusic("assets/music/menu.mp3")
+        self.audio.playMusic()
 
-    def update(self, events):
+    def update(self, events, frame_time = None):
         """
         Updates the game.
 
@@ -124,7 +202,21 @@ class StateEngine:
         ----------
         events : list(pygame events)
             List of pygame events. Used for detecting key presses.
+        frame_time : float
+            The time since the last update, in milliseconds. If None, the
+            engine is updated by exactly one simulation step
         """
+        previous_state = self.state
+        for event in events:
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.dirty = True
+            elif (event.type == pygame.KEYDOWN and event.key == pygame.K_F3
+                    and self.hud is not None):
+                self.hud.toggle()
+                self.dirty = True
+        if self.hud is not None and frame_time is not None:
+            self.hud.record(frame_time)
+
         if self.state   == State.MAIN:
             self.updateMain(events)
         elif self.state == State.LEVEL_SELECT:
@@ -132,9 +224,29 @@ class StateEngine:
         elif self.state == State.CREDITS:
             self.updateCredits(events)
         elif self.state == State.PLAYING:
-            self.updatePlaying(events)
+            self.updatePlaying(events, frame_time)
         elif self.state == State.PAUSED:
             self.updatePaused(events)
+
+        if self.state != previous_state:
+            self.dirty = True
+            if self.state == State.LEVEL_SELECT:
+                self.preloader.preload(self.levels.values())
+
+    def isIdle(self):
+        """
+        Returns whether the game is waiting on input with nothing to animate.
+
+        This is true in every menu, where the main loop can block until the
+        next event instead of running frames.
+        """
+        return self.state != State.PLAYING
+
+    def needsRedraw(self):
+        """
+        Returns whether the screen needs to be drawn and presented again.
+        """
+        return self.dirty or self.state == State.PLAYING
     
     def updateMain(self, events):
         """
@@ -165,28 +277,26 @@ class StateEngine:
         """
         for event in events:
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_1:
-                    self.state = State.PLAYING
-                    self.engine.loadLevel("assets/levels/level1.txt")
-                    self.engine.reset()
-                elif event.key == pygame.K_2:
-                    self.state = State.PLAYING
-                    self.engine.loadLevel("assets/levels/level2.txt")
-                    self.engine.reset()
-                elif event.key == pygame.K_3:
-                    self.state = State.PLAYING
-                    self.engine.loadLevel("assets/levels/level3.txt")
-                    self.engine.reset()
-                elif event.key == pygame.K_4:
-                    self.state = State.PLAYING
-                    self.engine.loadLevel("assets/levels/level4.txt")
-                    self.engine.reset()
-                elif event.key == pygame.K_6:
-                    self.state = State.PLAYING
-                    self.engine.loadLevel("assets/levels/secret.txt")
-                    self.engine.reset()
+                if event.key in self.levels:
+                    self.startLevel(self.levels[event.key])
                 elif event.key == pygame.K_ESCAPE:
                     self.state = State.MAIN
+
+    def startLevel(self, filepath):
+        """
+        Starts playing a level.
+
+        The level is taken from the preloader, which will usually have it
+        ready already.
+
+        Parameters
+        ----------
+        filepath : str
+            The file path of the level
+        """
+        self.state = State.PLAYING
+        self.engine.loadLevel(filepath, self.preloader.take(filepath))
+        self.engine.reset()
     
     def updateCredits(self, events):
         """
@@ -202,14 +312,21 @@ class StateEngine:
                 if event.key == pygame.K_ESCAPE:
                     self.state = State.MAIN
     
-    def updatePlaying(self, events):
+    def updatePlaying(self, events, frame_time = None):
         """
         Updates the gameplay engine.
 
+        The engine is stepped at a fixed rate: the frame's time is added to
+        an accumulator and as many whole steps as fit are run, with the
+        remainder carried over and used to blend the drawn positions.
+
         Parameters
         ----------
         events : list(pygame events)
             List of pygame events. Used for detecting key presses.
+        frame_time : float
+            The time since the last update, in milliseconds. If None, the
+            engine is updated by exactly one simulation step
         """
         for event in events:
             if event.type == pygame.KEYDOWN:
@@ -218,13 +335,30 @@ class StateEngine:
                     # complete screen
                     if self.engine.atLevelCompleteScreen():
                         self.state = State.MAIN
-                        pygame.mixer.music.stop()
-                        pygame.mixer.music.load("assets/music/menu.mp3")
-                        pygame.mixer.music.play()
+                        self.audio.stopMusic()
+                        self.audio.loadMusic("assets/music/menu.mp3")
+                        self.audio.playMusic()
                     else:
                         self.state = State.PAUSED
-                        pygame.mixer.music.pause()
-        self.engine.update(self.dt)
+                        self.audio.pauseMusic()
+                elif event.key == pygame.K_r:
+                    # rewind instead of starting over, if the player has
+                    # just died
+                    if self.engine.rewind(int(self.rewind_seconds * 1000 /
+                            self.dt)):
+                        self.accumulator = 0.0
+        if self.state != State.PLAYING:
+            self.accumulator = 0.0
+            return
+
+        if frame_time is None:
+            frame_time = self.dt
+        self.accumulator = min(self.accumulator + frame_time,
+                self.max_steps * self.dt)
+        while self.accumulator >= self.dt:
+            self.engine.update(self.dt)
+            self.accumulator -= self.dt
+        self.alpha = self.accumulator / self.dt
     
     def updatePaused(self, events):
         """
@@ -239,11 +373,11 @@ class StateEngine:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_1 or event.key == pygame.K_ESCAPE:
                     self.state = State.PLAYING
-                    pygame.mixer.music.unpause()
+                    self.audio.unpauseMusic()
                 elif event.key == pygame.K_2:
                     self.state = State.MAIN
-                    pygame.mixer.music.load("assets/music/menu.mp3")
-                    pygame.mixer.music.play()
+                    self.audio.loadMusic("assets/music/menu.mp3")
+                    self.audio.playMusic()
 
     def draw(self, screen):
         """
@@ -254,16 +388,42 @@ class StateEngine:
         screen : pygame display surface
             The screen to draw onto
         """
-        if self.state   == State.MAIN:
-            self.drawMain(screen)
-        elif self.state == State.CREDITS:
-            self.drawCredits(screen)
-        elif self.state == State.LEVEL_SELECT:
-            self.drawLevelSelect(screen)
-        elif self.state == State.PLAYING:
+        if self.state == State.PLAYING:
             self.drawPlaying(screen)
-        elif self.state == State.PAUSED:
-            self.drawPaused(screen)
+            if self.hud is not None and self.hud.visible:
+                self.hud.draw(screen, self.engine.frame,
+                        self.engine.blocks_tested)
+        else:
+            self.drawMenu(screen)
+        self.dirty = False
+
+    def drawMenu(self, screen):
+        """
+        Draws the current menu onto the screen from its cached surface.
+
+        The menu is drawn onto its surface the first time it is shown.
+
+        Parameters
+        ----------
+        screen : pygame display surface
+            The screen to draw onto
+        """
+        surface = self.menu_surfaces.get(self.state)
+        if surface is None:
+            surface = pygame.Surface(screen.get_size())
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+
+            if self.state   == State.MAIN:
+                self.drawMain(surface)
+            elif self.state == State.CREDITS:
+                self.drawCredits(surface)
+            elif self.state == State.LEVEL_SELECT:
+                self.drawLevelSelect(surface)
+            elif self.state == State.PAUSED:
+                self.drawPaused(surface)
+            self.menu_surfaces[self.state] = surface
+        screen.blit(surface, (0, 0))
     
     def drawMain(self, screen):
         """
@@ -356,7 +516,7 @@ class StateEngine:
             The screen to draw onto
         """
         screen.fill(self.background_color)
-        self.engine.draw(screen)
+        self.engine.draw(screen, self.alpha)
 
     def drawPaused(self, screen):
         """
@@ -392,11 +552,8 @@ class StateEngine:
         underline : bool
             Whether the text should be underlined or not
         """
-        self.FONT.underline = underline
-        text_rect = self.FONT.get_rect(text, size = size)
-        text_rect.center = (self.width / 2, y)
-        self.FONT.render_to(screen, text_rect, text, color, size = size)
-        self.FONT.underline = False
+        self.text_cache.drawCentered(screen, text, color, size,
+                self.width / 2, y, underline)
     
     def drawBackButton(self, screen):
         """
@@ -407,6 +564,5 @@ class StateEngine:
         screen : pygame display surface
             The screen to draw onto
         """
-        text_rect = self.FONT.get_rect("ESC) Back", size = self.width / 40)
-        text_rect.center = (self.width / 10, 9 * self.height / 10)
-        self.FONT.render_to(screen, text_rect, "ESC) Back", self.font_color, size = self.width / 40)
\ No newline at end of file
+        self.text_cache.drawCentered(screen, "ESC) Back", self.font_color,
+                self.width / 40, self.width / 10, 9 * self.height / 10)
\ No newline at end of file
@@ -0,0 +1,243 @@
+# Title: streaming_level.py
+# Description: Contains the StreamingLevel class for Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+
+from collections import deque
+from itertools import islice
+import numpy as np
+from game.blocktype import BlockType
+from game.level import Level
+from game.level_file import LevelFile
+
+class StreamingLevel(Level):
+    """
+    A class representing a level that is read from its text file a chunk of
+    columns at a time. Inherits from Level.
+
+    Very long levels would take a long time and a lot of memory to build in
+    full, so only a window of columns is kept, read from the file as the
+    frame moves along and dropped once the frame has passed them. The arrays
+    hold the blocks of the window only, and the indices returned by
+    columnRange, overlapRange and shapesInColumns index into the window, so
+    a streaming level can be used anywhere a Level is, as long as the
+    indices from each call are used before the next one. Starting again
+    from the beginning (e.g. for a new attempt) reads the file again from its
+    first column.
+
+    ...
+
+    Attributes
+    ----------
+    meta : LevelFile
+        the meta information of the level, with no cells
+    filepath : str
+        the file path of the level text file
+    frame_length : int
+        the length of the gameplay frame, in number of blocks
+    frame_height : float
+        the height of the gameplay frame, in pixels
+    chunk_columns : int
+        the number of columns read from the file at a time
+    max_chunks : int
+        the maximum number of chunks kept in the window
+    read_ahead : int
+        how many columns past the last column asked for should already be
+        read
+    file : file object
+        the open level text file
+    data_start : int
+        the position in the file of the first line of blocks
+    chunks : deque(tuple)
+        the chunks in the window, each holding its first column, the number
+        of blocks in each of its columns, and its x, y, w, h and block_type
+        arrays
+    first_column : int
+        the first column of the window
+    end_column : int
+        the column after the last column of the window
+    finished : bool
+        whether the end of the file has been read
+
+    Methods
+    -------
+    emptyArrays()
+        Returns the arrays of a window with no columns
+    numColumns()
+        Returns the number of columns read so far
+    columnRange(first, last)
+        Returns the range of window indices covering a run of columns,
+        reading columns from the file if needed
+    shapesInColumns(first, last)
+        Returns the window indices of the shapes covering a run of columns,
+        reading columns from the file if needed
+    verticalRange()
+        Returns the highest top side and lowest bottom side any block could
+        have
+    restart()
+        Empties the window and goes back to the start of the file
+    loadChunk()
+        Reads the next chunk of columns from the file into the window
+    close()
+        Closes the level text file
+    """
+
+    def __init__(self, filepath, block_size, frame_length, frame_height,
+            chunk_columns = 512, max_chunks = 3):
+        """
+        Parameters
+        ----------
+        filepath : str
+            The file path of the level text file
+        block_size : int
+            The side-length of each block, in pixels
+        frame_length : int
+            The length of the gameplay frame, in number of blocks
+        frame_height : float
+            The height of the gameplay frame, in pixels
+        chunk_columns : int
+            The number of columns read from the file at a time
+        max_chunks : int
+            The maximum number of chunks kept in the window
+        """
+        self.filepath      = filepath
+        self.frame_length  = frame_length
+        self.frame_height  = frame_height
+        self.chunk_columns = chunk_columns
+        self.max_chunks    = max_chunks
+        self.read_ahead    = chunk_columns // 2
+
+        self.file = open(filepath, 'r')
+        self.meta = LevelFile.parseMeta(
+                [self.file.readline() for _ in range(6)])
+        self.data_start = self.file.tell()
+
+        Level.__init__(self, *StreamingLevel.emptyArrays(), block_size,
+                tuple(self.meta.block_color), tuple(self.meta.spike_color))
+        self.restart()
+
+    @staticmethod
+    def emptyArrays():
+        """
+        Returns the arrays of a window with no columns.
+        """
+        return (np.zeros(0, dtype = np.int32), np.zeros(0, dtype = np.int32),
+                np.zeros(0, dtype = np.int32), np.zeros(0, dtype = np.int32),
+                np.zeros(0, dtype = np.uint8), np.zeros(1, dtype = np.int32))
+
+    def numColumns(self):
+        """
+        Returns the number of columns read so far, which is the number of
+        columns in the level once the whole file has been read.
+        """
+        return self.end_column
+
+    def columnRange(self, first, last):
+        """
+        Returns the range of window indices covering a run of columns,
+        reading columns from the file if needed.
+
+        Parameters
+        ----------
+        first : int
+            The first column of the run
+        last : int
+            The column after the last column of the run
+        """
+        if max(first, 0) < self.first_column:
+            self.restart()
+        while not self.finished and last + self.read_ahead > self.end_column:
+            self.loadChunk()
+        return Level.columnRange(self, first - self.first_column,
+                last - self.first_column)
+
+    def shapesInColumns(self, first, last):
+        """
+        Returns the window indices of the shapes covering a run of columns,
+        in drawing order, reading columns from the file if needed.
+
+        Parameters
+        ----------
+        first : int
+            The first column of the run
+        last : int
+            The column after the last column of the run
+        """
+        self.columnRange(first, last)
+        return Level.shapesInColumns(self, first - self.first_column,
+                last - self.first_column)
+
+    def verticalRange(self):
+        """
+        Returns the highest top side and lowest bottom side any block could
+        have, in pixels.
+
+        Columns that have not been read yet could hold blocks of any height,
+        so there is no limit upwards.
+        """
+        return (np.iinfo(np.int32).min,
+                int(self.frame_height) + self.block_size)
+
+    def restart(self):
+        """
+        Empties the window and goes back to the start of the file.
+        """
+        self.file.seek(self.data_start)
+        self.chunks       = deque()
+        self.first_column = 0
+        self.end_column   = 0
+        self.finished     = False
+        self.loadChunk()
+
+    def loadChunk(self):
+        """
+        Reads the next chunk of columns from the file into the window,
+        dropping the oldest chunk if the window is full.
+        """
+        lines = list(islice(self.file, self.chunk_columns))
+        if len(lines) < self.chunk_columns:
+            self.finished = True
+        runway = self.end_column == 0
+        if not lines and not runway:
+            return
+
+        cell_start, row, cell_type = LevelFile.parseCells(lines)
+        counts = np.diff(cell_start.astype(np.int64))
+        column = self.end_column + np.repeat(np.arange(len(lines)), counts)
+        row = row.astype(np.int64)
+
+        # the first chunk starts with one full frame worth of standard blocks
+        if runway:
+            runway_columns = np.arange(self.frame_length)
+            column = np.concatenate((runway_columns,
+                    column + self.frame_length))
+            row = np.concatenate((np.zeros(self.frame_length,
+                    dtype = np.int64), row))
+            cell_type = np.concatenate((np.full(self.frame_length,
+                    BlockType.BLOCK.value, dtype = np.uint8), cell_type))
+            counts = np.concatenate((np.ones(self.frame_length,
+                    dtype = np.int64), counts))
+
+        x, y, w, h = Level.blockGeometry(column, row, cell_type,
+                self.block_size, self.frame_height)
+        if runway:
+            w[0] = self.block_size
+
+        self.chunks.append((self.end_column, counts, x, y, w, h, cell_type))
+        self.end_column += len(counts)
+        if len(self.chunks) > self.max_chunks:
+            self.chunks.popleft()
+        self.first_column = self.chunks[0][0]
+
+        # rebuild the window's arrays from its chunks
+        arrays = [np.concatenate([chunk[i] for chunk in self.chunks])
+                for i in range(1, 7)]
+        col_start = np.concatenate(([0], np.cumsum(arrays[0])))
+        Level.__init__(self, *arrays[1:], col_start.astype(np.int32),
+                self.block_size, self.block_color, self.spike_color)
+
+    def close(self):
+        """
+        Closes the level text file.
+        """
+        self.file.close()
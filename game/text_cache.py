@@ -0,0 +1,127 @@
+# Title: text_cache.py
+# Description: Contains the TextCache class for Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+
+from collections import OrderedDict
+import pygame
+import pygame.freetype
+from game.profiler import Profiler
+
+class TextCache:
+    """
+    A class that keeps rendered text surfaces.
+
+    Most text on screen (menus, credits, the attempt counter) stays the same
+    for many frames, so each string is rendered once per size and style, and
+    the least recently used strings are dropped once the cache is full.
+
+    Strings are rendered in white and colored afterwards, by multiplying a
+    copy of the white surface by the color, which gives the same pixels as
+    rendering in that color. Each string keeps only its last colored copy,
+    so text that fades through a new color every frame is colored again
+    instead of filling the cache with one entry per color.
+
+    ...
+
+    Attributes
+    ----------
+    font : pygame freetype font object
+        the font the text is rendered with
+    capacity : int
+        the maximum number of rendered strings kept
+    surfaces : OrderedDict(tuple, list)
+        the rendered strings, by text, size and underline, each as the white
+        surface, the last color it was drawn in and the surface in that
+        color, from least to most recently used
+
+    Methods
+    -------
+    render(text, color, size, underline)
+        Returns a rendered string
+    drawCentered(screen, text, color, size, x, y, underline)
+        Draws a string onto the screen, centered on a position
+    """
+
+    def __init__(self, font, capacity = 128):
+        """
+        Parameters
+        ----------
+        font : pygame freetype font object
+            The font the text is rendered with
+        capacity : int
+            The maximum number of rendered strings kept
+        """
+        self.font     = font
+        self.capacity = capacity
+        self.surfaces = OrderedDict()
+
+    def render(self, text, color, size, underline = False):
+        """
+        Returns a rendered string.
+
+        The returned surface is shared and should not be modified.
+
+        Parameters
+        ----------
+        text : str
+            The text to render
+        color : tuple(int)
+            The color of the text, in RGB format
+        size : int
+            The size of the text
+        underline : bool
+            Whether the text should be underlined or not
+        """
+        # the font truncates color components, so colors that differ by a
+        # fraction render the same
+        color = tuple(int(col) for col in color)
+        key = (text, size, underline)
+        entry = self.surfaces.get(key)
+        if entry is not None:
+            self.surfaces.move_to_end(key)
+        else:
+            style = pygame.freetype.STYLE_DEFAULT
+            if underline:
+                style = pygame.freetype.STYLE_UNDERLINE
+            surface, _ = self.font.render(text, (255, 255, 255),
+                    style = style, size = size)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+
+            entry = [surface, (255, 255, 255), surface]
+            self.surfaces[key] = entry
+            if len(self.surfaces) > self.capacity:
+                self.surfaces.popitem(last = False)
+
+        if entry[1] != color:
+            colored = entry[0].copy()
+            colored.fill(color, special_flags = pygame.BLEND_RGB_MULT)
+            entry[1:] = [color, colored]
+        return entry[2]
+
+    def drawCentered(self, screen, text, color, size, x, y,
+            underline = False):
+        """
+        Draws a string onto the screen, centered on a position.
+
+        Parameters
+        ----------
+        screen : pygame display surface
+            The screen to draw onto
+        text : str
+            The text to draw
+        color : tuple(int)
+            The color of the text, in RGB format
+        size : int
+            The size of the text
+        x : int
+            The location of the center of the text on the X axis (in pixels)
+        y : int
+            The location of the center of the text on the Y axis (in pixels)
+        underline : bool
+            Whether the text should be underlined or not
+        """
+        with Profiler.phase("text"):
+            surface = self.render(text, color, size, underline)
+            screen.blit(surface, surface.get_rect(center = (x, y)))
@@ -0,0 +1,320 @@
+# Title: tile_cache.py
+# Description: Contains the TileCache class for Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+
+from collections import OrderedDict
+import numpy as np
+import pygame
+from game.blocktype import BlockType
+
+class TileCache:
+    """
+    A class that keeps pre-rendered chunks of a level's blocks.
+
+    The blocks of a level never change, so instead of drawing every visible
+    block every frame, runs of columns are drawn once onto a chunk surface
+    and the visible chunks are blitted at the camera's position.
+
+    Chunks are kept in a store shared by every tile cache, by level, screen
+    size and chunk, so restarting an attempt or loading the level again does
+    not draw them again. The chunks covering the start of the level are
+    drawn when the cache is made and are kept by the cache for as long as it
+    is in use. While the level is played, the chunks up to a screen ahead of
+    the camera are made ready one step per frame, so no single frame draws
+    and encodes a whole chunk. Once the store is over its size budget, its
+    least recently used chunks are dropped.
+
+    Chunks are blitted with a run-length encoded colorkey. The encoding is
+    made by the first blit onto each surface, costs about as much as drawing
+    the chunk, and replaces the chunk's pixels with its opaque runs, so it
+    is done ahead of time with a one-pixel blit onto the screen, and the
+    store's budget counts the opaque pixels of each chunk.
+
+    ...
+
+    Attributes
+    ----------
+    chunks : OrderedDict(tuple, list)
+        the shared store of chunks, by cache key and chunk index, each as its
+        surface, its estimated size in bytes and whether it has been encoded,
+        from least to most recently used
+    chunk_bytes : int
+        the estimated size of every chunk in the store, in bytes
+    max_bytes : int
+        the size budget of the store, in bytes
+    level : Level
+        the level the chunks are drawn from
+    key : tuple
+        the level and screen size the chunks are stored under
+    chunk_columns : int
+        the number of columns in each chunk
+    chunk_width : int
+        the width of each chunk, in pixels
+    top : int
+        the position of the top side of every chunk on the screen, in pixels
+    chunk_height : int
+        the height of each chunk, in pixels
+    ahead : int
+        the number of chunks past the screen made ready ahead of the camera
+    pinned : dict(int, list)
+        the chunks covering the start of the level, by chunk index, which are
+        kept for as long as the cache is in use
+    colorkey : tuple(int)
+        the color used for the transparent parts of each chunk
+
+    Methods
+    -------
+    draw(screen, camera_x)
+        Draws the blocks visible at a camera position onto the screen
+    prepareAhead(screen, last)
+        Takes one step towards having the chunks ahead of the screen ready
+    encode(screen, entry)
+        Encodes a chunk for blitting onto a screen
+    release()
+        Hands the cache's chunks back to the shared store
+    numChunks()
+        Returns the number of chunks in the level
+    getChunk(index)
+        Returns the entry of a chunk, drawing it if it is not stored
+    drawChunk(index)
+        Draws the blocks of a chunk onto a new surface
+    trim()
+        Drops the least recently used chunks until the store is in budget
+    """
+
+    chunks      = OrderedDict()
+    chunk_bytes = 0
+    max_bytes   = 256 * 1024 * 1024
+
+    def __init__(self, level, screen_width, screen_height, key = None,
+            chunk_columns = 4):
+        """
+        Parameters
+        ----------
+        level : Level
+            The level the chunks are drawn from
+        screen_width : int
+            The width of the screen, in pixels
+        screen_height : int
+            The height of the screen, in pixels
+        key : tuple
+            What identifies the level's blocks (e.g. its file path and hash),
+            or None to not share the chunks with later caches
+        chunk_columns : int
+            The number of columns in each chunk
+        """
+        self.level         = level
+        self.key           = (key if key is not None else object(),
+                              screen_width, screen_height, chunk_columns)
+        self.chunk_columns = chunk_columns
+        self.chunk_width   = chunk_columns * level.block_size
+
+        # chunks only need to cover the part of the screen with blocks on it
+        top, bottom = level.verticalRange()
+        self.top = min(max(top, 0), screen_height)
+        bottom   = min(max(bottom, 0), screen_height)
+        self.chunk_height = max(bottom - self.top, 1)
+
+        colors = [tuple(int(col) for col in level.block_color),
+                  tuple(int(col) for col in level.spike_color)]
+        self.colorkey = next(key for key in
+                [(255, 0, 255), (0, 255, 0), (0, 0, 255)]
+                if key not in colors)
+
+        # the chunks on screen at the start of an attempt, plus the one
+        # coming into view, are ready before the first frame
+        screen_chunks = -(-screen_width // self.chunk_width)
+        self.ahead  = screen_chunks
+        self.pinned = {}
+        screen = pygame.display.get_surface()
+        for index in range(min(screen_chunks + 1, self.numChunks())):
+            entry = TileCache.chunks.pop(self.key + (index,), None)
+            if entry is None:
+                entry = self.drawChunk(index)
+            else:
+                TileCache.chunk_bytes -= entry[1]
+            if screen is not None:
+                self.encode(screen, entry)
+            self.pinned[index] = entry
+
+    def draw(self, screen, camera_x):
+        """
+        Draws the blocks visible at a camera position onto the screen, then
+        takes one step towards having the chunks ahead of it ready.
+
+        Returns the number of chunks drawn.
+
+        Parameters
+        ----------
+        screen : pygame display surface
+            The screen to draw onto
+        camera_x : int
+            The position of the left side of the screen in level
+            coordinates, in pixels
+        """
+        first = max(camera_x // self.chunk_width, 0)
+        last  = (camera_x + screen.get_width()) // self.chunk_width
+        last  = min(last, self.numChunks() - 1)
+        for index in range(first, last + 1):
+            entry = self.getChunk(index)
+            screen.blit(entry[0],
+                    (index * self.chunk_width - camera_x, self.top))
+            entry[2] = True
+        self.prepareAhead(screen, last)
+        return max(last - first + 1, 0)
+
+    def prepareAhead(self, screen, last):
+        """
+        Takes one step towards having the chunks ahead of the screen ready:
+        draws the first of them that is not stored, or otherwise encodes the
+        first of them that is not encoded.
+
+        Parameters
+        ----------
+        screen : pygame display surface
+            The screen the chunks will be blitted onto
+        last : int
+            The index of the last chunk on screen
+        """
+        for index in range(last + 1,
+                min(last + 1 + self.ahead, self.numChunks())):
+            entry = self.pinned.get(index)
+            if entry is None:
+                entry = TileCache.chunks.get(self.key + (index,))
+            if entry is None:
+                self.getChunk(index)
+                return
+            if not entry[2]:
+                self.encode(screen, entry)
+                return
+
+    def encode(self, screen, entry):
+        """
+        Encodes a chunk for blitting onto a screen, by blitting one of its
+        pixels onto the screen and putting back the pixel it covered.
+
+        Parameters
+        ----------
+        screen : pygame display surface
+            The screen the chunk will be blitted onto
+        entry : list
+            The chunk's entry, as returned by getChunk
+        """
+        pixel = screen.get_at((0, 0))
+        screen.blit(entry[0], (0, 0), (0, 0, 1, 1))
+        screen.set_at((0, 0), pixel)
+        entry[2] = True
+
+    def release(self):
+        """
+        Hands the chunks covering the start of the level back to the shared
+        store, for a later cache of the same level and screen size, once
+        this cache is no longer used.
+        """
+        for index, entry in self.pinned.items():
+            TileCache.chunks[self.key + (index,)] = entry
+            TileCache.chunk_bytes += entry[1]
+        self.pinned = {}
+        TileCache.trim()
+
+    def numChunks(self):
+        """
+        Returns the number of chunks in the level.
+        """
+        return (self.level.numColumns() - 1) // self.chunk_columns + 1
+
+    def getChunk(self, index):
+        """
+        Returns the entry of a chunk (its surface, estimated size and whether
+        it has been encoded), drawing it if it is not stored.
+
+        Parameters
+        ----------
+        index : int
+            The index of the chunk
+        """
+        entry = self.pinned.get(index)
+        if entry is not None:
+            return entry
+
+        key = self.key + (index,)
+        entry = TileCache.chunks.get(key)
+        if entry is not None:
+            TileCache.chunks.move_to_end(key)
+            return entry
+
+        entry = self.drawChunk(index)
+        TileCache.chunks[key] = entry
+        TileCache.chunk_bytes += entry[1]
+        TileCache.trim()
+        return entry
+
+    def drawChunk(self, index):
+        """
+        Draws the blocks of a chunk onto a new surface, and returns its entry
+        (as getChunk does), not yet encoded.
+
+        The level's shapes are drawn exactly as Frame.draw draws them, and
+        give the same pixels as drawing every block one at a time.
+
+        Parameters
+        ----------
+        index : int
+            The index of the chunk
+        """
+        # match the display's pixel format so blitting needs no conversion
+        level = self.level
+        screen = pygame.display.get_surface()
+        size = (self.chunk_width, self.chunk_height)
+        if screen is not None:
+            chunk = pygame.Surface(size, 0, screen)
+        else:
+            chunk = pygame.Surface(size)
+        chunk.fill(self.colorkey)
+
+        # start one column early for blocks reaching into this chunk
+        first_column = index * self.chunk_columns
+        shapes = level.shapesInColumns(first_column - 1,
+                first_column + self.chunk_columns)
+        origin_x = index * self.chunk_width
+        for left, top, width, height, block_type in zip(
+                (level.shape_x[shapes] - origin_x).tolist(),
+                (level.shape_y[shapes] - self.top).tolist(),
+                level.shape_w[shapes].tolist(), level.shape_h[shapes].tolist(),
+                level.shape_type[shapes].tolist()):
+            if (block_type == BlockType.SPIKE.value):
+                pygame.draw.polygon(chunk, level.spike_color,
+                        [
+                            [left, top + height],
+                            [left + width // 2, top],
+                            [left + width, top + height]
+                        ])
+            elif (block_type == BlockType.BLOCK.value):
+                pygame.draw.rect(chunk, level.block_color,
+                        (left, top, width, height))
+
+        chunk.set_colorkey(self.colorkey, pygame.RLEACCEL)
+
+        # once encoded, a chunk keeps roughly its opaque pixels plus a little
+        # for each line
+        left   = np.clip(level.shape_x[shapes] - origin_x, 0, self.chunk_width)
+        right  = np.clip(level.shape_x[shapes] + level.shape_w[shapes] -
+                origin_x, 0, self.chunk_width)
+        top    = np.clip(level.shape_y[shapes] - self.top, 0,
+                self.chunk_height)
+        bottom = np.clip(level.shape_y[shapes] + level.shape_h[shapes] -
+                self.top, 0, self.chunk_height)
+        pixels = int(((right - left) * (bottom - top)).sum())
+        size = (pixels + 4 * self.chunk_height) * chunk.get_bytesize()
+        return [chunk, size, False]
+
+    @staticmethod
+    def trim():
+        """
+        Drops the least recently used chunks until the store is within its
+        budget.
+        """
+        chunks = TileCache.chunks
+        while TileCache.chunk_bytes > TileCache.max_bytes and chunks:
+            TileCache.chunk_bytes -= chunks.popitem(last = False)[1][1]
@@ -0,0 +1,325 @@
+# Title: vector_simulation.py
+# Description: Contains the VectorSimulation class for Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+
+import numpy as np
+from game.engine    import Engine
+from game.blocktype import BlockType
+from game.collision import Collision
+from game.backends  import SimulatedClock, ScriptedInput
+
+class VectorSimulation:
+    """
+    A class that runs many attempts at a level at once, in lockstep.
+
+    Each copy of the level is one row of a set of arrays instead of an
+    Engine, and every step advances all of them with a handful of array
+    operations: the player's movement and gravity as in Player.update, the
+    camera and frame as in Frame.update, and collision as in
+    Collision.resolve, so every copy plays out exactly as a Simulation with
+    the same inputs would. Only gameplay is simulated; the player's rotation
+    and the engine's timers, fades and sounds are not.
+
+    A copy stops once its player dies or reaches the end of the level, and
+    stays that way until it is reset. Copies can be reset on their own, so
+    they do not have to be at the same point in the level.
+
+    ...
+
+    Attributes
+    ----------
+    engine : Engine
+        the headless engine the level and its parameters are loaded from
+    level : Level
+        the level every copy plays
+    count : int
+        the number of copies
+    dt : int
+        the simulation step, in milliseconds
+    size : int
+        the width and height of the player, in pixels
+    max_speed : float
+        the player's terminal vertical speed, which is also its jump speed
+    start : tuple(int, int, float)
+        the player's left side, top side and vertical speed at the start of
+        an attempt
+    player_dx : int
+        how far the player moves right each step, in pixels
+    camera_dx : int
+        how far the camera moves right each step, in pixels
+    gravity : float
+        how much the player's vertical speed increases each step
+    x : numpy.ndarray
+        the left side of each copy's player, in level coordinates
+    y : numpy.ndarray
+        the top side of each copy's player, in level coordinates
+    vy : numpy.ndarray
+        the vertical speed of each copy's player
+    camera_x : numpy.ndarray
+        how far each copy has scrolled, in pixels
+    frame_pos : numpy.ndarray
+        the first column of each copy's frame
+    ticks : numpy.ndarray
+        the number of steps taken in each copy's current attempt
+    grounded : numpy.ndarray
+        whether each copy's player landed on a block in the last step
+    dead : numpy.ndarray
+        whether each copy's player has died
+    finished : numpy.ndarray
+        whether each copy's player has reached the end of the level
+
+    Methods
+    -------
+    resize(count)
+        Changes the number of copies
+    reset(mask)
+        Starts a new attempt in some or all of the copies
+    step(jumps)
+        Advances every copy that is still playing by one tick
+    done()
+        Returns which copies have stopped
+    columns()
+        Returns the column of the level each copy's player is in
+    relevantBlocks(active)
+        Returns the indices of the blocks each copy's player could touch
+    resolve(active, jumps)
+        Runs each copy's player against the blocks it could touch
+    """
+
+    def __init__(self, filepath, count, width = 1920, height = 1080, dt = 8):
+        """
+        Parameters
+        ----------
+        filepath : str
+            The file path of the level
+        count : int
+            The number of copies
+        width : int
+            The width of the simulated display, in pixels
+        height : int
+            The height of the simulated display, in pixels
+        dt : int
+            The simulation step, in milliseconds
+        """
+        # copies can be anywhere in the level, so the whole level is loaded
+        # rather than streamed
+        self.engine = Engine(width, height, True, SimulatedClock(),
+                ScriptedInput())
+        self.engine.stream_bytes = float("inf")
+        self.engine.loadLevel(filepath)
+        self.engine.reset()
+
+        player = self.engine.player
+        self.level     = self.engine.level
+        self.dt        = dt
+        self.size      = player.blockrect.width
+        self.max_speed = player.max_speed
+        self.start     = (player.blockrect.x, player.blockrect.y,
+                float(player.speed[1]))
+        self.player_dx = int(player.speed[0] * dt)
+        self.camera_dx = -int(self.engine.camera.speed[0] * dt)
+        self.gravity   = (dt / 3200.0) * self.size
+
+        self.resize(count)
+
+    def resize(self, count):
+        """
+        Changes the number of copies, starting a new attempt in all of them.
+
+        Parameters
+        ----------
+        count : int
+            The number of copies
+        """
+        self.count     = count
+        self.x         = np.empty(count, dtype = np.int64)
+        self.y         = np.empty(count, dtype = np.int64)
+        self.vy        = np.empty(count, dtype = np.float64)
+        self.camera_x  = np.empty(count, dtype = np.int64)
+        self.frame_pos = np.empty(count, dtype = np.int64)
+        self.ticks     = np.empty(count, dtype = np.int64)
+        self.grounded  = np.empty(count, dtype = bool)
+        self.dead      = np.empty(count, dtype = bool)
+        self.finished  = np.empty(count, dtype = bool)
+        self.reset()
+
+    def reset(self, mask = None):
+        """
+        Starts a new attempt in some or all of the copies.
+
+        Parameters
+        ----------
+        mask : numpy.ndarray
+            Which copies to reset, as booleans or indices (all of them if
+            None)
+        """
+        if mask is None:
+            mask = slice(None)
+        self.x[mask], self.y[mask], self.vy[mask] = self.start
+        self.camera_x[mask]  = 0
+        self.frame_pos[mask] = 0
+        self.ticks[mask]     = 0
+        self.grounded[mask]  = False
+        self.dead[mask]      = False
+        self.finished[mask]  = False
+
+    def done(self):
+        """
+        Returns which copies have stopped, because the player died or reached
+        the end of the level.
+        """
+        return self.dead | self.finished
+
+    def columns(self):
+        """
+        Returns the column of the level each copy's player is in.
+        """
+        return self.x // self.engine.block_size
+
+    def step(self, jumps):
+        """
+        Advances every copy that is still playing by one tick.
+
+        Returns which copies died during this tick and which reached the end
+        of the level, as two boolean arrays with one entry per copy.
+
+        Parameters
+        ----------
+        jumps : numpy.ndarray or bool
+            Whether the jump key is held down in each copy during this tick
+        """
+        died    = np.zeros(self.count, dtype = bool)
+        reached = np.zeros(self.count, dtype = bool)
+        active = np.flatnonzero(~self.done())
+        self.grounded[:] = False
+        if len(active) == 0:
+            return died, reached
+        jumps = np.broadcast_to(np.asarray(jumps, dtype = bool),
+                (self.count,))[active]
+
+        # move the player, then apply gravity (Player.update)
+        vy = self.vy[active]
+        self.x[active] += self.player_dx
+        self.y[active] += np.trunc(vy * self.dt).astype(np.int64)
+        self.vy[active] = np.where(vy < self.max_speed, vy + self.gravity, vy)
+
+        # scroll the camera, and shift the frame over once its leftmost
+        # column is out of view (Frame.update)
+        level = self.level
+        self.camera_x[active] += self.camera_dx
+        if level.numBlocks() > 0:
+            pos = np.clip(self.frame_pos[active], 0, level.numColumns())
+            first = np.minimum(level.col_start[pos], level.numBlocks() - 1)
+            self.frame_pos[active] += (level.x[first] + level.w[first] <=
+                    self.camera_x[active])
+
+        grounded, on_spike, collided, ended = self.resolve(active, jumps)
+        died[active]    = on_spike | collided
+        reached[active] = ended & ~(on_spike | collided)
+        self.grounded[active] = grounded
+        self.dead[active]     = died[active]
+        self.finished[active] = reached[active]
+        self.ticks[active]   += 1
+        return died, reached
+
+    def relevantBlocks(self, active):
+        """
+        Returns the indices of the blocks each copy's player could touch (as
+        Frame.getRelevantBlocks), as one row per copy padded with the last
+        block, and which entries of each row are real.
+
+        Parameters
+        ----------
+        active : numpy.ndarray
+            The indices of the copies
+        """
+        level = self.level
+        block_size = level.block_size
+        left  = self.x[active]
+        right = left + self.size
+
+        # the same columns as Level.overlapRange
+        num_columns = level.numColumns()
+        first = np.clip(-((block_size + level.overhang - left) // block_size),
+                0, num_columns)
+        last  = np.clip(right // block_size + 1, first, num_columns)
+        start = level.col_start[first].astype(np.int64)
+        end   = level.col_start[last].astype(np.int64)
+
+        width = int((end - start).max()) if len(active) else 0
+        indices = start[:, None] + np.arange(width)
+        valid = indices < end[:, None]
+        return np.minimum(indices, max(level.numBlocks() - 1, 0)), valid
+
+    def resolve(self, active, jumps):
+        """
+        Runs each copy's player against the blocks it could touch, as
+        Collision.resolve does for one player, and returns whether each
+        landed on a block, landed on a spike, collided with a block or spike,
+        and collided with an end block.
+
+        Blocks are handled in order. Each round finds the first block every
+        copy lands on, snaps those players on top of it (jumping if
+        requested), and tests the rest of their blocks again in the next
+        round, so there are only as many rounds as the most landings any one
+        copy makes.
+
+        Parameters
+        ----------
+        active : numpy.ndarray
+            The indices of the copies
+        jumps : numpy.ndarray
+            Whether each copy's player should jump after landing on a block
+        """
+        count = len(active)
+        grounded = np.zeros(count, dtype = bool)
+        on_spike = np.zeros(count, dtype = bool)
+        collided = np.zeros(count, dtype = bool)
+        ended    = np.zeros(count, dtype = bool)
+
+        indices, pending = self.relevantBlocks(active)
+        if indices.shape[1] == 0:
+            return grounded, on_spike, collided, ended
+        level = self.level
+        x = level.x[indices]
+        y = level.y[indices]
+        w = level.w[indices]
+        h = level.h[indices]
+        block_type = level.block_type[indices]
+        is_block = block_type == BlockType.BLOCK.value
+        is_spike = block_type == BlockType.SPIKE.value
+        is_end   = block_type == BlockType.END.value
+        position = np.arange(indices.shape[1])
+
+        left  = self.x[active][:, None]
+        right = left + self.size
+        while True:
+            top = self.y[active]
+            bottom = (top + self.size)[:, None]
+            rising = (self.vy[active] < 0)[:, None]
+            on_top = pending & Collision.isOnTop(bottom, left, right, rising,
+                    x, y, w, h, block_type)
+            collision = pending & ~on_top & Collision.isCollision(bottom,
+                    left, right, x, y, w, h)
+
+            # only the blocks before each copy's first landing count this
+            # round, as landing moves the player
+            landed = on_top & is_block
+            lands = landed.any(axis = 1)
+            stop = np.where(lands, landed.argmax(axis = 1), len(position))
+            before = position < stop[:, None]
+            on_spike |= (on_top & before & is_spike).any(axis = 1)
+            collided |= (collision & before & ~is_end).any(axis = 1)
+            ended    |= (collision & before & is_end).any(axis = 1)
+            if not lands.any():
+                break
+
+            rows = np.flatnonzero(lands)
+            copies = active[rows]
+            grounded[rows] = True
+            self.y[copies] = y[rows, stop[rows]] - self.size
+            self.vy[copies] = np.where(jumps[rows], -self.max_speed, 0.0)
+            pending &= position > stop[:, None]
+
+        return grounded, on_spike, collided, ended
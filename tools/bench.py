@@ -0,0 +1,307 @@
+# Title: bench.py
+# Description: Benchmarks the engine of Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+#
+# Usage (from the repository root):
+#     python -m tools.bench [--out results.json] [--baseline old.json]
+#     python -m tools.bench --smoke
+#
+# Measures Engine.loadLevel, Engine.reset, Frame.update, Engine.update and
+# Engine.draw on the bundled levels and on generated levels, rendering to an
+# offscreen surface under SDL's dummy drivers. Results can be saved to JSON
+# and compared against a stored baseline. --smoke instead runs each bundled
+# level once past its end, to check the benchmark works on all of them.
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pygame
+
+from game.engine   import Engine
+from game.frame    import Frame
+from game.camera   import Camera
+from game.backends import SimulatedClock, ScriptedInput, NullAudio
+
+LEVELS = ["assets/levels/level1.txt", "assets/levels/level2.txt",
+          "assets/levels/level3.txt", "assets/levels/level4.txt",
+          "assets/levels/secret.txt"]
+
+GENERATED_SIZES = [10000, 100000, 1000000]
+
+def generateLevel(directory, columns, seed = 0):
+    """
+    Writes a generated level and returns its file path.
+
+    The level is a flat floor with stacks of blocks overhead, out of the
+    player's reach, so an attempt never ends and every tick draws and tests a
+    realistic number of blocks.
+
+    Parameters
+    ----------
+    directory : str
+        The directory to write the level to
+    columns : int
+        The number of columns in the level
+    seed : int
+        The seed for the random layout
+    """
+    rnd = random.Random(seed)
+    with open("assets/levels/level1.txt") as f:
+        meta = f.readlines()[:6]
+
+    filepath = os.path.join(directory, "generated%d.txt" % columns)
+    with open(filepath, "w") as f:
+        f.writelines(meta)
+        for _ in range(columns):
+            height = rnd.choice((0, 0, 2, 4, 6))
+            f.write("O" + " " * 6 + "O" * height + "\n")
+    return filepath
+
+def summarize(samples):
+    """
+    Returns latency statistics, in microseconds, for a list of durations in
+    seconds.
+
+    Parameters
+    ----------
+    samples : list(float)
+        The measured durations, in seconds
+    """
+    micros = np.array(samples) * 1e6
+    return {
+        "n":    len(samples),
+        "mean": float(micros.mean()),
+        "p50":  float(np.percentile(micros, 50)),
+        "p90":  float(np.percentile(micros, 90)),
+        "p99":  float(np.percentile(micros, 99)),
+        "max":  float(micros.max()),
+    }
+
+def timed(function, repeat):
+    """
+    Calls a function repeatedly and returns the duration of each call.
+
+    Parameters
+    ----------
+    function : callable
+        The function to call
+    repeat : int
+        The number of calls
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+def benchLevel(filepath, width, height, ticks, loads, resets, seed):
+    """
+    Benchmarks every operation on one level and returns the results.
+
+    Parameters
+    ----------
+    filepath : str
+        The file path of the level
+    width : int
+        The width of the offscreen display, in pixels
+    height : int
+        The height of the offscreen display, in pixels
+    ticks : int
+        The number of ticks to measure for the per-tick operations (enough
+        to scroll past the end of the level if None)
+    loads : int
+        The number of times to load the level
+    resets : int
+        The number of times to reset the level
+    seed : int
+        The seed for the random jump inputs
+    """
+    dt       = 8
+    clock    = SimulatedClock()
+    rnd      = random.Random(seed)
+    controls = ScriptedInput(rnd.random() < 0.05 for _ in iter(int, 1))
+    engine   = Engine(width, height, False, clock, controls, NullAudio())
+    screen   = pygame.Surface((width, height))
+    results  = {}
+
+    # memory: peak while loading, and what the loaded level keeps alive
+    gc.collect()
+    tracemalloc.start()
+    engine.loadLevel(filepath)
+    load_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    level = engine.level
+    results["memory"] = {
+        "load_peak_bytes": load_peak,
+        "level_bytes":     int(level.nbytes()),
+        "columns":         int(level.numColumns()),
+        "blocks":          int(level.numBlocks()),
+    }
+
+    results["loadLevel"] = summarize(timed(
+        lambda: engine.loadLevel(filepath), loads))
+    results["reset"] = summarize(timed(engine.reset, resets))
+
+    if ticks is None:
+        scroll = -int(engine.camera.speed[0] * dt)
+        ticks = int(level.x[-1] + level.w[-1]) // scroll + 1
+
+    # the per-tick loops start the level over once they reach its end, so
+    # any number of ticks can be measured on any level
+    engine.reset()
+    frames = [None]
+    def frameUpdate():
+        frame = frames[0]
+        if frame is None or frame.pos + frame.length >= level.numColumns():
+            frame = frames[0] = Frame(level, engine.frame_length,
+                                      Camera(engine.block_speed))
+        frame.update(dt)
+    results["Frame.update"] = summarize(timed(frameUpdate, ticks))
+
+    def step():
+        if engine.end_time != -1:
+            engine.reset()
+        clock.advance(dt)
+        engine.update(dt)
+    engine.reset()
+    results["update"] = summarize(timed(step, ticks))
+
+    engine.reset()
+    draws = []
+    for _ in range(ticks):
+        step()
+        start = time.perf_counter()
+        engine.draw(screen)
+        draws.append(time.perf_counter() - start)
+    results["draw"] = summarize(draws)
+    return results
+
+def compare(results, baseline, threshold):
+    """
+    Prints how the results compare with a baseline and returns whether any
+    operation got slower than the threshold allows.
+
+    Parameters
+    ----------
+    results : dict
+        The current results
+    baseline : dict
+        The baseline results
+    threshold : float
+        The p50 ratio above which an operation counts as a regression
+    """
+    regressed = False
+    print("\n%-28s %-14s %12s %12s %8s" %
+          ("level", "operation", "base p50", "p50", "ratio"))
+    for name, ops in results["levels"].items():
+        base_ops = baseline.get("levels", {}).get(name)
+        if base_ops is None:
+            continue
+        for op, stats in ops.items():
+            if op == "memory" or op not in base_ops:
+                continue
+            ratio = stats["p50"] / max(base_ops[op]["p50"], 1e-9)
+            flag = ""
+            if ratio > threshold:
+                flag = "  REGRESSION"
+                regressed = True
+            print("%-28s %-14s %10.1fus %10.1fus %7.2fx%s" % (name, op,
+                  base_ops[op]["p50"], stats["p50"], ratio, flag))
+    return regressed
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(
+        description = "Benchmark the Super Square Boy 2 engine.")
+    parser.add_argument("--width", type = int, default = 1920)
+    parser.add_argument("--height", type = int, default = 1080)
+    parser.add_argument("--ticks", type = int, default = 2000,
+        help = "ticks measured for Frame.update, update and draw")
+    parser.add_argument("--loads", type = int, default = 5)
+    parser.add_argument("--resets", type = int, default = 200)
+    parser.add_argument("--sizes", type = int, nargs = "*",
+        default = GENERATED_SIZES, help = "columns of the generated levels")
+    parser.add_argument("--levels", nargs = "*", default = LEVELS)
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--out", help = "write the results to this JSON file")
+    parser.add_argument("--baseline", help = "compare with this JSON file")
+    parser.add_argument("--threshold", type = float, default = 1.2,
+        help = "p50 ratio that counts as a regression")
+    parser.add_argument("--smoke", action = "store_true",
+        help = "only check that every operation runs: play each bundled "
+               "level past its end, with one load and reset")
+    args = parser.parse_args(argv)
+    if args.smoke:
+        args.ticks  = None
+        args.loads  = 1
+        args.resets = 1
+        args.sizes  = []
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    results = {
+        "meta": {
+            "python":  platform.python_version(),
+            "pygame":  pygame.version.ver,
+            "numpy":   np.__version__,
+            "machine": platform.machine(),
+            "width":   args.width,
+            "height":  args.height,
+            "ticks":   args.ticks,
+            "time":    time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "levels": {},
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        levels = list(args.levels)
+        for columns in args.sizes:
+            levels.append(generateLevel(directory, columns, args.seed))
+
+        for filepath in levels:
+            name = os.path.basename(filepath)
+            print("benchmarking %s..." % name, file = sys.stderr)
+            results["levels"][name] = benchLevel(filepath, args.width,
+                args.height, args.ticks, args.loads, args.resets, args.seed)
+
+    print("%-28s %-14s %10s %10s %10s %10s" %
+          ("level", "operation", "p50", "p90", "p99", "max"))
+    for name, ops in results["levels"].items():
+        for op, stats in ops.items():
+            if op == "memory":
+                continue
+            print("%-28s %-14s %8.1fus %8.1fus %8.1fus %8.1fus" % (name, op,
+                  stats["p50"], stats["p90"], stats["p99"], stats["max"]))
+        memory = ops["memory"]
+        print("%-28s %-14s %d blocks, level %.1f KiB, load peak %.1f KiB" %
+              (name, "memory", memory["blocks"], memory["level_bytes"] / 1024,
+               memory["load_peak_bytes"] / 1024))
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent = 2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+# Title: compile_levels.py
+# Description: Compiles the level files of Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+#
+# Usage (from the repository root):
+#     python -m tools.compile_levels [--force] [levels ...]
+#
+# Compiles level text files (by default every file in assets/levels) to the
+# binary format loaded by the engine. The engine compiles levels by itself
+# when they are first loaded, so this is only needed to do the work ahead of
+# time, e.g. before packaging the game.
+
+import argparse
+import glob
+import os
+import sys
+
+from game.level_file import LevelFile
+
+def compileLevel(source_path, force = False):
+    """
+    Compiles a level text file if its compiled file is missing or out of
+    date, and returns whether it was compiled.
+
+    Parameters
+    ----------
+    source_path : str
+        The file path of the level text file
+    force : bool
+        Whether to compile the level even if it is up to date
+    """
+    stat = LevelFile.sourceStat(source_path)
+    with open(source_path, 'rb') as f:
+        data = f.read()
+    path = LevelFile.compiledPath(source_path)
+    recorded = LevelFile.readSource(path)
+    if (not force and recorded is not None and
+            recorded[0] == LevelFile.sourceHash(data)):
+        return False
+    level_file = LevelFile.compile(data)
+    level_file.source_stat = stat
+    level_file.save(path)
+    return True
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(
+        description = "Compile Super Square Boy 2 level files.")
+    parser.add_argument("levels", nargs = "*",
+        default = sorted(glob.glob("assets/levels/*.txt")),
+        help = "the level text files to compile")
+    parser.add_argument("--force", action = "store_true",
+        help = "compile levels even if they are up to date")
+    args = parser.parse_args(argv)
+
+    for source_path in args.levels:
+        compiled = compileLevel(source_path, args.force)
+        path = LevelFile.compiledPath(source_path)
+        print("%-32s %-10s %8d -> %8d bytes" % (source_path,
+                "compiled" if compiled else "up to date",
+                os.path.getsize(source_path), os.path.getsize(path)))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+# Title: replay.py
+# Description: Replays recorded attempts of Super Square Boy 2.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+#
+# Usage (from the repository root):
+#     python -m tools.replay recordings/*.ssbr [--level path]
+#
+# Plays recorded attempts (see app.py --record) back through a headless
+# engine as fast as the CPU allows, and checks that each one ends the same
+# way, on the same tick, as when it was recorded. Exits with status 1 if any
+# attempt plays out differently, so recordings can be used as regression
+# checks for changes to physics and collision.
+
+import os
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import sys
+import time
+
+from game.level_file import LevelFile
+from game.recording  import Recording
+from game.simulation import Simulation
+
+def replay(recording, level_path = None):
+    """
+    Plays a recorded attempt back through a headless engine, and returns how
+    it ended and the number of ticks it lasted (as Simulation.run does).
+
+    Raises a ValueError if the level file is not the one the attempt was
+    recorded on.
+
+    Parameters
+    ----------
+    recording : Recording
+        The recorded attempt
+    level_path : str
+        The file path of the level, if not the one stored in the recording
+    """
+    level_path = level_path or recording.level_path
+    if (recording.level_hash is not None and
+            LevelFile.hashFile(level_path) != recording.level_hash):
+        raise ValueError("%s has changed since the attempt was recorded" %
+                level_path)
+
+    simulation = Simulation(level_path, recording.width, recording.height,
+            recording.dt)
+    return simulation.run(recording.presses, max_ticks = recording.ticks())
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(
+        description = "Replay recorded Super Square Boy 2 attempts.")
+    parser.add_argument("recordings", nargs = "+",
+        help = "the recording files to replay")
+    parser.add_argument("--level",
+        help = "the level file to replay on, if not the recorded path")
+    args = parser.parse_args(argv)
+
+    mismatches = 0
+    for path in args.recordings:
+        recording = Recording.load(path)
+        expected = (recording.outcome or "timeout", recording.ticks())
+        start = time.perf_counter()
+        try:
+            result = replay(recording, args.level)
+        except (OSError, ValueError) as error:
+            print("%-40s error: %s" % (path, error))
+            mismatches += 1
+            continue
+        elapsed = time.perf_counter() - start
+
+        matches = result == expected
+        mismatches += not matches
+        print("%-40s %-8s %7d ticks  %-8s %9.0f ticks/s" % (path, result[0],
+                result[1], "ok" if matches else "MISMATCH (recorded %s at %d)"
+                % expected, result[1] / max(elapsed, 1e-9)))
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
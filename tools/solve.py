@@ -0,0 +1,225 @@
+# Title: solve.py
+# Description: Checks that levels of Super Square Boy 2 can be completed.
+# Author: Alexander Marcozzi
+# Date: 10/18/2026
+#
+# Usage (from the repository root):
+#     python -m tools.solve [levels ...] [--workers N] [--witness DIR]
+#
+# Searches every way of playing each level with the game's physics (see
+# game/solver.py) and reports whether the end can be reached. Levels are
+# searched in parallel, and workers left over once every level has one search
+# parts of a level's frontier (see Solver.split). For a level that can be
+# completed, --witness saves a way of completing it as a recording that
+# tools.replay can play back. For one that cannot, the columns where every
+# way of playing dies are reported. Exits with status 1 if any level cannot
+# be completed.
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from game.level_file import LevelFile
+from game.recording  import Recording
+from game.solver     import Solver
+
+LEVELS = ["assets/levels/level1.txt", "assets/levels/level2.txt",
+          "assets/levels/level3.txt", "assets/levels/level4.txt",
+          "assets/levels/secret.txt"]
+
+def split(level_path, parts, width = 1920, height = 1080, dt = 8,
+        max_ticks = 100000):
+    """
+    Searches a level until it can be split into parts and returns what was
+    found (as Solver.split does), with the time the search took added as
+    "seconds".
+
+    Parameters
+    ----------
+    level_path : str
+        The file path of the level
+    parts : int
+        The number of parts to split the level's search into
+    width : int
+        The width of the simulated display, in pixels
+    height : int
+        The height of the simulated display, in pixels
+    dt : int
+        The simulation step, in milliseconds
+    max_ticks : int
+        The number of ticks after which the search is abandoned
+    """
+    start = time.perf_counter()
+    result = Solver(level_path, width, height, dt).split(parts, max_ticks)
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+def solve(level_path, width = 1920, height = 1080, dt = 8,
+        max_ticks = 100000, frontier = None):
+    """
+    Searches a level, or one part of it, and returns what was found (as
+    Solver.solve does), with the time the search took added as "seconds".
+
+    Parameters
+    ----------
+    level_path : str
+        The file path of the level
+    width : int
+        The width of the simulated display, in pixels
+    height : int
+        The height of the simulated display, in pixels
+    dt : int
+        The simulation step, in milliseconds
+    max_ticks : int
+        The number of ticks after which the search is abandoned
+    frontier : dict
+        The part of the level's search to search (all of it if None)
+    """
+    start = time.perf_counter()
+    result = Solver(level_path, width, height, dt).solve(max_ticks, frontier)
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+def combine(result, parts):
+    """
+    Combines what was found by splitting a level's search with what was found
+    by searching each part, into what searching the whole level would find.
+
+    A level can be completed if any part reaches the end, and cannot if every
+    part dies, in which case the last parts to die give the columns. The
+    seconds and states of every search are added together.
+
+    Parameters
+    ----------
+    result : dict
+        What splitting the level's search found
+    parts : list(dict)
+        What searching each part found
+    """
+    if not parts:
+        return result
+    states  = result["states"] + sum(part["states"] for part in parts)
+    seconds = result["seconds"] + sum(part["seconds"] for part in parts)
+    furthest = max(part["furthest"] for part in parts)
+
+    for part in parts:
+        if part["result"] == "reachable":
+            combined = dict(part)
+            break
+    else:
+        timeouts = [part for part in parts if part["result"] == "timeout"]
+        if timeouts:
+            combined = dict(timeouts[0])
+        else:
+            ticks = max(part["ticks"] for part in parts)
+            combined = {
+                "result":  "unreachable",
+                "ticks":   ticks,
+                "columns": sorted(set(column for part in parts
+                        if part["ticks"] == ticks
+                        for column in part["columns"])),
+            }
+    combined["furthest"] = furthest
+    combined["states"]   = states
+    combined["seconds"]  = seconds
+    return combined
+
+def saveWitness(level_path, result, directory, width, height, dt):
+    """
+    Saves a way of completing a level as a recording, and returns its file
+    path.
+
+    Parameters
+    ----------
+    level_path : str
+        The file path of the level
+    result : dict
+        What the search of the level found
+    directory : str
+        The directory to save the recording to
+    width : int
+        The width of the simulated display, in pixels
+    height : int
+        The height of the simulated display, in pixels
+    dt : int
+        The simulation step, in milliseconds
+    """
+    recording = Recording(level_path, LevelFile.hashFile(level_path), width,
+            height, dt)
+    for jump in result["witness"]:
+        recording.record(jump)
+    recording.finish("finished")
+
+    name = os.path.splitext(os.path.basename(level_path))[0]
+    os.makedirs(directory, exist_ok = True)
+    path = os.path.join(directory, "%s-solution.ssbr" % name)
+    recording.save(path)
+    return path
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(
+        description = "Check that Super Square Boy 2 levels can be completed.")
+    parser.add_argument("levels", nargs = "*", default = LEVELS,
+        help = "the level files to check (default: the bundled levels)")
+    parser.add_argument("--workers", type = int, default = os.cpu_count(),
+        help = "the number of processes searching at once")
+    parser.add_argument("--witness", metavar = "DIR",
+        help = "save a way of completing each level to DIR as a recording")
+    parser.add_argument("--width", type = int, default = 1920)
+    parser.add_argument("--height", type = int, default = 1080)
+    parser.add_argument("--dt", type = int, default = 8)
+    parser.add_argument("--max-ticks", type = int, default = 100000)
+    args = parser.parse_args(argv)
+
+    # workers left over once every level has one are shared out between the
+    # levels, each searching part of a level's frontier
+    parts = max(1, args.workers // len(args.levels))
+
+    failures = 0
+    with ProcessPoolExecutor(max_workers = args.workers) as pool:
+        splits = [pool.submit(split, path, parts, args.width, args.height,
+                args.dt, args.max_ticks) for path in args.levels]
+        searches = []
+        for path, future in zip(args.levels, splits):
+            result = future.result()
+            searches.append((result, [pool.submit(solve, path, args.width,
+                    args.height, args.dt, args.max_ticks, frontier)
+                    for frontier in result.pop("frontiers")]))
+
+        for path, (result, futures) in zip(args.levels, searches):
+            # once one part reaches the end, the rest are not needed
+            found = []
+            for future in futures:
+                found.append(future.result())
+                if found[-1]["result"] == "reachable":
+                    for other in futures:
+                        other.cancel()
+                    break
+            result = combine(result, found)
+            summary = "%-30s %-11s %7d ticks %9d states %7.1f s" % (path,
+                    result["result"], result["ticks"], result["states"],
+                    result["seconds"])
+            if result["result"] == "reachable":
+                print("%s  %d jumps" % (summary, sum(result["witness"])))
+                if args.witness:
+                    print("    saved %s" % saveWitness(path, result,
+                            args.witness, args.width, args.height, args.dt))
+            elif result["result"] == "unreachable":
+                failures += 1
+                print("%s  every way of playing dies by column %d, in "
+                        "columns %s" % (summary, result["furthest"],
+                        ", ".join(map(str, result["columns"]))))
+            else:
+                failures += 1
+                print("%s  gave up at column %d" % (summary,
+                        result["furthest"]))
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())